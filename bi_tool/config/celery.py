@@ -20,6 +20,12 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Auto-discover tasks from all registered Django apps
 app.autodiscover_tasks()
 
+# Keep broker connections alive between publishes so grouped task sends
+# reuse one connection instead of reconnecting
+app.conf.broker_transport_options = {
+    'socket_keepalive': True,
+}
+
 # Task routing configuration
 app.conf.task_routes = {
     'etl.tasks.*': {'queue': 'etl'},
@@ -41,6 +47,18 @@ app.conf.beat_schedule = {
         'task': 'dq.tasks.run_dq_health_check',
         'schedule': 300.0,  # Run every 5 minutes
     },
+    'refresh-etl-run-stats': {
+        'task': 'etl.tasks.refresh_etl_run_stats',
+        'schedule': 300.0,  # Run every 5 minutes
+    },
+    'evaluate-ingest-error-rates': {
+        'task': 'etl.tasks.evaluate_ingest_error_rates',
+        'schedule': 300.0,  # Run every 5 minutes
+    },
+    'maintain-audit-log-partitions': {
+        'task': 'etl.tasks.maintain_audit_log_partitions',
+        'schedule': 86400.0,  # Run daily
+    },
 }
 
 @app.task(bind=True)
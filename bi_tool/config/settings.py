@@ -29,6 +29,9 @@ INSTALLED_APPS = [
     # Third-party apps
     'rest_framework',
     'corsheaders',
+    
+    # Local apps
+    'etl',
 ]
 
 MIDDLEWARE = [
@@ -67,9 +70,32 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Keep connections open across requests and Celery tasks; ETL runs
+        # issue many short transactions and would otherwise reconnect for each
+        'CONN_MAX_AGE': None,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Redis (optional); enables the shared cache and ETL ingest Bloom filters
+REDIS_URL = os.environ.get('REDIS_URL')
+
+# Cache; ETL alert deduplication relies on atomic cache.add, shared across
+# workers when REDIS_URL is set
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -2,7 +2,7 @@
 Simple URL configuration for bi_tool project.
 """
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
@@ -121,4 +121,7 @@ urlpatterns = [
     path('api/auth/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('api/auth/profile/', profile_view, name='profile'),
     path('api/auth/logout/', logout_view, name='logout'),
+    
+    # ETL monitoring endpoints
+    path('api/etl/', include('etl.urls')),
 ]
\ No newline at end of file
@@ -3,6 +3,7 @@ Django Admin Configuration for Data Quality Models
 Provides admin interface for managing DQ rules, runs, violations, and configurations.
 """
 
+from celery import group
 from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
@@ -134,11 +135,11 @@ class DQRuleAdmin(admin.ModelAdmin):
     
     def execute_rules(self, request, queryset):
         """Execute selected rules."""
-        for rule in queryset.filter(enabled=True):
-            execute_dq_check.delay(rule.id)
+        rule_ids = list(queryset.filter(enabled=True).values_list('id', flat=True))
+        # One group publishes every check over a single producer connection
+        group(execute_dq_check.s(rule_id) for rule_id in rule_ids).apply_async()
         
-        enabled_count = queryset.filter(enabled=True).count()
-        self.message_user(request, f'Queued {enabled_count} rules for execution.')
+        self.message_user(request, f'Queued {len(rule_ids)} rules for execution.')
     execute_rules.short_description = "Execute selected rules"
 
 
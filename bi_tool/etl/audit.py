@@ -0,0 +1,220 @@
+"""
+Buffered AuditLog writer
+
+Audit events are queued in-process and written by a background thread in
+batches, using COPY on PostgreSQL and multi-row INSERTs elsewhere, so ETL
+steps never wait on an audit INSERT round-trip.
+"""
+
+import atexit
+import io
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List
+
+import orjson
+from celery.signals import worker_process_shutdown
+from django.db import InterfaceError, OperationalError, connection, models
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Failed writes are retried with exponential backoff up to this many seconds apart
+MAX_RETRY_BACKOFF = 30.0
+
+
+class AuditLogBuffer:
+    """
+    Bounded in-process queue of audit events drained by a background thread.
+    
+    The drainer writes whenever ``max_rows`` events are pending or
+    ``flush_interval`` seconds have passed since the first pending event.
+    A batch is acknowledged only once written: writes failing on the
+    connection are retried with backoff (falling back to plain INSERTs after
+    ``max_retries`` COPY attempts) until they succeed, and only given up on
+    at shutdown. Rows the database rejects are dropped, without holding up
+    the rest of their batch.
+    """
+    
+    def __init__(self, max_rows: int = 1000, flush_interval: float = 1.0, max_pending: int = 100_000,
+                 put_timeout: float = 30.0, max_retries: int = 3, retry_backoff: float = 0.5):
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+    
+    def emit(self, event_type: str, message: str, **fields) -> None:
+        """
+        Queue an audit event.
+        
+        Args:
+            event_type: AuditLog event type
+            message: Human readable description
+            **fields: Any other AuditLog field (job, run, user_id, details, ...)
+        
+        Raises:
+            queue.Full: If max_pending events are still unwritten after
+                put_timeout seconds, e.g. while the database is down
+        """
+        now = timezone.now()
+        fields.setdefault('details', {})
+        self._ensure_started()
+        # Blocks when max_pending events are queued, applying backpressure to the caller
+        self._queue.put({
+            'event_type': event_type,
+            'message': message,
+            'created_at': now,
+            'updated_at': now,
+            **fields,
+        }, timeout=self.put_timeout)
+    
+    def flush(self) -> None:
+        """Block until every queued event has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+    
+    def close(self) -> None:
+        """Write the remaining events and stop the drainer thread."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+        self._stopping.clear()
+    
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._drain, name='audit-log-writer', daemon=True)
+                self._thread.start()
+    
+    def _drain(self) -> None:
+        try:
+            while not (self._stopping.is_set() and self._queue.empty()):
+                batch = self._collect()
+                if not batch:
+                    continue
+                self._write_with_retry(batch)
+                for _ in batch:
+                    self._queue.task_done()
+        finally:
+            connection.close()
+    
+    def _write_with_retry(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Write a batch, retrying connection failures with backoff until it
+        succeeds or the buffer is closing.
+        
+        Any other failure is down to the batch's content (IntegrityError, e.g.
+        a job deleted before the flush, or DataError, e.g. a NUL byte) and
+        would recur on every attempt, so the batch is split in halves written
+        on their own until only the rejected rows are left, which are dropped.
+        """
+        from .models import AuditLog
+        
+        attempt = 0
+        delay = self.retry_backoff
+        while True:
+            try:
+                if attempt < self.max_retries:
+                    self._write(batch)
+                else:
+                    AuditLog.objects.log_many([AuditLog(**event) for event in batch], batch_size=self.max_rows)
+                return
+            
+            except (OperationalError, InterfaceError) as e:
+                attempt += 1
+                # Drop a possibly broken connection; the next attempt reconnects
+                connection.close()
+                if self._stopping.is_set() and attempt > self.max_retries:
+                    logger.error(f"Dropping {len(batch)} audit events at shutdown after {attempt} failed writes: {e}")
+                    return
+                logger.warning(f"Error writing {len(batch)} audit events (attempt {attempt}), retrying in {delay}s: {e}")
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_BACKOFF)
+            
+            except Exception as e:
+                if len(batch) == 1:
+                    logger.error(f"Dropping audit event {batch[0]['event_type']!r} rejected by the database: {e}")
+                    return
+                middle = len(batch) // 2
+                self._write_with_retry(batch[:middle])
+                self._write_with_retry(batch[middle:])
+                return
+    
+    def _collect(self) -> List[Dict[str, Any]]:
+        """Wait for the next batch: max_rows events or flush_interval worth."""
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_rows:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        from .models import AuditLog
+        
+        logs = [AuditLog(**event) for event in batch]
+        if connection.vendor != 'postgresql':
+            AuditLog.objects.log_many(logs, batch_size=self.max_rows)
+            return
+        
+        fields = [field for field in AuditLog._meta.concrete_fields if not field.primary_key]
+        buffer = io.StringIO()
+        for log in logs:
+            buffer.write('\t'.join(_copy_value(field, getattr(log, field.attname)) for field in fields))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+        # copy_expert is not wrapped by Django, so translate its psycopg2 errors here
+        with connection.cursor() as cursor, connection.wrap_database_errors:
+            cursor.copy_expert(
+                f"COPY {AuditLog._meta.db_table} ({columns}) FROM STDIN",
+                buffer
+            )
+
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _copy_value(field: models.Field, value: Any) -> str:
+    """Render a field value in COPY text format (\\N is NULL)."""
+    if value is None:
+        return '\\N'
+    if isinstance(field, models.JSONField):
+        value = orjson.dumps(value, default=str).decode()
+    elif isinstance(value, bool):
+        value = 't' if value else 'f'
+    elif hasattr(value, 'isoformat'):
+        value = value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+audit_logger = AuditLogBuffer()
+
+atexit.register(audit_logger.close)
+
+
+@worker_process_shutdown.connect
+def _flush_on_worker_shutdown(**kwargs):
+    # Prefork children may exit without running atexit handlers
+    audit_logger.close()
@@ -5,6 +5,7 @@ REST API Connector for Data Ingestion
 import requests
 import json
 import logging
+import sys
 import time
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime, timedelta
@@ -143,7 +144,8 @@ class RestAPIConnector(APIConnector):
             response_data: Full API response
             
         Returns:
-            List of records
+            List of records, each with ``_api_source`` and ``_api_extracted_at``
+            (epoch microseconds)
         """
         # Default extraction - assumes records are in 'data' field or root level
         data_field = self.config.get('data_field', 'data')
@@ -166,19 +168,22 @@ class RestAPIConnector(APIConnector):
         if not isinstance(records, list):
             records = [records]
         
-        # Add metadata to each record
+        # Add metadata to each record; like the database connectors'
+        # _record_metadata, the extraction time is epoch microseconds
+        source = sys.intern(self.name)
+        extracted_at = time.time_ns() // 1000
         enriched_records = []
         for record in records:
             if isinstance(record, dict):
-                record['_api_source'] = self.name
-                record['_api_extracted_at'] = datetime.now().isoformat()
+                record['_api_source'] = source
+                record['_api_extracted_at'] = extracted_at
                 enriched_records.append(record)
             else:
                 # Handle non-dict records
                 enriched_records.append({
                     'value': record,
-                    '_api_source': self.name,
-                    '_api_extracted_at': datetime.now().isoformat()
+                    '_api_source': source,
+                    '_api_extracted_at': extracted_at
                 })
         
         return enriched_records
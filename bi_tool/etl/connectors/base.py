@@ -5,6 +5,8 @@ Base Connector Classes and Registry for Data Ingestion
 import abc
 import time
 import logging
+import sys
+import orjson
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
@@ -152,6 +154,33 @@ class DatabaseConnector(BaseConnector):
         if self.connection:
             self.connection.close()
             self.connection = None
+    
+    def _record_metadata(self) -> Dict[str, Any]:
+        """
+        Build the metadata shared by every record of one extraction.
+        
+        The values are computed once per query so they can be merged into
+        each row with ``dict.update`` instead of being rebuilt per row.
+        ``_db_extracted_at`` is epoch microseconds and the source name is
+        interned, so every record references the same string objects.
+        """
+        return {
+            '_db_source': sys.intern(self.name),
+            '_db_extracted_at': time.time_ns() // 1000
+        }
+    
+    def extract_json(self, query_params: Dict[str, Any] = None) -> bytes:
+        """
+        Extract data and serialize it to JSON in one pass.
+        
+        Args:
+            query_params: Passed through to ``extract``
+        
+        Returns:
+            UTF-8 encoded JSON array of records
+        """
+        # orjson handles datetime/UUID natively; Decimal and the like fall back to str
+        return orjson.dumps(self.extract(query_params), default=str)
 
 
 class APIConnector(BaseConnector):
@@ -2,26 +2,168 @@
 Database Connector for Data Ingestion
 """
 
+import asyncio
 import logging
-import pandas as pd
-import psycopg2
-import pymongo
-from typing import Dict, List, Any, Tuple, Optional
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple, Optional, Sequence, Iterator
 from datetime import datetime
-import sqlalchemy
-from sqlalchemy import create_engine, text
-import mysql.connector
+from uuid import uuid4
 
 from .base import DatabaseConnector, ConnectorRegistry, DataExtractionError, ConfigurationError
 
+# Database drivers are imported where they are first used, so a worker that
+# only talks to one backend doesn't pay the import cost of the others.
+if TYPE_CHECKING:
+    import asyncpg
+    import pyarrow
+    from pymongo.cursor import Cursor
+    from sqlalchemy.engine import Engine
+
 logger = logging.getLogger(__name__)
 
+# Engines (and their connection pools) are shared per connection string so
+# repeated extracts reuse warm connections instead of reconnecting each time.
+_engines: Dict[Tuple[str, str], 'Engine'] = {}
+_engines_lock = threading.Lock()
+
+# Plain SQL identifiers accepted for table, column and ORDER BY names
+_IDENT_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+_ORDER_DIRECTIONS = {'ASC', 'DESC', 'NULLS', 'FIRST', 'LAST'}
+
+
+def get_engine(connection_string: str, **engine_options) -> 'Engine':
+    """
+    Get the shared SQLAlchemy engine for a connection string.
+    
+    Engines are cached per connection string and options, so connectors
+    that differ only in session settings (e.g. read-only) get their own pool.
+    
+    Args:
+        connection_string: SQLAlchemy database URL
+        **engine_options: Options passed to ``create_engine``
+    
+    Returns:
+        Cached Engine instance
+    """
+    key = (connection_string, repr(sorted(engine_options.items())))
+    engine = _engines.get(key)
+    if engine is None:
+        from sqlalchemy import create_engine
+        
+        with _engines_lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = create_engine(connection_string, **engine_options)
+                _engines[key] = engine
+    return engine
+
+
+def _select_from(engine: 'Engine', table: str, columns: Any) -> str:
+    """
+    Build ``SELECT <columns> FROM <table>`` with identifiers quoted for the dialect.
+    
+    Args:
+        engine: Engine whose dialect decides the quoting rules
+        table: Table name, optionally schema-qualified
+        columns: Column names, or '*' for all columns
+    
+    Returns:
+        SELECT clause string
+    """
+    quote = engine.dialect.identifier_preparer.quote
+    
+    if isinstance(columns, str):
+        columns = [columns]
+    
+    columns_str = ', '.join(
+        column if column == '*' else quote(_check_identifier(column, 'column'))
+        for column in columns
+    )
+    table_str = '.'.join(
+        quote(_check_identifier(part, 'table')) for part in table.split('.')
+    )
+    
+    return f"SELECT {columns_str} FROM {table_str}"
+
+
+def _order_by_clause(engine: 'Engine', order_by: Any) -> str:
+    """
+    Build an ``ORDER BY`` clause from "column [ASC|DESC] [NULLS FIRST|LAST]" items.
+    
+    Args:
+        engine: Engine whose dialect decides the quoting rules
+        order_by: Comma-separated string or list of sort items
+    
+    Returns:
+        ORDER BY clause string, with a leading space
+    """
+    quote = engine.dialect.identifier_preparer.quote
+    
+    if isinstance(order_by, str):
+        order_by = order_by.split(',')
+    
+    items = []
+    for item in order_by:
+        words = item.split()
+        if not words or any(word.upper() not in _ORDER_DIRECTIONS for word in words[1:]):
+            raise ConfigurationError(f"Invalid order_by item: {item!r}")
+        column, *direction = words
+        
+        column_str = '.'.join(
+            quote(_check_identifier(part, 'order_by column')) for part in column.split('.')
+        )
+        items.append(' '.join([column_str, *(word.upper() for word in direction)]))
+    
+    return f" ORDER BY {', '.join(items)}"
+
+
+def _check_identifier(name: str, kind: str) -> str:
+    """Return ``name`` if it is a plain SQL identifier, else raise ConfigurationError."""
+    if not isinstance(name, str) or not _IDENT_RE.match(name):
+        raise ConfigurationError(f"Invalid {kind} name: {name!r}")
+    return name
+
+
+def extract_many(connectors_and_params: Sequence[Tuple[DatabaseConnector, Dict[str, Any]]],
+                 max_workers: int = 8) -> List[List[Dict[str, Any]]]:
+    """
+    Run independent extractions in parallel threads.
+    
+    Extraction is network-bound and the database drivers release the GIL
+    while waiting on sockets, so N sources finish in roughly the time of
+    the slowest one instead of the sum of all of them.
+    
+    A single connector's ``self.connection`` is not thread-safe: pass a
+    separate connector instance per pair. SQL connectors share pooled
+    engines per connection string, so separate instances stay cheap.
+    
+    Args:
+        connectors_and_params: (connector, query_params) pairs
+        max_workers: Maximum number of extractions running at once
+    
+    Returns:
+        Extracted records per pair, in input order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda pair: pair[0].extract(pair[1]),
+            connectors_and_params
+        ))
+
 
 class PostgreSQLConnector(DatabaseConnector):
     """
     Connector for PostgreSQL database ingestion.
     """
     
+    # asyncpg pools are bound to the event loop that created them, so each
+    # entry remembers its loop and is rebuilt when used from a different one.
+    _async_pools: Dict[str, Tuple[asyncio.AbstractEventLoop, 'asyncpg.Pool']] = {}
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.host = config.get('host', 'localhost')
@@ -32,6 +174,15 @@ class PostgreSQLConnector(DatabaseConnector):
         self.ssl_mode = config.get('ssl_mode', 'prefer')
         self.connection_timeout = config.get('connection_timeout', 30)
         self.query_timeout = config.get('query_timeout', 300)
+        self.async_pool_max_size = config.get('async_pool_max_size', 10)
+        self.pool_size = config.get('pool_size', 5)
+        self.max_overflow = config.get('max_overflow', 10)
+        self.pool_recycle = config.get('pool_recycle', 1800)
+        
+        # Extract-only sessions are declared read-only so the server can skip
+        # write bookkeeping; the name makes them easy to spot in pg_stat_activity
+        self.read_only = config.get('read_only', True)
+        self.application_name = config.get('application_name', 'bi_etl_extractor')
         
         # Build connection string
         self.connection_string = self._build_connection_string()
@@ -40,6 +191,9 @@ class PostgreSQLConnector(DatabaseConnector):
         """Get database connection."""
         if not self.connection:
             try:
+                import psycopg2
+                import psycopg2.extensions
+                
                 self.connection = psycopg2.connect(
                     host=self.host,
                     port=self.port,
@@ -47,9 +201,14 @@ class PostgreSQLConnector(DatabaseConnector):
                     user=self.username,
                     password=self.password,
                     sslmode=self.ssl_mode,
-                    connect_timeout=self.connection_timeout
+                    connect_timeout=self.connection_timeout,
+                    application_name=self.application_name
+                )
+                self.connection.set_session(
+                    readonly=self.read_only,
+                    isolation_level=psycopg2.extensions.ISOLATION_LEVEL_REPEATABLE_READ,
+                    autocommit=True
                 )
-                self.connection.set_session(autocommit=True)
             except Exception as e:
                 raise DataExtractionError(f"Failed to connect to PostgreSQL: {str(e)}")
         
@@ -60,6 +219,29 @@ class PostgreSQLConnector(DatabaseConnector):
         return (f"postgresql://{self.username}:{self.password}@"
                 f"{self.host}:{self.port}/{self.database}")
     
+    def get_engine(self) -> 'Engine':
+        """Get the pooled SQLAlchemy engine shared by all connectors for this database."""
+        return get_engine(
+            self.connection_string,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=self.pool_recycle,
+            isolation_level='REPEATABLE READ',
+            executemany_mode='values_plus_batch',
+            insertmanyvalues_page_size=10_000,
+            connect_args={
+                'sslmode': self.ssl_mode,
+                'connect_timeout': self.connection_timeout,
+                'application_name': self.application_name,
+                'options': f"-c default_transaction_read_only={'on' if self.read_only else 'off'}"
+            }
+        )
+    
+    def pool_status(self) -> str:
+        """Describe the engine's connection pool (checked in/out, overflow)."""
+        return self.get_engine().pool.status()
+    
     def extract(self, query_params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         Extract data using SQL query.
@@ -80,12 +262,9 @@ class PostgreSQLConnector(DatabaseConnector):
             raise DataExtractionError("Either 'query' or 'table' must be provided")
         
         try:
-            self.rate_limit_check()
-            
-            if query:
-                data = self.execute_query(query, query_params.get('params', {}))
-            else:
-                data = self._extract_from_table(table, query_params)
+            data = []
+            for batch in self.extract_stream(query_params):
+                data.extend(batch)
             
             self.log_activity('extract', {
                 'query': query or f"SELECT * FROM {table}",
@@ -99,6 +278,137 @@ class PostgreSQLConnector(DatabaseConnector):
             logger.error(f"Error extracting from PostgreSQL: {e}")
             raise DataExtractionError(f"PostgreSQL extraction failed: {str(e)}")
     
+    def extract_stream(self, query_params: Dict[str, Any],
+                       chunk_size: int = 10_000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Extract data in batches so downstream processing can start before
+        the whole result set has been read.
+        
+        Args:
+            query_params: Should contain 'query' or 'table' with optional filters
+            chunk_size: Maximum records per batch
+        
+        Yields:
+            Lists of records as dictionaries
+        """
+        query = query_params.get('query')
+        table = query_params.get('table')
+        
+        if not query and not table:
+            raise DataExtractionError("Either 'query' or 'table' must be provided")
+        
+        self.rate_limit_check()
+        
+        if query:
+            params = query_params.get('params', {})
+        else:
+            query, params = self._build_table_query(table, query_params)
+        
+        yield from self.iter_records(query, params, chunk_size)
+    
+    def extract_arrow(self, query_params: Dict[str, Any], partition_on: str = None,
+                      partition_num: int = 4) -> 'pyarrow.Table':
+        """
+        Extract data as a columnar Arrow table.
+        
+        Uses connectorx for parallel, partitioned reads straight into Arrow
+        buffers when it is installed. Parameterized queries and installs
+        without connectorx fall back to a server-side cursor; either way the
+        table holds the query's columns only, without the ``_db_*`` metadata
+        the record path adds.
+        
+        Args:
+            query_params: Should contain 'query' or 'table' with optional filters
+            partition_on: Numeric column used to split the read into ranges
+            partition_num: Number of partitions read in parallel
+        
+        Returns:
+            pyarrow.Table with the query results
+        """
+        query = query_params.get('query')
+        table = query_params.get('table')
+        
+        if not query and not table:
+            raise DataExtractionError("Either 'query' or 'table' must be provided")
+        
+        if query:
+            params = query_params.get('params')
+        else:
+            # connectorx sends the SQL as-is, so render LIMIT/OFFSET inline
+            query, params = self._build_table_query(table, query_params, bind_limits=False)
+        
+        try:
+            import connectorx
+        except ImportError:
+            connectorx = None
+        
+        self.rate_limit_check()
+        
+        try:
+            if connectorx is None or params:
+                # connectorx cannot bind parameters; read through a server-side cursor instead
+                arrow_table = self._read_arrow(query, params)
+            else:
+                arrow_table = connectorx.read_sql(
+                    self.connection_string,
+                    query,
+                    partition_on=partition_on,
+                    partition_num=partition_num if partition_on else None,
+                    return_type='arrow'
+                )
+            
+            self.log_activity('extract_arrow', {
+                'query': query,
+                'records_extracted': arrow_table.num_rows,
+                'partition_on': partition_on
+            })
+            
+            return arrow_table
+        
+        except Exception as e:
+            logger.error(f"Error extracting Arrow table from PostgreSQL: {e}")
+            raise DataExtractionError(f"PostgreSQL Arrow extraction failed: {str(e)}")
+    
+    def _read_arrow(self, query: str, params: Dict[str, Any] = None,
+                    chunk_size: int = 10_000) -> 'pyarrow.Table':
+        """
+        Read a query into an Arrow table through a server-side cursor.
+        
+        Column names come from the cursor description, so the table has the
+        columns connectorx would return even when no rows match.
+        """
+        import pyarrow
+        from sqlalchemy import text
+        
+        engine = self.get_engine()
+        
+        # Compile :name placeholders to the driver's %(name)s style
+        compiled = text(query).compile(dialect=engine.dialect)
+        statement = str(compiled)
+        bind_params = compiled.construct_params(params or {})
+        
+        connection = engine.raw_connection()
+        try:
+            cursor = connection.cursor(name=f"etl_extract_{uuid4().hex}")
+            try:
+                cursor.itersize = chunk_size
+                cursor.execute(statement, bind_params)
+                
+                # A named cursor describes its columns once the first FETCH has run
+                rows = cursor.fetchmany(chunk_size)
+                names = [column[0] for column in cursor.description]
+                columns = [[] for _ in names]
+                while rows:
+                    for column, values in zip(columns, zip(*rows)):
+                        column.extend(values)
+                    rows = cursor.fetchmany(chunk_size)
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+        
+        return pyarrow.Table.from_arrays([pyarrow.array(column) for column in columns], names=names)
+    
     def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         Execute SQL query and return results.
@@ -110,30 +420,123 @@ class PostgreSQLConnector(DatabaseConnector):
         Returns:
             List of records as dictionaries
         """
+        records = []
+        for batch in self.iter_records(query, params):
+            records.extend(batch)
+        return records
+    
+    def iter_records(self, query: str, params: Dict[str, Any] = None,
+                     chunk_size: int = 10_000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute SQL query and stream results through a server-side cursor.
+        
+        Peak memory is bounded by ``chunk_size`` rather than the result size.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            chunk_size: Rows fetched per round trip and records per batch
+        
+        Yields:
+            Lists of records as dictionaries
+        """
         try:
-            # Use pandas for efficient query execution
-            engine = create_engine(self.connection_string)
-            
-            df = pd.read_sql(
-                text(query),
-                engine,
-                params=params or {},
-                chunksize=None
-            )
+            import psycopg2.extras
+            from sqlalchemy import text
             
-            # Convert to list of dictionaries
-            records = df.to_dict('records')
+            engine = self.get_engine()
             
-            # Add metadata
-            for record in records:
-                record['_db_source'] = self.name
-                record['_db_extracted_at'] = datetime.now().isoformat()
-            
-            return records
+            # Compile :name placeholders to the driver's %(name)s style
+            compiled = text(query).compile(dialect=engine.dialect)
+            statement = str(compiled)
+            bind_params = compiled.construct_params(params or {})
             
+            connection = engine.raw_connection()
+            try:
+                # A named psycopg2 cursor is server-side, so rows arrive in chunks;
+                # RealDictCursor hands them back as dicts while they are parsed
+                cursor = connection.cursor(
+                    name=f"etl_extract_{uuid4().hex}",
+                    cursor_factory=psycopg2.extras.RealDictCursor
+                )
+                try:
+                    cursor.itersize = chunk_size
+                    cursor.execute(statement, bind_params)
+                    
+                    metadata = self._record_metadata()
+                    dict_ = dict
+                    rows = cursor.fetchmany(chunk_size)
+                    
+                    while rows:
+                        # Copy each row and add metadata in a single dict() call
+                        yield [dict_(row, **metadata) for row in rows]
+                        rows = cursor.fetchmany(chunk_size)
+                finally:
+                    # Also runs when the consumer stops early (generator close)
+                    cursor.close()
+            finally:
+                connection.close()
+        
         except Exception as e:
             raise DataExtractionError(f"Query execution failed: {str(e)}")
     
+    def load(self, table: str, records: List[Dict[str, Any]], page_size: int = 10_000) -> int:
+        """
+        Bulk insert records into a table.
+        
+        Rows are sent as multi-row ``INSERT ... VALUES`` statements of
+        ``page_size`` rows each instead of one round trip per row.
+        
+        Args:
+            table: Target table name, optionally schema-qualified
+            records: Records to insert; the first record decides the columns
+            page_size: Rows per INSERT statement
+        
+        Returns:
+            Number of records inserted
+        """
+        if self.read_only:
+            raise ConfigurationError("Connector is read-only; set read_only=False to load data")
+        
+        if not records:
+            return 0
+        
+        engine = self.get_engine()
+        quote = engine.dialect.identifier_preparer.quote
+        columns = list(records[0].keys())
+        
+        table_str = '.'.join(quote(_check_identifier(part, 'table')) for part in table.split('.'))
+        columns_str = ', '.join(quote(_check_identifier(column, 'column')) for column in columns)
+        statement = f"INSERT INTO {table_str} ({columns_str}) VALUES %s"
+        
+        try:
+            import psycopg2.extras
+            
+            connection = engine.raw_connection()
+            try:
+                cursor = connection.cursor()
+                psycopg2.extras.execute_values(
+                    cursor,
+                    statement,
+                    [tuple(record.get(column) for column in columns) for record in records],
+                    page_size=page_size
+                )
+                connection.commit()
+                cursor.close()
+            finally:
+                connection.close()
+            
+            self.log_activity('load', {
+                'table': table,
+                'records_loaded': len(records)
+            })
+            
+            return len(records)
+        
+        except Exception as e:
+            logger.error(f"Error loading into PostgreSQL: {e}")
+            raise DataExtractionError(f"PostgreSQL load failed: {str(e)}")
+    
     def _extract_from_table(self, table: str, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Extract data from a specific table with filters.
@@ -145,34 +548,195 @@ class PostgreSQLConnector(DatabaseConnector):
         Returns:
             List of records
         """
-        # Build SELECT query with filters
+        query, params = self._build_table_query(table, query_params)
+        return self.execute_query(query, params)
+    
+    def _build_table_query(self, table: str, query_params: Dict[str, Any],
+                           bind_limits: bool = True) -> Tuple[str, Any]:
+        """
+        Build a SELECT statement for a table extraction.
+        
+        Identifiers are quoted and LIMIT/OFFSET are bound as parameters, so
+        every page of a paginated extract sends the same statement text and
+        the server can reuse its plan.
+        
+        Args:
+            table: Table name
+            query_params: Query parameters including filters
+            bind_limits: Bind LIMIT/OFFSET as ``:_limit``/``:_offset``; when
+                False they are rendered inline (for drivers that cannot take
+                named parameters)
+        
+        Returns:
+            Tuple of (query, params)
+        """
         columns = query_params.get('columns', ['*'])
         where_clause = query_params.get('where')
         order_by = query_params.get('order_by')
         limit = query_params.get('limit')
         offset = query_params.get('offset', 0)
+        params = query_params.get('params')
         
-        # Build query
-        if isinstance(columns, list):
-            columns_str = ', '.join(columns)
-        else:
-            columns_str = str(columns)
-        
-        query = f"SELECT {columns_str} FROM {table}"
+        query = _select_from(self.get_engine(), table, columns)
         
         if where_clause:
             query += f" WHERE {where_clause}"
         
         if order_by:
-            query += f" ORDER BY {order_by}"
+            query += _order_by_clause(self.get_engine(), order_by)
+        
+        if not bind_limits:
+            if limit:
+                query += f" LIMIT {int(limit)}"
+            if offset:
+                query += f" OFFSET {int(offset)}"
+            return query, params
+        
+        params = dict(params or {})
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT :_limit"
+            params['_limit'] = int(limit)
         
         if offset:
-            query += f" OFFSET {offset}"
+            query += " OFFSET :_offset"
+            params['_offset'] = int(offset)
+        
+        return query, params
+    
+    async def get_async_pool(self) -> 'asyncpg.Pool':
+        """Get the asyncpg pool for this database on the running event loop."""
+        loop = asyncio.get_running_loop()
+        cached = self._async_pools.get(self.connection_string)
+        if cached and cached[0] is loop:
+            return cached[1]
+        
+        try:
+            import asyncpg
+            
+            pool = await asyncpg.create_pool(
+                dsn=self.connection_string,
+                min_size=2,
+                max_size=self.async_pool_max_size,
+                ssl=self.ssl_mode,
+                timeout=self.connection_timeout,
+                command_timeout=self.query_timeout,
+                server_settings={
+                    'application_name': self.application_name,
+                    'default_transaction_read_only': 'on' if self.read_only else 'off'
+                }
+            )
+        except Exception as e:
+            raise DataExtractionError(f"Failed to create asyncpg pool: {str(e)}")
+        
+        # Another coroutine may have created a pool while we were connecting
+        cached = self._async_pools.get(self.connection_string)
+        if cached and cached[0] is loop:
+            await pool.close()
+            return cached[1]
+        
+        self._async_pools[self.connection_string] = (loop, pool)
+        return pool
+    
+    async def close_async_pool(self):
+        """Close the asyncpg pool for this database, if one is open."""
+        cached = self._async_pools.pop(self.connection_string, None)
+        if cached:
+            await cached[1].close()
+    
+    async def async_execute_query(self, query: str, params: Sequence[Any] = None) -> List[Dict[str, Any]]:
+        """
+        Execute SQL query over asyncpg and return results.
+        
+        Args:
+            query: SQL query string using positional ($1, $2, ...) placeholders
+            params: Positional query parameters
+        
+        Returns:
+            List of records as dictionaries
+        """
+        if isinstance(params, dict):
+            raise DataExtractionError("asyncpg queries take positional ($1, $2, ...) parameters")
+        
+        try:
+            pool = await self.get_async_pool()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(query, *(params or ()))
+            
+            # Add metadata
+            metadata = self._record_metadata()
+            records = [dict(row, **metadata) for row in rows]
+            
+            return records
         
-        return self.execute_query(query, query_params.get('params', {}))
+        except DataExtractionError:
+            raise
+        except Exception as e:
+            raise DataExtractionError(f"Query execution failed: {str(e)}")
+    
+    async def async_extract(self, query_params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Extract data without blocking the event loop.
+        
+        Several extracts can share one pool and overlap their network waits,
+        e.g. ``await asyncio.gather(conn.async_extract(q1), conn.async_extract(q2))``.
+        
+        Args:
+            query_params: Should contain 'query' or 'table' with optional filters;
+                'params' must be positional
+        
+        Returns:
+            List of records as dictionaries
+        """
+        if not query_params:
+            raise DataExtractionError("No query parameters provided")
+        
+        query = query_params.get('query')
+        table = query_params.get('table')
+        
+        if not query and not table:
+            raise DataExtractionError("Either 'query' or 'table' must be provided")
+        
+        try:
+            if query:
+                params = query_params.get('params')
+            else:
+                # asyncpg takes positional parameters, so render LIMIT/OFFSET inline
+                query, params = self._build_table_query(table, query_params, bind_limits=False)
+            
+            data = await self.async_execute_query(query, params)
+            
+            self.log_activity('async_extract', {
+                'query': query,
+                'records_extracted': len(data),
+                'params': query_params.get('params')
+            })
+            
+            return data
+        
+        except Exception as e:
+            logger.error(f"Error extracting from PostgreSQL: {e}")
+            raise DataExtractionError(f"PostgreSQL extraction failed: {str(e)}")
+    
+    def extract_concurrently(self, query_params_list: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run several extracts concurrently from synchronous code.
+        
+        Args:
+            query_params_list: One ``async_extract`` parameter dict per query
+        
+        Returns:
+            List of record lists, in the same order as ``query_params_list``
+        """
+        async def _run():
+            try:
+                return await asyncio.gather(
+                    *(self.async_extract(query_params) for query_params in query_params_list)
+                )
+            finally:
+                await self.close_async_pool()
+        
+        return asyncio.run(_run())
     
     def validate_config(self) -> Tuple[bool, List[str]]:
         """Validate connector configuration."""
@@ -193,6 +757,9 @@ class PostgreSQLConnector(DatabaseConnector):
         if not self.password:
             errors.append("password is required")
         
+        if self.async_pool_max_size < 2:
+            errors.append("async_pool_max_size must be at least 2")
+        
         if self.connection_timeout <= 0:
             errors.append("connection_timeout must be positive")
         
@@ -204,8 +771,11 @@ class PostgreSQLConnector(DatabaseConnector):
     def health_check(self, config: Dict[str, Any] = None) -> Dict[str, Any]:
         """Check database connectivity."""
         start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
+            import psycopg2
+            
             # Test connection
             test_connection = psycopg2.connect(
                 host=self.host,
@@ -225,7 +795,7 @@ class PostgreSQLConnector(DatabaseConnector):
             cursor.close()
             test_connection.close()
             
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             return {
                 'healthy': True,
@@ -233,11 +803,12 @@ class PostgreSQLConnector(DatabaseConnector):
                 'error': None,
                 'timestamp': start_time.isoformat(),
                 'connector_type': 'postgresql',
-                'test_result': result[0] if result else None
+                'test_result': result[0] if result else None,
+                'pool_status': self.pool_status()
             }
             
         except Exception as e:
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             return {
                 'healthy': False,
                 'response_time': response_time,
@@ -261,26 +832,112 @@ class MySQLConnector(DatabaseConnector):
         self.password = config.get('password')
         self.charset = config.get('charset', 'utf8mb4')
         self.connection_timeout = config.get('connection_timeout', 30)
+        self.pool_size = config.get('pool_size', 5)
+        self.max_overflow = config.get('max_overflow', 10)
+        self.pool_recycle = config.get('pool_recycle', 1800)
+        self.driver = self._select_driver(config.get('driver', 'auto'))
+        
+        # Build connection string
+        self.connection_string = self._build_connection_string()
+    
+    @staticmethod
+    def _select_driver(driver: str) -> str:
+        """
+        Pick the DBAPI driver for this connector.
+        
+        'auto' prefers mysql-connector with its C extension, then mysqlclient
+        (MySQLdb), and only then pure-Python mysql-connector.
+        
+        Args:
+            driver: 'auto', 'mysqlconnector' or 'mysqldb'
+        
+        Returns:
+            Driver name as used in SQLAlchemy URLs
+        """
+        if driver != 'auto':
+            return driver
+        
+        try:
+            import mysql.connector
+            if mysql.connector.HAVE_CEXT:
+                return 'mysqlconnector'
+        except ImportError:
+            pass
+        
+        try:
+            import MySQLdb  # noqa: F401
+            return 'mysqldb'
+        except ImportError:
+            return 'mysqlconnector'
     
     def get_connection(self):
         """Get database connection."""
         if not self.connection:
             try:
-                self.connection = mysql.connector.connect(
-                    host=self.host,
-                    port=self.port,
-                    database=self.database,
-                    user=self.username,
-                    password=self.password,
-                    charset=self.charset,
-                    connection_timeout=self.connection_timeout,
-                    autocommit=True
-                )
+                if self.driver == 'mysqldb':
+                    import MySQLdb
+                    
+                    self.connection = MySQLdb.connect(
+                        host=self.host,
+                        port=self.port,
+                        database=self.database,
+                        user=self.username,
+                        password=self.password,
+                        charset=self.charset,
+                        connect_timeout=self.connection_timeout,
+                        autocommit=True
+                    )
+                else:
+                    import mysql.connector
+                    
+                    self.connection = mysql.connector.connect(
+                        host=self.host,
+                        port=self.port,
+                        database=self.database,
+                        user=self.username,
+                        password=self.password,
+                        charset=self.charset,
+                        connection_timeout=self.connection_timeout,
+                        autocommit=True,
+                        use_pure=False,
+                        buffered=False,
+                        raise_on_warnings=False,
+                        get_warnings=False
+                    )
             except Exception as e:
                 raise DataExtractionError(f"Failed to connect to MySQL: {str(e)}")
         
         return self.connection
     
+    def _build_connection_string(self) -> str:
+        """Build SQLAlchemy connection string."""
+        return (f"mysql+{self.driver}://{self.username}:{self.password}@"
+                f"{self.host}:{self.port}/{self.database}?charset={self.charset}")
+    
+    def get_engine(self) -> 'Engine':
+        """Get the pooled SQLAlchemy engine shared by all connectors for this database."""
+        if self.driver == 'mysqldb':
+            connect_args = {'connect_timeout': self.connection_timeout, 'autocommit': True}
+        else:
+            connect_args = {
+                'connection_timeout': self.connection_timeout,
+                'autocommit': True,
+                'use_pure': False
+            }
+        
+        return get_engine(
+            self.connection_string,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=self.pool_recycle,
+            connect_args=connect_args
+        )
+    
+    def pool_status(self) -> str:
+        """Describe the engine's connection pool (checked in/out, overflow)."""
+        return self.get_engine().pool.status()
+    
     def extract(self, query_params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Extract data using SQL query."""
         if not query_params:
@@ -314,18 +971,28 @@ class MySQLConnector(DatabaseConnector):
     def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Execute SQL query and return results."""
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            
-            cursor.execute(query, params or {})
-            results = cursor.fetchall()
-            
-            # Add metadata
-            for record in results:
-                record['_db_source'] = self.name
-                record['_db_extracted_at'] = datetime.now().isoformat()
+            # Borrow a pooled DBAPI connection; close() hands it back to the pool
+            connection = self.get_engine().raw_connection()
+            try:
+                # Unbuffered dict cursors hand rows over as they arrive
+                if self.driver == 'mysqldb':
+                    import MySQLdb.cursors
+                    cursor = connection.cursor(MySQLdb.cursors.SSDictCursor)
+                else:
+                    cursor = connection.cursor(dictionary=True, buffered=False)
+                
+                try:
+                    cursor.execute(query, params or {})
+                    
+                    # Add metadata
+                    metadata = self._record_metadata()
+                    results = [dict(row, **metadata) for row in cursor]
+                finally:
+                    # An unbuffered cursor left open would hold the pooled connection's result set
+                    cursor.close()
+            finally:
+                connection.close()
             
-            cursor.close()
             return results
             
         except Exception as e:
@@ -339,26 +1006,27 @@ class MySQLConnector(DatabaseConnector):
         order_by = query_params.get('order_by')
         limit = query_params.get('limit')
         offset = query_params.get('offset', 0)
+        params = dict(query_params.get('params') or {})
         
-        if isinstance(columns, list):
-            columns_str = ', '.join(columns)
-        else:
-            columns_str = str(columns)
-        
-        query = f"SELECT {columns_str} FROM {table}"
+        query = _select_from(self.get_engine(), table, columns)
         
         if where_clause:
             query += f" WHERE {where_clause}"
         
         if order_by:
-            query += f" ORDER BY {order_by}"
+            query += _order_by_clause(self.get_engine(), order_by)
         
-        if limit:
-            query += f" LIMIT {limit}"
-            if offset:
-                query += f" OFFSET {offset}"
+        # MySQL only accepts OFFSET after LIMIT; the maximum row count stands
+        # in for "no limit" when only an offset is given
+        if limit or offset:
+            query += " LIMIT %(_limit)s"
+            params['_limit'] = int(limit) if limit else 18446744073709551615
         
-        return self.execute_query(query, query_params.get('params', {}))
+        if offset:
+            query += " OFFSET %(_offset)s"
+            params['_offset'] = int(offset)
+        
+        return self.execute_query(query, params)
     
     def validate_config(self) -> Tuple[bool, List[str]]:
         """Validate connector configuration."""
@@ -379,21 +1047,19 @@ class MySQLConnector(DatabaseConnector):
         if not self.password:
             errors.append("password is required")
         
+        if self.driver not in ('mysqlconnector', 'mysqldb'):
+            errors.append("driver must be 'auto', 'mysqlconnector' or 'mysqldb'")
+        
         return len(errors) == 0, errors
     
     def health_check(self, config: Dict[str, Any] = None) -> Dict[str, Any]:
         """Check database connectivity."""
         start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
-            test_connection = mysql.connector.connect(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.username,
-                password=self.password,
-                connection_timeout=self.connection_timeout
-            )
+            # Borrow a pooled connection instead of opening a new one
+            test_connection = self.get_engine().raw_connection()
             
             cursor = test_connection.cursor()
             cursor.execute("SELECT 1")
@@ -402,7 +1068,7 @@ class MySQLConnector(DatabaseConnector):
             cursor.close()
             test_connection.close()
             
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             return {
                 'healthy': True,
@@ -410,11 +1076,12 @@ class MySQLConnector(DatabaseConnector):
                 'error': None,
                 'timestamp': start_time.isoformat(),
                 'connector_type': 'mysql',
-                'test_result': result[0] if result else None
+                'test_result': result[0] if result else None,
+                'pool_status': self.pool_status()
             }
             
         except Exception as e:
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             return {
                 'healthy': False,
                 'response_time': response_time,
@@ -438,6 +1105,19 @@ class MongoDBConnector(DatabaseConnector):
         self.password = config.get('password')
         self.auth_source = config.get('auth_source', 'admin')
         self.connection_timeout = config.get('connection_timeout', 30)
+        self.batch_size = config.get('batch_size', 1000)
+        
+        # Client pool sizing and wire compression
+        self.max_pool_size = config.get('max_pool_size', 50)
+        self.min_pool_size = config.get('min_pool_size', 5)
+        self.max_idle_time_ms = config.get('max_idle_time_ms', 30000)
+        self.compressors = config.get('compressors', 'zstd,snappy,zlib')
+        
+        # Unbounded full-document reads above this size are logged
+        self.large_collection_threshold = config.get('large_collection_threshold', 100_000)
+        
+        # Upper bound on documents held in memory by a single extract call
+        self.max_records = config.get('max_records', 1_000_000)
     
     def get_connection(self):
         """Get MongoDB connection."""
@@ -450,9 +1130,15 @@ class MongoDBConnector(DatabaseConnector):
                 else:
                     connection_string = f"mongodb://{self.host}:{self.port}/{self.database}"
                 
+                import pymongo
+                
                 self.connection = pymongo.MongoClient(
                     connection_string,
-                    serverSelectionTimeoutMS=self.connection_timeout * 1000
+                    maxPoolSize=self.max_pool_size,
+                    minPoolSize=self.min_pool_size,
+                    maxIdleTimeMS=self.max_idle_time_ms,
+                    serverSelectionTimeoutMS=self.connection_timeout * 1000,
+                    compressors=self.compressors
                 )
                 
                 # Test connection
@@ -464,62 +1150,161 @@ class MongoDBConnector(DatabaseConnector):
         return self.connection
     
     def extract(self, query_params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-        """Extract data from MongoDB collection."""
+        """
+        Extract data from MongoDB collection.
+        
+        At most ``max_records`` documents are held in memory; larger reads
+        fail fast and should go through ``extract_stream`` instead.
+        """
         if not query_params:
             raise DataExtractionError("No query parameters provided")
         
-        collection_name = query_params.get('collection')
-        if not collection_name:
-            raise DataExtractionError("Collection name must be provided")
+        limit = query_params.get('limit')
+        if limit and limit > self.max_records:
+            raise DataExtractionError(
+                f"limit {limit} exceeds max_records ({self.max_records}); use extract_stream"
+            )
         
         try:
             self.rate_limit_check()
             
-            client = self.get_connection()
-            db = client[self.database]
-            collection = db[collection_name]
-            
-            # Build query
-            filter_query = query_params.get('filter', {})
-            projection = query_params.get('projection')
-            sort = query_params.get('sort')
-            limit = query_params.get('limit')
-            skip = query_params.get('skip', 0)
-            
-            # Execute query
-            cursor = collection.find(filter_query, projection)
+            # Without a limit, read one document past the cap to detect overflow
+            cursor = self._find(query_params, limit or self.max_records + 1)
             
-            if sort:
-                cursor = cursor.sort(sort)
+            # Convert ObjectIds to strings and add metadata while draining
+            # the cursor, one getMore batch at a time
+            metadata = self._record_metadata()
+            results = []
+            append = results.append
+            for record in cursor.batch_size(self.batch_size):
+                record_id = record.get('_id')
+                if record_id is not None:
+                    record['_id'] = str(record_id)
+                record.update(metadata)
+                append(record)
             
-            if skip:
-                cursor = cursor.skip(skip)
-            
-            if limit:
-                cursor = cursor.limit(limit)
-            
-            # Convert to list
-            results = list(cursor)
-            
-            # Convert ObjectIds to strings and add metadata
-            for record in results:
-                if '_id' in record:
-                    record['_id'] = str(record['_id'])
-                record['_mongo_source'] = self.name
-                record['_mongo_extracted_at'] = datetime.now().isoformat()
+            if len(results) > self.max_records:
+                raise DataExtractionError(
+                    f"More than max_records ({self.max_records}) documents match; "
+                    f"pass a limit or use extract_stream"
+                )
             
             self.log_activity('extract', {
-                'collection': collection_name,
-                'filter': filter_query,
+                'collection': query_params['collection'],
+                'filter': query_params.get('filter', {}),
                 'records_extracted': len(results)
             })
             
             return results
-            
+        
+        except DataExtractionError:
+            raise
         except Exception as e:
             logger.error(f"Error extracting from MongoDB: {e}")
             raise DataExtractionError(f"MongoDB extraction failed: {str(e)}")
     
+    def extract_stream(self, query_params: Dict[str, Any],
+                       chunk_size: int = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Extract data in batches so collections larger than ``max_records``
+        can be processed without holding them in memory.
+        
+        Args:
+            query_params: Same keys as ``extract``
+            chunk_size: Maximum records per batch, ``max_records // 100`` by default
+        
+        Yields:
+            Lists of records as dictionaries
+        """
+        if not query_params:
+            raise DataExtractionError("No query parameters provided")
+        
+        chunk_size = chunk_size or max(self.max_records // 100, 1)
+        
+        self.rate_limit_check()
+        
+        cursor = self._find(query_params, query_params.get('limit'))
+        metadata = self._record_metadata()
+        
+        batch = []
+        append = batch.append
+        for record in cursor.batch_size(min(self.batch_size, chunk_size)):
+            record_id = record.get('_id')
+            if record_id is not None:
+                record['_id'] = str(record_id)
+            record.update(metadata)
+            append(record)
+            
+            if len(batch) >= chunk_size:
+                yield batch
+                batch = []
+                append = batch.append
+        
+        if batch:
+            yield batch
+    
+    def _find(self, query_params: Dict[str, Any], limit: Optional[int]) -> 'Cursor':
+        """
+        Build the find cursor for an extraction.
+        
+        Args:
+            query_params: Query parameters with 'collection' and optional
+                filter, projection, columns, sort and skip
+            limit: Maximum documents to return, or None for no limit
+        
+        Returns:
+            Unevaluated pymongo cursor
+        """
+        collection_name = query_params.get('collection')
+        if not collection_name:
+            raise DataExtractionError("Collection name must be provided")
+        
+        client = self.get_connection()
+        db = client[self.database]
+        collection = db[collection_name]
+        
+        # Build query
+        filter_query = query_params.get('filter', {})
+        projection = query_params.get('projection')
+        columns = query_params.get('columns')
+        sort = query_params.get('sort')
+        skip = query_params.get('skip', 0)
+        
+        # Mirror SQL column selection so only requested fields cross the wire
+        if projection is None and isinstance(columns, list) and columns:
+            projection = {column: 1 for column in columns}
+            if '_id' not in projection:
+                projection['_id'] = 0
+        
+        if projection is None and not query_params.get('limit'):
+            document_count = collection.estimated_document_count()
+            if document_count > self.large_collection_threshold:
+                logger.warning(
+                    f"{self.name} - reading all fields of ~{document_count} documents "
+                    f"from '{collection_name}' without projection or limit"
+                )
+        
+        # Execute query
+        cursor = collection.find(filter_query, projection)
+        
+        if sort:
+            cursor = cursor.sort(sort)
+        
+        if skip:
+            cursor = cursor.skip(skip)
+        
+        if limit:
+            cursor = cursor.limit(limit)
+        
+        return cursor
+    
+    def _record_metadata(self) -> Dict[str, Any]:
+        """Build the metadata shared by every document of one extraction."""
+        return {
+            '_mongo_source': sys.intern(self.name),
+            '_mongo_extracted_at': time.time_ns() // 1000
+        }
+    
     def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """MongoDB doesn't use SQL queries - use extract method instead."""
         raise NotImplementedError("MongoDB uses extract method with collection queries")
@@ -537,11 +1322,24 @@ class MongoDBConnector(DatabaseConnector):
         if not self.database:
             errors.append("database is required")
         
+        if not isinstance(self.batch_size, int) or self.batch_size < 1:
+            errors.append("batch_size must be a positive integer")
+        
+        if not isinstance(self.max_pool_size, int) or self.max_pool_size < 1:
+            errors.append("max_pool_size must be a positive integer")
+        
+        if not isinstance(self.min_pool_size, int) or not (0 <= self.min_pool_size <= self.max_pool_size):
+            errors.append("min_pool_size must be between 0 and max_pool_size")
+        
+        if not isinstance(self.max_records, int) or self.max_records < 1:
+            errors.append("max_records must be a positive integer")
+        
         return len(errors) == 0, errors
     
     def health_check(self, config: Dict[str, Any] = None) -> Dict[str, Any]:
         """Check MongoDB connectivity."""
         start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             client = self.get_connection()
@@ -549,7 +1347,7 @@ class MongoDBConnector(DatabaseConnector):
             # Test with ping command
             result = client.admin.command('ping')
             
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             return {
                 'healthy': True,
@@ -561,7 +1359,7 @@ class MongoDBConnector(DatabaseConnector):
             }
             
         except Exception as e:
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             return {
                 'healthy': False,
                 'response_time': response_time,
@@ -0,0 +1,129 @@
+"""
+Custom model fields for ETL storage
+"""
+
+import hashlib
+import json
+from typing import Any
+
+import orjson
+import zstandard
+from django.db import models
+from django.db.models.fields.json import KeyTransform
+from django.db.models.query_utils import DeferredAttribute
+
+
+def payload_digest(value: Any) -> bytes:
+    """
+    SHA-256 of a JSON-compatible value, independent of dict key order.
+    
+    hashlib uses OpenSSL, which picks the CPU's SHA extensions when available.
+    """
+    return hashlib.sha256(orjson.dumps(value, option=orjson.OPT_SORT_KEYS)).digest()
+
+
+class CompressedPayload(bytes):
+    """zstd-compressed JSON bytes, as stored in the database."""
+    
+    @classmethod
+    def from_value(cls, value: Any) -> 'CompressedPayload':
+        """Serialize and compress a JSON-compatible value."""
+        return cls(zstandard.ZstdCompressor(level=3).compress(orjson.dumps(value)))
+    
+    def load(self) -> Any:
+        """Decompress and parse the stored JSON (bytes.decode is left as is)."""
+        return orjson.loads(zstandard.ZstdDecompressor().decompress(self))
+
+
+class CompressedJSONDescriptor(DeferredAttribute):
+    """
+    Decompress the stored payload on first attribute access.
+    
+    Rows loaded from the database keep their payload as compressed bytes
+    until the attribute is read, so code that only moves rows around never
+    pays for decompression and parsing.
+    """
+    
+    def __get__(self, instance, cls=None):
+        value = super().__get__(instance, cls)
+        if isinstance(value, CompressedPayload):
+            value = value.load()
+            instance.__dict__[self.field.attname] = value
+        return value
+    
+    def __set__(self, instance, value):
+        # Defining __set__ makes this a data descriptor, so reads keep going
+        # through __get__ even though the value lives in the instance dict
+        instance.__dict__[self.field.attname] = value
+
+
+class CompressedJSONField(models.BinaryField):
+    """
+    JSON value stored as a zstd-compressed orjson blob.
+    
+    Intended for payloads that are written once and read back whole, never
+    filtered on by content.
+    """
+    
+    descriptor_class = CompressedJSONDescriptor
+    
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return CompressedPayload(value)
+    
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if value is None or isinstance(value, CompressedPayload):
+            return value
+        return CompressedPayload.from_value(value)
+    
+    def to_python(self, value):
+        if isinstance(value, CompressedPayload):
+            return value.load()
+        if isinstance(value, str):
+            # Serialized form produced by value_to_string
+            return orjson.loads(value)
+        return value
+    
+    def value_to_string(self, obj):
+        return orjson.dumps(self.value_from_object(obj)).decode()
+
+
+class OrjsonEncoder(json.JSONEncoder):
+    """JSON encoder class that serializes with orjson instead of the json module."""
+    
+    def encode(self, o):
+        return orjson.dumps(o, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class FastJSONField(models.JSONField):
+    """
+    JSONField that serializes and parses with orjson.
+    
+    Storage and lookups are unchanged; only the Python-side encoding and
+    decoding of column values is replaced.
+    """
+    
+    def __init__(self, *args, encoder=None, **kwargs):
+        super().__init__(*args, encoder=encoder or OrjsonEncoder, **kwargs)
+    
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if kwargs.get('encoder') is OrjsonEncoder:
+            del kwargs['encoder']
+        return name, path, args, kwargs
+    
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        # Some backends (SQLite at least) extract non-string values in their
+        # SQL datatypes
+        if isinstance(expression, KeyTransform) and not isinstance(value, str):
+            return value
+        if self.decoder is not None:
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
@@ -0,0 +1,263 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:07
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataSource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('source_type', models.CharField(choices=[('database', 'Database Connection'), ('api', 'REST API'), ('file', 'File Upload'), ('webhook', 'Webhook'), ('stream', 'Data Stream')], max_length=30)),
+                ('connection_config', models.JSONField(help_text='Connection parameters (encrypted for sensitive data)')),
+                ('auth_type', models.CharField(choices=[('none', 'No Authentication'), ('basic', 'Basic Auth'), ('token', 'API Token'), ('oauth', 'OAuth'), ('key', 'API Key')], default='none', max_length=20)),
+                ('credentials', models.JSONField(default=dict, help_text='Encrypted credentials')),
+                ('rate_limit', models.IntegerField(default=60, help_text='Requests per minute')),
+                ('retry_policy', models.JSONField(default=dict, help_text='Retry configuration')),
+                ('is_active', models.BooleanField(default=True)),
+                ('last_connected_at', models.DateTimeField(blank=True, null=True)),
+                ('connection_status', models.CharField(choices=[('unknown', 'Unknown'), ('connected', 'Connected'), ('failed', 'Connection Failed'), ('rate_limited', 'Rate Limited')], default='unknown', max_length=20)),
+                ('success_rate', models.DecimalField(decimal_places=2, default=100.0, max_digits=5)),
+                ('avg_response_time', models.IntegerField(default=0, help_text='Average response time in ms')),
+            ],
+            options={
+                'db_table': 'etl_data_sources',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ETLJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('description', models.TextField()),
+                ('job_type', models.CharField(choices=[('ingestion', 'Data Ingestion'), ('validation', 'Data Validation'), ('transformation', 'Data Transformation'), ('aggregation', 'Data Aggregation'), ('cleanup', 'Data Cleanup')], db_index=True, max_length=30)),
+                ('schedule_type', models.CharField(choices=[('manual', 'Manual'), ('interval', 'Interval-based'), ('cron', 'Cron-based'), ('event', 'Event-triggered')], default='manual', max_length=20)),
+                ('schedule_config', models.JSONField(default=dict, help_text='Cron expression or interval settings')),
+                ('source_config', models.JSONField(default=dict, help_text='Source connection and query config')),
+                ('target_config', models.JSONField(default=dict, help_text='Target connection and table config')),
+                ('transform_config', models.JSONField(default=dict, help_text='Transformation rules and settings')),
+                ('is_active', models.BooleanField(default=True)),
+                ('last_run_at', models.DateTimeField(blank=True, null=True)),
+                ('next_run_at', models.DateTimeField(blank=True, null=True)),
+                ('depends_on', models.ManyToManyField(blank=True, to='etl.etljob')),
+            ],
+            options={
+                'db_table': 'etl_jobs',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='RawEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('ingest_id', models.CharField(db_index=True, max_length=100, unique=True)),
+                ('source', models.CharField(db_index=True, max_length=50)),
+                ('batch_id', models.CharField(db_index=True, max_length=100)),
+                ('branch_id', models.IntegerField(blank=True, db_index=True, null=True)),
+                ('raw_payload', models.JSONField()),
+                ('validation_status', models.CharField(choices=[('pending', 'Pending Validation'), ('valid', 'Valid'), ('invalid', 'Invalid'), ('enriched', 'Valid and Enriched')], db_index=True, default='pending', max_length=20)),
+                ('validation_errors', models.JSONField(blank=True, default=dict)),
+                ('processed', models.BooleanField(db_index=True, default=False)),
+                ('processed_at', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('etl_run_id', models.CharField(blank=True, db_index=True, max_length=100, null=True)),
+                ('received_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('enriched_data', models.JSONField(blank=True, default=dict)),
+                ('retry_count', models.IntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'raw_events',
+                'ordering': ['-received_at'],
+                'indexes': [models.Index(fields=['source', 'batch_id'], name='raw_events_source_6c4db4_idx'), models.Index(fields=['validation_status', 'processed'], name='raw_events_validat_76c8b6_idx'), models.Index(fields=['received_at'], name='raw_events_receive_02fc18_idx'), models.Index(fields=['branch_id', 'received_at'], name='raw_events_branch__c49e18_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='RawError',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('ingest_id', models.CharField(db_index=True, max_length=100)),
+                ('source', models.CharField(db_index=True, max_length=50)),
+                ('batch_id', models.CharField(db_index=True, max_length=100)),
+                ('raw_payload', models.JSONField()),
+                ('error_type', models.CharField(db_index=True, max_length=50)),
+                ('error_message', models.TextField()),
+                ('error_details', models.JSONField(default=dict)),
+                ('failed_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('resolved', models.BooleanField(db_index=True, default=False)),
+                ('resolved_at', models.DateTimeField(blank=True, null=True)),
+                ('resolution_notes', models.TextField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'raw_errors',
+                'ordering': ['-failed_at'],
+                'indexes': [models.Index(fields=['source', 'error_type'], name='raw_errors_source_f01737_idx'), models.Index(fields=['failed_at'], name='raw_errors_failed__940a49_idx'), models.Index(fields=['resolved'], name='raw_errors_resolve_ff645d_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ETLRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('run_id', models.UUIDField(db_index=True, default=uuid.uuid4, unique=True)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('success', 'Success'), ('failed', 'Failed'), ('cancelled', 'Cancelled'), ('retrying', 'Retrying')], db_index=True, default='queued', max_length=20)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('duration_seconds', models.IntegerField(blank=True, null=True)),
+                ('rows_processed', models.BigIntegerField(default=0)),
+                ('rows_inserted', models.BigIntegerField(default=0)),
+                ('rows_updated', models.BigIntegerField(default=0)),
+                ('rows_failed', models.BigIntegerField(default=0)),
+                ('rows_skipped', models.BigIntegerField(default=0)),
+                ('error_message', models.TextField(blank=True, null=True)),
+                ('log_messages', models.JSONField(default=list)),
+                ('config_snapshot', models.JSONField(default=dict, help_text='Job config at time of execution')),
+                ('source_batches', models.JSONField(default=list, help_text='List of source batch IDs processed')),
+                ('checkpoint_before', models.JSONField(default=dict, help_text='Checkpoint before run')),
+                ('checkpoint_after', models.JSONField(default=dict, help_text='Checkpoint after run')),
+                ('trigger_reason', models.CharField(blank=True, max_length=200, null=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='runs', to='etl.etljob')),
+                ('triggered_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'etl_runs',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ETLAlert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('alert_type', models.CharField(choices=[('job_failure', 'Job Failure'), ('high_error_rate', 'High Error Rate'), ('queue_backlog', 'Queue Backlog'), ('data_quality', 'Data Quality Issue'), ('connection_failure', 'Connection Failure'), ('performance', 'Performance Issue')], db_index=True, max_length=30)),
+                ('severity', models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High'), ('critical', 'Critical')], db_index=True, default='medium', max_length=20)),
+                ('status', models.CharField(choices=[('active', 'Active'), ('acknowledged', 'Acknowledged'), ('resolved', 'Resolved'), ('suppressed', 'Suppressed')], db_index=True, default='active', max_length=20)),
+                ('title', models.CharField(max_length=200)),
+                ('message', models.TextField()),
+                ('context', models.JSONField(default=dict)),
+                ('acknowledged_at', models.DateTimeField(blank=True, null=True)),
+                ('resolved_at', models.DateTimeField(blank=True, null=True)),
+                ('resolution_notes', models.TextField(blank=True, null=True)),
+                ('notifications_sent', models.JSONField(default=list, help_text='List of sent notifications')),
+                ('acknowledged_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+                ('job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='etl.etljob')),
+                ('run', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='etl.etlrun')),
+                ('source', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='etl.datasource')),
+            ],
+            options={
+                'db_table': 'etl_alerts',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Checkpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('source', models.CharField(db_index=True, max_length=50)),
+                ('checkpoint_type', models.CharField(choices=[('timestamp', 'Timestamp-based'), ('cursor', 'Cursor/ID-based'), ('batch', 'Batch-based'), ('sequence', 'Sequence number')], max_length=20)),
+                ('checkpoint_value', models.TextField(help_text='Timestamp, ID, or other checkpoint identifier')),
+                ('checkpoint_data', models.JSONField(default=dict, help_text='Additional checkpoint metadata')),
+                ('rows_processed_total', models.BigIntegerField(default=0)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='checkpoints', to='etl.etljob')),
+                ('last_run', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='etl.etlrun')),
+            ],
+            options={
+                'db_table': 'etl_checkpoints',
+            },
+        ),
+        migrations.CreateModel(
+            name='AuditLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('event_type', models.CharField(choices=[('data_ingested', 'Data Ingested'), ('data_validated', 'Data Validated'), ('data_transformed', 'Data Transformed'), ('data_aggregated', 'Data Aggregated'), ('job_started', 'Job Started'), ('job_completed', 'Job Completed'), ('job_failed', 'Job Failed'), ('config_changed', 'Configuration Changed')], db_index=True, max_length=50)),
+                ('message', models.TextField()),
+                ('details', models.JSONField(default=dict)),
+                ('source_table', models.CharField(blank=True, max_length=100, null=True)),
+                ('target_table', models.CharField(blank=True, max_length=100, null=True)),
+                ('affected_rows', models.BigIntegerField(blank=True, null=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True, null=True)),
+                ('job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='etl.etljob')),
+                ('run', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='etl.etlrun')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'etl_audit_log',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='etlrun',
+            index=models.Index(fields=['job', 'status'], name='etl_runs_job_id_1935c7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='etlrun',
+            index=models.Index(fields=['started_at'], name='etl_runs_started_41a31e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='etlrun',
+            index=models.Index(fields=['status', 'created_at'], name='etl_runs_status_1bc8fc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='etlalert',
+            index=models.Index(fields=['alert_type', 'severity'], name='etl_alerts_alert_t_aa36fd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='etlalert',
+            index=models.Index(fields=['status', 'created_at'], name='etl_alerts_status_d1a793_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='etlalert',
+            index=models.Index(fields=['job', 'status'], name='etl_alerts_job_id_5cc5c5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='checkpoint',
+            index=models.Index(fields=['job', 'source'], name='etl_checkpo_job_id_ecb44b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='checkpoint',
+            index=models.Index(fields=['updated_at'], name='etl_checkpo_updated_ee4a41_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='checkpoint',
+            unique_together={('job', 'source')},
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['event_type', 'created_at'], name='etl_audit_l_event_t_a968ed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['job', 'created_at'], name='etl_audit_l_job_id_19de04_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['user', 'created_at'], name='etl_audit_l_user_id_8dc4da_idx'),
+        ),
+    ]
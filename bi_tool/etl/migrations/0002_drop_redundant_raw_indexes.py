@@ -0,0 +1,53 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='rawerror',
+            name='failed_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='rawerror',
+            name='resolved',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name='rawerror',
+            name='source',
+            field=models.CharField(max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='rawevent',
+            name='branch_id',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='rawevent',
+            name='processed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name='rawevent',
+            name='received_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='rawevent',
+            name='source',
+            field=models.CharField(max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='rawevent',
+            name='validation_status',
+            field=models.CharField(choices=[('pending', 'Pending Validation'), ('valid', 'Valid'), ('invalid', 'Invalid'), ('enriched', 'Valid and Enriched')], default='pending', max_length=20),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0002_drop_redundant_raw_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rawevent',
+            index=models.Index(condition=models.Q(('processed', False)), fields=['received_at'], name='unprocessed_by_time'),
+        ),
+    ]
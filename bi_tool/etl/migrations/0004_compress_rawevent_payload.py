@@ -0,0 +1,66 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:20
+
+from django.db import migrations, models
+import etl.fields
+
+
+def compress_payloads(apps, schema_editor):
+    RawEvent = apps.get_model('etl', 'RawEvent')
+    batch = []
+    for event in RawEvent.objects.only('id', 'raw_payload').iterator(chunk_size=1000):
+        event.raw_payload_compressed = event.raw_payload
+        batch.append(event)
+        if len(batch) >= 1000:
+            RawEvent.objects.bulk_update(batch, ['raw_payload_compressed'])
+            batch = []
+    if batch:
+        RawEvent.objects.bulk_update(batch, ['raw_payload_compressed'])
+
+
+def decompress_payloads(apps, schema_editor):
+    RawEvent = apps.get_model('etl', 'RawEvent')
+    batch = []
+    for event in RawEvent.objects.only('id', 'raw_payload_compressed').iterator(chunk_size=1000):
+        event.raw_payload = event.raw_payload_compressed
+        batch.append(event)
+        if len(batch) >= 1000:
+            RawEvent.objects.bulk_update(batch, ['raw_payload'])
+            batch = []
+    if batch:
+        RawEvent.objects.bulk_update(batch, ['raw_payload'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0003_rawevent_unprocessed_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rawevent',
+            name='raw_payload_compressed',
+            field=etl.fields.CompressedJSONField(null=True),
+        ),
+        # Nullable so the column can be re-added and refilled when reversing
+        migrations.AlterField(
+            model_name='rawevent',
+            name='raw_payload',
+            field=models.JSONField(null=True),
+        ),
+        migrations.RunPython(compress_payloads, decompress_payloads),
+        migrations.RemoveField(
+            model_name='rawevent',
+            name='raw_payload',
+        ),
+        migrations.RenameField(
+            model_name='rawevent',
+            old_name='raw_payload_compressed',
+            new_name='raw_payload',
+        ),
+        migrations.AlterField(
+            model_name='rawevent',
+            name='raw_payload',
+            field=etl.fields.CompressedJSONField(),
+        ),
+    ]
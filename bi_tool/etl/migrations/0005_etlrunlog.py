@@ -0,0 +1,64 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+import json
+
+
+def move_log_messages(apps, schema_editor):
+    ETLRun = apps.get_model('etl', 'ETLRun')
+    ETLRunLog = apps.get_model('etl', 'ETLRunLog')
+    logs = []
+    for run in ETLRun.objects.exclude(log_messages=[]).only('run_id', 'log_messages').iterator():
+        for entry in run.log_messages or []:
+            if isinstance(entry, dict):
+                message = entry.get('message', json.dumps(entry, default=str))
+                level = entry.get('level', 'info')
+            else:
+                message, level = str(entry), 'info'
+            logs.append(ETLRunLog(run_id=run.run_id, message=message, level=level))
+        if len(logs) >= 1000:
+            ETLRunLog.objects.bulk_create(logs)
+            logs = []
+    ETLRunLog.objects.bulk_create(logs)
+
+
+def restore_log_messages(apps, schema_editor):
+    ETLRun = apps.get_model('etl', 'ETLRun')
+    ETLRunLog = apps.get_model('etl', 'ETLRunLog')
+    for run in ETLRun.objects.filter(logs__isnull=False).distinct().iterator():
+        run.log_messages = [
+            {'level': log.level, 'message': log.message}
+            for log in ETLRunLog.objects.filter(run_id=run.run_id).order_by('created_at', 'id')
+        ]
+        run.save(update_fields=['log_messages'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0004_compress_rawevent_payload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ETLRunLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('level', models.CharField(choices=[('debug', 'Debug'), ('info', 'Info'), ('warning', 'Warning'), ('error', 'Error')], default='info', max_length=10)),
+                ('message', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('run', models.ForeignKey(db_column='run_id', on_delete=django.db.models.deletion.CASCADE, related_name='logs', to='etl.etlrun', to_field='run_id')),
+            ],
+            options={
+                'db_table': 'etl_run_logs',
+                'ordering': ['created_at', 'id'],
+                'indexes': [models.Index(fields=['run', 'created_at'], name='etl_run_log_run_id_128e16_idx')],
+            },
+        ),
+        migrations.RunPython(move_log_messages, restore_log_messages),
+        migrations.RemoveField(
+            model_name='etlrun',
+            name='log_messages',
+        ),
+    ]
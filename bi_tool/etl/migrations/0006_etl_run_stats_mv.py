@@ -0,0 +1,62 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:11
+
+from django.db import migrations, models
+
+
+CREATE_VIEW = """
+CREATE MATERIALIZED VIEW etl_run_stats_mv AS
+SELECT
+    row_number() OVER (ORDER BY job_id, date_trunc('hour', created_at)) AS id,
+    job_id,
+    date_trunc('hour', created_at) AS bucket,
+    count(*) AS runs,
+    sum(rows_processed) AS processed,
+    sum(rows_failed) AS failed,
+    COALESCE(
+        100.0 * sum(rows_processed - rows_failed) / NULLIF(sum(rows_processed), 0),
+        0
+    )::float AS success_rate
+FROM etl_runs
+GROUP BY job_id, date_trunc('hour', created_at);
+
+CREATE UNIQUE INDEX etl_run_stats_mv_job_bucket ON etl_run_stats_mv (job_id, bucket);
+"""
+
+DROP_VIEW = "DROP MATERIALIZED VIEW IF EXISTS etl_run_stats_mv;"
+
+
+def create_view(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_VIEW)
+
+
+def drop_view(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_VIEW)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0005_etlrunlog'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_view, drop_view),
+        migrations.CreateModel(
+            name='ETLRunStats',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('bucket', models.DateTimeField()),
+                ('runs', models.BigIntegerField()),
+                ('processed', models.BigIntegerField()),
+                ('failed', models.BigIntegerField()),
+                ('success_rate', models.FloatField()),
+            ],
+            options={
+                'db_table': 'etl_run_stats_mv',
+                'ordering': ['-bucket'],
+                'managed': False,
+            },
+        ),
+    ]
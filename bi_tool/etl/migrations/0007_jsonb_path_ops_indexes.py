@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:12
+
+from django.db import migrations, models
+import django.db.models.fields.json
+
+
+# jsonb_path_ops GIN indexes serve `field__contains={...}` (the @> operator)
+GIN_INDEXES = [
+    ('etl_alerts_context_gin', 'etl_alerts', 'context'),
+    ('etl_audit_log_details_gin', 'etl_audit_log', 'details'),
+    ('etl_data_sources_connection_config_gin', 'etl_data_sources', 'connection_config'),
+]
+
+
+def create_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in GIN_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} jsonb_path_ops)"
+        )
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in GIN_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0006_etl_run_stats_mv'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_indexes, drop_gin_indexes),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(django.db.models.fields.json.KeyTextTransform('batch_id', 'details'), name='audit_details_batch_id'),
+        ),
+    ]
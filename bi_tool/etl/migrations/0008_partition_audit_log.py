@@ -0,0 +1,104 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:30
+
+from datetime import date
+
+from django.db import migrations
+
+from etl.partitions import (
+    AUDIT_LOG_TABLE, MONTHS_AHEAD, add_months, create_month_partitions, default_partition_name
+)
+
+
+def _create_indexes_and_constraints(schema_editor, model):
+    """
+    Recreate the model's indexes and foreign keys on the rebuilt table.
+
+    CREATE TABLE ... (LIKE ...) copies neither, nor the details GIN index
+    created with raw SQL in 0007.
+    """
+    table = model._meta.db_table
+    for field in model._meta.local_fields:
+        if field.db_index and not field.unique:
+            schema_editor.execute(f"CREATE INDEX {table}_{field.column}_idx ON {table} ({field.column})")
+        if field.remote_field and field.db_constraint:
+            target = field.target_field
+            schema_editor.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_{field.column}_fk "
+                f"FOREIGN KEY ({field.column}) REFERENCES {target.model._meta.db_table} ({target.column}) "
+                f"DEFERRABLE INITIALLY DEFERRED"
+            )
+    for index in model._meta.indexes:
+        schema_editor.add_index(model, index)
+    schema_editor.execute(
+        f"CREATE INDEX etl_audit_log_details_gin ON {table} USING gin (details jsonb_path_ops)"
+    )
+
+
+def partition_audit_log(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    AuditLog = apps.get_model('etl', 'AuditLog')
+    table = AUDIT_LOG_TABLE
+    old_table = f"{table}_unpartitioned"
+
+    schema_editor.execute(f"ALTER TABLE {table} RENAME TO {old_table}")
+    schema_editor.execute(
+        f"CREATE TABLE {table} (LIKE {old_table}) PARTITION BY RANGE (created_at)"
+    )
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"SELECT min(created_at) FROM {old_table}")
+        oldest = cursor.fetchone()[0]
+    today = date.today()
+    start = oldest.date() if oldest else today
+    create_month_partitions(schema_editor.connection, table, start, add_months(today, MONTHS_AHEAD))
+    # Catches inserts past the last monthly partition if maintenance stops running
+    schema_editor.execute(f"CREATE TABLE {default_partition_name(table)} PARTITION OF {table} DEFAULT")
+
+    schema_editor.execute(f"INSERT INTO {table} SELECT * FROM {old_table}")
+    schema_editor.execute(f"DROP TABLE {old_table}")
+
+    # The partition key has to be part of the primary key
+    schema_editor.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)")
+    schema_editor.execute(f"CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    schema_editor.execute(
+        f"SELECT setval('{table}_id_seq', COALESCE((SELECT max(id) FROM {table}), 0) + 1, false)"
+    )
+    schema_editor.execute(
+        f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')"
+    )
+    _create_indexes_and_constraints(schema_editor, AuditLog)
+
+
+def unpartition_audit_log(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    AuditLog = apps.get_model('etl', 'AuditLog')
+    table = AUDIT_LOG_TABLE
+    partitioned_table = f"{table}_partitioned"
+
+    schema_editor.execute(f"ALTER TABLE {table} RENAME TO {partitioned_table}")
+    schema_editor.execute(f"CREATE TABLE {table} (LIKE {partitioned_table})")
+    schema_editor.execute(f"INSERT INTO {table} SELECT * FROM {partitioned_table}")
+    schema_editor.execute(f"DROP TABLE {partitioned_table}")
+
+    schema_editor.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+    schema_editor.execute(f"ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+    schema_editor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+        f"COALESCE((SELECT max(id) FROM {table}), 0) + 1, false)"
+    )
+    _create_indexes_and_constraints(schema_editor, AuditLog)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0007_jsonb_path_ops_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_audit_log, unpartition_audit_log),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:40
+
+import hashlib
+
+from django.db import migrations, models
+import orjson
+
+
+SNAPSHOT_FIELDS = ['config_snapshot', 'checkpoint_before', 'checkpoint_after']
+
+
+def move_snapshots_to_blobs(apps, schema_editor):
+    ETLRun = apps.get_model('etl', 'ETLRun')
+    ETLConfigBlob = apps.get_model('etl', 'ETLConfigBlob')
+    hash_fields = [f"{field}_hash" for field in SNAPSHOT_FIELDS]
+    blobs = {}
+    batch = []
+    for run in ETLRun.objects.only('id', *SNAPSHOT_FIELDS).iterator(chunk_size=1000):
+        for field in SNAPSHOT_FIELDS:
+            payload = orjson.dumps(getattr(run, field), option=orjson.OPT_SORT_KEYS, default=str)
+            digest = hashlib.sha256(payload).hexdigest()
+            blobs.setdefault(digest, payload)
+            setattr(run, f"{field}_hash", digest)
+        batch.append(run)
+        if len(batch) >= 1000:
+            ETLRun.objects.bulk_update(batch, hash_fields)
+            batch = []
+    if batch:
+        ETLRun.objects.bulk_update(batch, hash_fields)
+    ETLConfigBlob.objects.bulk_create(
+        [ETLConfigBlob(hash=digest, blob=orjson.loads(payload)) for digest, payload in blobs.items()],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+def inline_snapshots(apps, schema_editor):
+    ETLRun = apps.get_model('etl', 'ETLRun')
+    ETLConfigBlob = apps.get_model('etl', 'ETLConfigBlob')
+    blobs = dict(ETLConfigBlob.objects.values_list('hash', 'blob'))
+    batch = []
+    for run in ETLRun.objects.iterator(chunk_size=1000):
+        for field in SNAPSHOT_FIELDS:
+            setattr(run, field, blobs.get(getattr(run, f"{field}_hash"), {}))
+        batch.append(run)
+        if len(batch) >= 1000:
+            ETLRun.objects.bulk_update(batch, SNAPSHOT_FIELDS)
+            batch = []
+    if batch:
+        ETLRun.objects.bulk_update(batch, SNAPSHOT_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0008_partition_audit_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ETLConfigBlob',
+            fields=[
+                ('hash', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('blob', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'etl_config_blobs',
+            },
+        ),
+        migrations.AddField(
+            model_name='etlrun',
+            name='config_snapshot_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='etlrun',
+            name='checkpoint_before_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='etlrun',
+            name='checkpoint_after_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.RunPython(move_snapshots_to_blobs, inline_snapshots),
+        migrations.RemoveField(
+            model_name='etlrun',
+            name='config_snapshot',
+        ),
+        migrations.RemoveField(
+            model_name='etlrun',
+            name='checkpoint_before',
+        ),
+        migrations.RemoveField(
+            model_name='etlrun',
+            name='checkpoint_after',
+        ),
+    ]
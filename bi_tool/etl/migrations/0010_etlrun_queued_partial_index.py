@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0009_etlconfigblob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='etlrun',
+            index=models.Index(condition=models.Q(('status', 'queued')), fields=['job', 'created_at'], name='etl_runs_queued'),
+        ),
+    ]
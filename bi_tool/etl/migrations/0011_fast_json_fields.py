@@ -0,0 +1,99 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:18
+
+from django.db import migrations
+import etl.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0010_etlrun_queued_partial_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='details',
+            field=etl.fields.FastJSONField(default=dict),
+        ),
+        migrations.AlterField(
+            model_name='checkpoint',
+            name='checkpoint_data',
+            field=etl.fields.FastJSONField(default=dict, help_text='Additional checkpoint metadata'),
+        ),
+        migrations.AlterField(
+            model_name='datasource',
+            name='connection_config',
+            field=etl.fields.FastJSONField(help_text='Connection parameters (encrypted for sensitive data)'),
+        ),
+        migrations.AlterField(
+            model_name='datasource',
+            name='credentials',
+            field=etl.fields.FastJSONField(default=dict, help_text='Encrypted credentials'),
+        ),
+        migrations.AlterField(
+            model_name='datasource',
+            name='retry_policy',
+            field=etl.fields.FastJSONField(default=dict, help_text='Retry configuration'),
+        ),
+        migrations.AlterField(
+            model_name='etlalert',
+            name='context',
+            field=etl.fields.FastJSONField(default=dict),
+        ),
+        migrations.AlterField(
+            model_name='etlalert',
+            name='notifications_sent',
+            field=etl.fields.FastJSONField(default=list, help_text='List of sent notifications'),
+        ),
+        migrations.AlterField(
+            model_name='etlconfigblob',
+            name='blob',
+            field=etl.fields.FastJSONField(),
+        ),
+        migrations.AlterField(
+            model_name='etljob',
+            name='schedule_config',
+            field=etl.fields.FastJSONField(default=dict, help_text='Cron expression or interval settings'),
+        ),
+        migrations.AlterField(
+            model_name='etljob',
+            name='source_config',
+            field=etl.fields.FastJSONField(default=dict, help_text='Source connection and query config'),
+        ),
+        migrations.AlterField(
+            model_name='etljob',
+            name='target_config',
+            field=etl.fields.FastJSONField(default=dict, help_text='Target connection and table config'),
+        ),
+        migrations.AlterField(
+            model_name='etljob',
+            name='transform_config',
+            field=etl.fields.FastJSONField(default=dict, help_text='Transformation rules and settings'),
+        ),
+        migrations.AlterField(
+            model_name='etlrun',
+            name='source_batches',
+            field=etl.fields.FastJSONField(default=list, help_text='List of source batch IDs processed'),
+        ),
+        migrations.AlterField(
+            model_name='rawerror',
+            name='error_details',
+            field=etl.fields.FastJSONField(default=dict),
+        ),
+        migrations.AlterField(
+            model_name='rawerror',
+            name='raw_payload',
+            field=etl.fields.FastJSONField(),
+        ),
+        migrations.AlterField(
+            model_name='rawevent',
+            name='enriched_data',
+            field=etl.fields.FastJSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='rawevent',
+            name='validation_errors',
+            field=etl.fields.FastJSONField(blank=True, default=dict),
+        ),
+    ]
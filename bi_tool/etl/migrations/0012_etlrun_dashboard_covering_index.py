@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0011_fast_json_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='etlrun',
+            index=models.Index(fields=['job', 'status', '-created_at'], include=('rows_processed', 'rows_failed', 'duration_seconds'), name='etl_runs_dash'),
+        ),
+        # Superseded by the leading columns of etl_runs_dash
+        migrations.RemoveIndex(
+            model_name='etlrun',
+            name='etl_runs_job_id_1935c7_idx',
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:21
+
+from django.db import migrations, models
+
+
+def create_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS etl_audit_log_ct_brin ON etl_audit_log "
+        "USING brin (created_at) WITH (pages_per_range = 32)"
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS etl_audit_log_ct_brin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0012_etlrun_dashboard_covering_index'),
+    ]
+
+    operations = [
+        # BRIN replaces the B-tree on created_at; rows arrive in time order
+        migrations.RunPython(create_brin_index, drop_brin_index),
+        migrations.AlterField(
+            model_name='auditlog',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['source_table', '-created_at'], name='etl_audit_log_src'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Each job paired with itself and every job it depends on, at any depth.
+# UNION (not UNION ALL) discards repeated pairs, so dependency cycles terminate.
+CREATE_VIEW = """
+CREATE MATERIALIZED VIEW etl_job_closure_mv AS
+WITH RECURSIVE closure (job_id, dependency_id) AS (
+    SELECT id, id FROM etl_jobs
+    UNION
+    SELECT closure.job_id, d.to_etljob_id
+    FROM closure
+    JOIN etl_jobs_depends_on d ON d.from_etljob_id = closure.dependency_id
+)
+SELECT
+    row_number() OVER (ORDER BY job_id, dependency_id) AS id,
+    job_id,
+    dependency_id
+FROM closure;
+
+CREATE UNIQUE INDEX etl_job_closure_mv_job_dependency ON etl_job_closure_mv (job_id, dependency_id);
+"""
+
+DROP_VIEW = "DROP MATERIALIZED VIEW IF EXISTS etl_job_closure_mv;"
+
+
+def create_view(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_VIEW)
+
+
+def drop_view(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_VIEW)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0013_auditlog_brin_created_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_view, drop_view),
+        migrations.CreateModel(
+            name='ETLJobClosure',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('dependency', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='etl.etljob')),
+                ('job', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='etl.etljob')),
+            ],
+            options={
+                'db_table': 'etl_job_closure_mv',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-17 07:00
+
+from django.db import migrations
+
+
+def store_payload_out_of_line(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    # EXTERNAL moves wide payloads to the TOAST table without recompressing
+    # them (they are already zstd blobs); the low tuple target moves them
+    # out as soon as a row is toasted, leaving only metadata in the heap
+    schema_editor.execute("ALTER TABLE raw_events ALTER COLUMN raw_payload SET STORAGE EXTERNAL")
+    schema_editor.execute("ALTER TABLE raw_events SET (toast_tuple_target = 128)")
+
+
+def store_payload_inline(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("ALTER TABLE raw_events ALTER COLUMN raw_payload SET STORAGE EXTENDED")
+    schema_editor.execute("ALTER TABLE raw_events RESET (toast_tuple_target)")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0014_etl_job_closure_mv'),
+    ]
+
+    operations = [
+        migrations.RunPython(store_payload_out_of_line, store_payload_inline),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:23
+
+from django.db import migrations, models
+
+from etl.fields import payload_digest
+
+
+def backfill_payload_sha(apps, schema_editor):
+    RawEvent = apps.get_model('etl', 'RawEvent')
+    # Only the first event with a given payload gets the digest; later
+    # duplicates keep NULL, which the unique index allows
+    seen = set()
+    batch = []
+    for event in RawEvent.objects.only('id', 'raw_payload').order_by('id').iterator(chunk_size=1000):
+        digest = payload_digest(event.raw_payload)
+        if digest in seen:
+            continue
+        seen.add(digest)
+        event.payload_sha = digest
+        batch.append(event)
+        if len(batch) >= 1000:
+            RawEvent.objects.bulk_update(batch, ['payload_sha'])
+            batch = []
+    if batch:
+        RawEvent.objects.bulk_update(batch, ['payload_sha'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0015_rawevent_payload_out_of_line'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rawevent',
+            name='payload_sha',
+            field=models.BinaryField(max_length=32, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_payload_sha, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0016_rawevent_payload_sha'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rawevent',
+            index=models.Index(fields=['batch_id', 'validation_status'], name='raw_events_batch_status'),
+        ),
+        migrations.AlterField(
+            model_name='rawevent',
+            name='batch_id',
+            field=models.CharField(max_length=100),
+        ),
+    ]
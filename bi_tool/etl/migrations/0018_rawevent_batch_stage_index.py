@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0017_rawevent_batch_status_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rawevent',
+            index=models.Index(fields=['batch_id', 'validation_status', 'processed'], name='raw_events_batch_stage'),
+        ),
+        migrations.RemoveIndex(
+            model_name='rawevent',
+            name='raw_events_batch_status',
+        ),
+    ]
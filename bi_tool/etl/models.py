@@ -2,12 +2,20 @@
 ETL Models for Data Ingestion, Processing, and Monitoring
 """
 
+import hashlib
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
-from django.db import models
+import orjson
+from django.db import connection, connections, models, router, transaction
+from django.db.models.constants import OnConflict
+from django.db.models.sql import InsertQuery
+from django.db.models.fields.json import KeyTextTransform
 from django.contrib.auth.models import User
+from django.utils import timezone
+
+from .fields import CompressedJSONField, FastJSONField, payload_digest
 
 
 class TimestampedModel(models.Model):
@@ -19,6 +27,132 @@ class TimestampedModel(models.Model):
         abstract = True
 
 
+def _dedup_keys(event) -> tuple:
+    """Keys identifying a raw event for duplicate filtering: ingest_id and payload digest."""
+    return (f"id:{event.ingest_id}", f"sha:{event.payload_sha.hex()}")
+
+
+class RawEventManager(models.Manager):
+    """Manager with a batched write path for ingestion."""
+    
+    def insert_many(self, events, batch_size: int = 1000, dedup_filter=None) -> int:
+        """
+        Insert unsaved events in multi-row INSERTs, skipping duplicates.
+        
+        Events whose ingest_id or payload content already exists (or repeats
+        within ``events``) are dropped instead of failing the batch,
+        mirroring an unordered bulk write.
+        
+        Args:
+            events: Unsaved RawEvent instances
+            batch_size: Rows per INSERT statement
+            dedup_filter: Optional Bloom filter (see etl.utils.bloom.BloomDedup);
+                events it reports as definitely new skip the duplicate lookup
+        
+        Returns:
+            Number of events inserted, not counting rows another writer
+            inserted first
+        """
+        inserted = 0
+        
+        for start in range(0, len(events), batch_size):
+            chunk = {}
+            by_digest = {}
+            for event in events[start:start + batch_size]:
+                if event.payload_sha is None:
+                    event.payload_sha = payload_digest(event.raw_payload)
+                if event.ingest_id not in chunk and event.payload_sha not in by_digest:
+                    chunk[event.ingest_id] = by_digest[event.payload_sha] = event
+            
+            to_check = list(chunk.values())
+            if dedup_filter is not None:
+                flags = dedup_filter.might_contain_many(
+                    [key for event in to_check for key in _dedup_keys(event)]
+                )
+                # An event is new for sure only if neither of its keys was ever added
+                to_check = [
+                    event for index, event in enumerate(to_check)
+                    if flags[2 * index] or flags[2 * index + 1]
+                ]
+            
+            existing = []
+            if to_check:
+                existing = self.filter(
+                    models.Q(ingest_id__in=[event.ingest_id for event in to_check]) |
+                    models.Q(payload_sha__in=[event.payload_sha for event in to_check])
+                ).values_list('ingest_id', 'payload_sha')
+            existing_ids = set()
+            existing_digests = set()
+            for ingest_id, digest in existing:
+                existing_ids.add(ingest_id)
+                if digest is not None:
+                    existing_digests.add(bytes(digest))
+            new_events = [
+                event for ingest_id, event in chunk.items()
+                if ingest_id not in existing_ids and event.payload_sha not in existing_digests
+            ]
+            
+            # Conflicts are rows inserted concurrently since the lookup, or
+            # duplicates the Bloom filter let skip it (e.g. after Redis lost keys)
+            inserted += self._insert_ignoring_conflicts(new_events)
+            if dedup_filter is not None:
+                dedup_filter.add_many([key for event in new_events for key in _dedup_keys(event)])
+        
+        return inserted
+    
+    def _insert_ignoring_conflicts(self, events) -> int:
+        """
+        INSERT events in one statement, skipping conflicting rows.
+        
+        Runs INSERT ... ON CONFLICT DO NOTHING RETURNING id, so the count is
+        of rows actually written; bulk_create(ignore_conflicts=True) cannot
+        tell how many rows it skipped.
+        
+        Returns:
+            Number of rows written
+        """
+        if not events:
+            return 0
+        
+        if not connections[self.db].features.can_return_rows_from_bulk_insert:
+            self.bulk_create(events, ignore_conflicts=True)
+            return len(events)
+        
+        fields = [field for field in self.model._meta.concrete_fields if not field.primary_key]
+        query = InsertQuery(self.model, on_conflict=OnConflict.IGNORE)
+        query.insert_values(fields, events)
+        rows = query.get_compiler(using=self.db).execute_sql(returning_fields=[self.model._meta.pk])
+        # A single-row INSERT that conflicted returns [None]
+        return sum(1 for row in rows if row)
+    
+    def unprocessed(self):
+        """Events still waiting for processing, oldest first (served by the partial index)."""
+        return self.filter(processed=False).order_by('received_at')
+    
+    def increment_retry(self, event_ids) -> int:
+        """Bump retry_count on the given events in one atomic UPDATE."""
+        return self.filter(id__in=event_ids).update(retry_count=models.F('retry_count') + 1)
+
+
+class AuditLogManager(models.Manager):
+    """Manager with a batched write path for audit events."""
+    
+    def log_many(self, entries, batch_size: int = 1000) -> int:
+        """
+        Insert audit events in multi-row INSERTs.
+        
+        Args:
+            entries: Unsaved AuditLog instances or dicts of AuditLog field values
+            batch_size: Rows per INSERT statement
+        
+        Returns:
+            Number of audit events written
+        """
+        logs = [entry if isinstance(entry, self.model) else self.model(**entry) for entry in entries]
+        self.bulk_create(logs, batch_size=batch_size)
+        return len(logs)
+
+
 # Standard Django Models for Raw Data (moved from MongoDB to PostgreSQL)
 class RawEvent(TimestampedModel):
     """
@@ -29,12 +163,14 @@ class RawEvent(TimestampedModel):
     ingest_id = models.CharField(max_length=100, unique=True, db_index=True)
     
     # Source information
-    source = models.CharField(max_length=50, db_index=True)  # 'pos', 'csv_upload', 'api', 'stripe', etc.
-    batch_id = models.CharField(max_length=100, db_index=True)
-    branch_id = models.IntegerField(null=True, blank=True, db_index=True)
+    source = models.CharField(max_length=50)  # 'pos', 'csv_upload', 'api', 'stripe', etc.
+    batch_id = models.CharField(max_length=100)
+    branch_id = models.IntegerField(null=True, blank=True)
     
-    # Raw payload
-    raw_payload = models.JSONField()
+    # Raw payload, stored compressed; it is replayed whole, never queried by content
+    raw_payload = CompressedJSONField()
+    # SHA-256 of the payload (see payload_digest); the same payload is stored once
+    payload_sha = models.BinaryField(max_length=32, unique=True, null=True)
     
     # Processing metadata
     validation_status = models.CharField(
@@ -45,34 +181,44 @@ class RawEvent(TimestampedModel):
             ('invalid', 'Invalid'),
             ('enriched', 'Valid and Enriched')
         ],
-        default='pending',
-        db_index=True
+        default='pending'
     )
-    validation_errors = models.JSONField(default=dict, blank=True)
+    validation_errors = FastJSONField(default=dict, blank=True)
     
     # Processing flags
-    processed = models.BooleanField(default=False, db_index=True)
+    processed = models.BooleanField(default=False)
     processed_at = models.DateTimeField(null=True, blank=True, db_index=True)
     etl_run_id = models.CharField(max_length=100, null=True, blank=True, db_index=True)
     
     # Timestamps
-    received_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    received_at = models.DateTimeField(auto_now_add=True)
     
     # Enrichment data
-    enriched_data = models.JSONField(default=dict, blank=True)
+    enriched_data = FastJSONField(default=dict, blank=True)
     
     # Retry and error tracking
     retry_count = models.IntegerField(default=0)
     last_error = models.TextField(null=True, blank=True)
     
+    objects = RawEventManager()
+    
     class Meta:
         db_table = 'raw_events'
         ordering = ['-received_at']
         indexes = [
             models.Index(fields=['source', 'batch_id']),
+            # Every pipeline stage selects one batch in one status (aggregation
+            # also by processed); the index also serves lookups by batch_id alone
+            models.Index(fields=['batch_id', 'validation_status', 'processed'], name='raw_events_batch_stage'),
             models.Index(fields=['validation_status', 'processed']),
             models.Index(fields=['received_at']),
             models.Index(fields=['branch_id', 'received_at']),
+            # Only the unprocessed backlog is indexed, so it stays small as the table grows
+            models.Index(
+                fields=['received_at'],
+                name='unprocessed_by_time',
+                condition=models.Q(processed=False)
+            ),
         ]
 
     def __str__(self):
@@ -84,18 +230,18 @@ class RawError(TimestampedModel):
     Invalid or failed raw events for audit and debugging.
     """
     ingest_id = models.CharField(max_length=100, db_index=True)
-    source = models.CharField(max_length=50, db_index=True)
+    source = models.CharField(max_length=50)
     batch_id = models.CharField(max_length=100, db_index=True)
     
     # Original payload and error details
-    raw_payload = models.JSONField()
+    raw_payload = FastJSONField()
     error_type = models.CharField(max_length=50, db_index=True)  # 'validation', 'schema', 'processing'
     error_message = models.TextField()
-    error_details = models.JSONField(default=dict)
+    error_details = FastJSONField(default=dict)
     
     # Metadata
-    failed_at = models.DateTimeField(auto_now_add=True, db_index=True)
-    resolved = models.BooleanField(default=False, db_index=True)
+    failed_at = models.DateTimeField(auto_now_add=True)
+    resolved = models.BooleanField(default=False)
     resolved_at = models.DateTimeField(null=True, blank=True)
     resolution_notes = models.TextField(null=True, blank=True)
     
@@ -139,12 +285,12 @@ class ETLJob(TimestampedModel):
         ],
         default='manual'
     )
-    schedule_config = models.JSONField(default=dict, help_text="Cron expression or interval settings")
+    schedule_config = FastJSONField(default=dict, help_text="Cron expression or interval settings")
     
     # Configuration
-    source_config = models.JSONField(default=dict, help_text="Source connection and query config")
-    target_config = models.JSONField(default=dict, help_text="Target connection and table config")
-    transform_config = models.JSONField(default=dict, help_text="Transformation rules and settings")
+    source_config = FastJSONField(default=dict, help_text="Source connection and query config")
+    target_config = FastJSONField(default=dict, help_text="Target connection and table config")
+    transform_config = FastJSONField(default=dict, help_text="Transformation rules and settings")
     
     # Status
     is_active = models.BooleanField(default=True)
@@ -160,6 +306,236 @@ class ETLJob(TimestampedModel):
 
     def __str__(self):
         return f"{self.name} ({self.job_type})"
+    
+    def all_dependencies(self):
+        """
+        Jobs this job depends on, directly or transitively.
+        
+        Served from the etl_job_closure_mv closure on PostgreSQL; other
+        databases walk depends_on instead.
+        """
+        if connection.vendor == 'postgresql':
+            dependency_ids = (
+                ETLJobClosure.objects.filter(job_id=self.id)
+                .exclude(dependency_id=self.id)
+                .values('dependency_id')
+            )
+            return ETLJob.objects.filter(id__in=dependency_ids)
+        
+        Through = ETLJob.depends_on.through
+        seen = set()
+        frontier = {self.id}
+        while frontier:
+            frontier = set(
+                Through.objects.filter(from_etljob_id__in=frontier)
+                .values_list('to_etljob_id', flat=True)
+            ) - seen - {self.id}
+            seen |= frontier
+        return ETLJob.objects.filter(id__in=seen)
+
+
+class ETLJobClosure(models.Model):
+    """
+    Transitive closure of ETLJob.depends_on, read from the etl_job_closure_mv
+    materialized view. Every job is paired with itself and with each job it
+    depends on, at any depth. Refreshed when jobs or dependencies change
+    (see etl.signals); PostgreSQL only.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    job = models.ForeignKey(ETLJob, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    dependency = models.ForeignKey(ETLJob, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    
+    class Meta:
+        managed = False
+        db_table = 'etl_job_closure_mv'
+    
+    def __str__(self):
+        return f"{self.job_id} -> {self.dependency_id}"
+    
+    @classmethod
+    def refresh(cls):
+        """Rebuild the closure (PostgreSQL only)."""
+        if connection.vendor != 'postgresql':
+            return
+        # CONCURRENTLY keeps the closure readable during the refresh (needs the unique index)
+        with connection.cursor() as cursor:
+            cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY etl_job_closure_mv")
+
+
+class ETLConfigBlob(models.Model):
+    """
+    Content-addressed JSON snapshots (job configs, checkpoints) shared by ETL runs.
+    Runs reference a blob by its SHA-256, so identical snapshots are stored once.
+    """
+    hash = models.CharField(max_length=64, primary_key=True)
+    blob = FastJSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'etl_config_blobs'
+    
+    def __str__(self):
+        return self.hash
+    
+    @staticmethod
+    def digest(value: Any) -> Tuple[str, Any]:
+        """
+        Hash a JSON-compatible value without touching the database.
+        
+        Returns:
+            (SHA-256 hex digest, value as it will be stored and read back)
+        """
+        # Sorted keys make equal dicts hash the same regardless of insertion order
+        payload = orjson.dumps(value, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.sha256(payload).hexdigest(), orjson.loads(payload)
+    
+    @classmethod
+    def store_many(cls, blobs: Dict[str, Any], using: Optional[str] = None) -> None:
+        """Store digest -> value pairs (from digest()) not stored yet, in one INSERT."""
+        if blobs:
+            cls.objects.using(using).bulk_create(
+                [cls(hash=digest, blob=blob) for digest, blob in blobs.items()],
+                ignore_conflicts=True
+            )
+    
+    @classmethod
+    def store(cls, value: Any) -> str:
+        """
+        Store a JSON-compatible value if it is not stored yet.
+        
+        Returns:
+            SHA-256 hex digest referencing the stored value
+        """
+        digest, blob = cls.digest(value)
+        cls.store_many({digest: blob})
+        return digest
+
+
+class ETLRunManager(models.Manager):
+    """Manager with an atomic claim path for ETL workers."""
+    
+    def claim_next(self, job_id: int, worker_id: Optional[str] = None) -> Optional['ETLRun']:
+        """
+        Atomically claim the oldest queued run of a job and mark it running.
+        
+        Rows locked by other workers are skipped rather than waited on, so
+        concurrent workers each claim a different run.
+        
+        Args:
+            job_id: ETL job ID
+            worker_id: Identifier of the claiming worker, recorded in the run log
+        
+        Returns:
+            The claimed run, or None if no unclaimed run is queued
+        """
+        with transaction.atomic():
+            run = (
+                self.filter(status='queued', job_id=job_id)
+                .order_by('created_at')
+                .select_for_update(skip_locked=True)
+                .first()
+            )
+            if run is None:
+                return None
+            
+            run.status = 'running'
+            run.started_at = timezone.now()
+            run.save(update_fields=['status', 'started_at', 'updated_at'])
+        
+        if worker_id:
+            run.append_log(f"Claimed by worker {worker_id}")
+        return run
+    
+    def add_row_counts(self, run_pk: int, processed: int = 0, inserted: int = 0,
+                       updated: int = 0, failed: int = 0, skipped: int = 0) -> None:
+        """
+        Add to a run's row counters with a single atomic UPDATE.
+        
+        Counters are incremented in the database (``SET x = x + n``), so
+        concurrent batches of the same run never overwrite each other.
+        Call once per processed chunk rather than per row.
+        """
+        deltas = {
+            'rows_processed': processed,
+            'rows_inserted': inserted,
+            'rows_updated': updated,
+            'rows_failed': failed,
+            'rows_skipped': skipped,
+        }
+        changes = {name: models.F(name) + delta for name, delta in deltas.items() if delta}
+        if changes:
+            self.filter(pk=run_pk).update(**changes)
+    
+    def with_config_blobs(self, runs: Iterable['ETLRun']) -> List['ETLRun']:
+        """
+        Load the config snapshots and checkpoints of many runs in one query.
+        
+        Reading config_snapshot, checkpoint_before or checkpoint_after on the
+        returned runs then hits no database, instead of one query per run.
+        
+        Args:
+            runs: Runs (or a queryset of runs) to load blobs for
+        
+        Returns:
+            The runs, as a list
+        """
+        runs = list(runs)
+        digests = {
+            getattr(run, hash_attname)
+            for run in runs for hash_attname in CONFIG_BLOB_HASH_FIELDS
+        } - {None}
+        if not digests:
+            return runs
+        
+        blobs = dict(
+            ETLConfigBlob.objects.using(self.db).filter(hash__in=digests).values_list('hash', 'blob')
+        )
+        for run in runs:
+            for hash_attname in CONFIG_BLOB_HASH_FIELDS:
+                digest = getattr(run, hash_attname)
+                if digest is not None:
+                    run.__dict__[_blob_cache_attname(hash_attname)] = (digest, blobs.get(digest, {}))
+        return runs
+
+
+# ETLRun fields referencing ETLConfigBlob, read and written through _config_blob_property
+CONFIG_BLOB_HASH_FIELDS = ('config_snapshot_hash', 'checkpoint_before_hash', 'checkpoint_after_hash')
+
+# Instance attribute holding blobs set on an ETLRun but not stored yet (see ETLRun.save)
+_PENDING_BLOBS_ATTNAME = '_pending_config_blobs'
+
+
+def _blob_cache_attname(hash_attname: str) -> str:
+    return f"_{hash_attname}_blob"
+
+
+def _config_blob_property(hash_attname: str, doc: str) -> property:
+    """
+    Expose a hash reference to ETLConfigBlob as a read/write JSON attribute.
+    
+    Setting the attribute only hashes the value; the blob is stored when the
+    run is saved, so unsaved or rolled-back runs leave no orphan blobs.
+    """
+    cache_attname = _blob_cache_attname(hash_attname)
+    
+    def getter(instance):
+        digest = getattr(instance, hash_attname)
+        if digest is None:
+            return {}
+        cached = instance.__dict__.get(cache_attname)
+        if cached is None or cached[0] != digest:
+            blob = ETLConfigBlob.objects.filter(hash=digest).values_list('blob', flat=True).first()
+            cached = (digest, blob if blob is not None else {})
+            instance.__dict__[cache_attname] = cached
+        return cached[1]
+    
+    def setter(instance, value):
+        digest, blob = ETLConfigBlob.digest(value)
+        setattr(instance, hash_attname, digest)
+        instance.__dict__[cache_attname] = (digest, blob)
+        instance.__dict__.setdefault(_PENDING_BLOBS_ATTNAME, {})[digest] = blob
+    
+    return property(getter, setter, doc=doc)
 
 
 class ETLRun(TimestampedModel):
@@ -196,40 +572,141 @@ class ETLRun(TimestampedModel):
     rows_failed = models.BigIntegerField(default=0)
     rows_skipped = models.BigIntegerField(default=0)
     
-    # Error and logging
+    # Error and logging (log lines live in ETLRunLog)
     error_message = models.TextField(null=True, blank=True)
-    log_messages = models.JSONField(default=list)
     
-    # Configuration snapshot
-    config_snapshot = models.JSONField(default=dict, help_text="Job config at time of execution")
+    # Configuration snapshot (ETLConfigBlob hash; see config_snapshot)
+    config_snapshot_hash = models.CharField(max_length=64, null=True, blank=True)
     
     # Data lineage
-    source_batches = models.JSONField(default=list, help_text="List of source batch IDs processed")
-    checkpoint_before = models.JSONField(default=dict, help_text="Checkpoint before run")
-    checkpoint_after = models.JSONField(default=dict, help_text="Checkpoint after run")
+    source_batches = FastJSONField(default=list, help_text="List of source batch IDs processed")
+    checkpoint_before_hash = models.CharField(max_length=64, null=True, blank=True)
+    checkpoint_after_hash = models.CharField(max_length=64, null=True, blank=True)
     
     # Manual execution metadata
     triggered_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     trigger_reason = models.CharField(max_length=200, null=True, blank=True)
     
+    objects = ETLRunManager()
+    
     class Meta:
         db_table = 'etl_runs'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['job', 'status']),
+            # Covers the run dashboard's latest-runs-per-job query as an
+            # index-only scan; also serves plain (job, status) filters
+            models.Index(
+                fields=['job', 'status', '-created_at'],
+                name='etl_runs_dash',
+                include=['rows_processed', 'rows_failed', 'duration_seconds']
+            ),
             models.Index(fields=['started_at']),
             models.Index(fields=['status', 'created_at']),
+            # Only queued runs are indexed, serving the claim_next lookup
+            models.Index(
+                fields=['job', 'created_at'],
+                name='etl_runs_queued',
+                condition=models.Q(status='queued')
+            ),
         ]
 
     def __str__(self):
         return f"{self.job.name} - {self.run_id} ({self.status})"
-
+    
+    config_snapshot = _config_blob_property('config_snapshot_hash', "Job config at time of execution")
+    checkpoint_before = _config_blob_property('checkpoint_before_hash', "Checkpoint before run")
+    checkpoint_after = _config_blob_property('checkpoint_after_hash', "Checkpoint after run")
+    
+    def save(self, *args, **kwargs):
+        """Save the run, storing blobs set on it since the last save in the same transaction."""
+        pending = self.__dict__.get(_PENDING_BLOBS_ATTNAME)
+        if not pending:
+            return super().save(*args, **kwargs)
+        
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            ETLConfigBlob.store_many(pending, using=using)
+            super().save(*args, **kwargs)
+        del self.__dict__[_PENDING_BLOBS_ATTNAME]
+    
     @property
     def success_rate(self) -> float:
         """Calculate success rate for this run."""
         if self.rows_processed == 0:
             return 0.0
         return (self.rows_processed - self.rows_failed) / self.rows_processed * 100
+    
+    @property
+    def log_messages(self):
+        """Log entries for this run, oldest first (lazy queryset)."""
+        return ETLRunLog.objects.filter(run_id=self.run_id).order_by('created_at', 'id')
+    
+    def append_log(self, message: str, level: str = 'info') -> 'ETLRunLog':
+        """Append a log entry for this run."""
+        return ETLRunLog.append_log(self.run_id, message, level)
+
+
+class ETLRunLog(models.Model):
+    """
+    Append-only log lines for ETL runs.
+    Each append is a single-row INSERT instead of rewriting a growing JSON list on the run.
+    """
+    run = models.ForeignKey(
+        ETLRun,
+        to_field='run_id',
+        db_column='run_id',
+        on_delete=models.CASCADE,
+        related_name='logs'
+    )
+    level = models.CharField(
+        max_length=10,
+        choices=[
+            ('debug', 'Debug'),
+            ('info', 'Info'),
+            ('warning', 'Warning'),
+            ('error', 'Error'),
+        ],
+        default='info'
+    )
+    message = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'etl_run_logs'
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['run', 'created_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.run_id} [{self.level}] {self.message[:50]}"
+    
+    @classmethod
+    def append_log(cls, run_id, message: str, level: str = 'info') -> 'ETLRunLog':
+        """Append a log entry for the run with the given run_id."""
+        return cls.objects.create(run_id=run_id, message=message, level=level)
+
+
+class ETLRunStats(models.Model):
+    """
+    Hourly per-job run rollups, read from the etl_run_stats_mv materialized view.
+    Refreshed by the refresh_etl_run_stats task; PostgreSQL only.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    job = models.ForeignKey(ETLJob, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    bucket = models.DateTimeField()
+    runs = models.BigIntegerField()
+    processed = models.BigIntegerField()
+    failed = models.BigIntegerField()
+    success_rate = models.FloatField()
+    
+    class Meta:
+        managed = False
+        db_table = 'etl_run_stats_mv'
+        ordering = ['-bucket']
+    
+    def __str__(self):
+        return f"{self.job_id} @ {self.bucket}: {self.success_rate:.2f}%"
 
 
 class Checkpoint(TimestampedModel):
@@ -251,7 +728,7 @@ class Checkpoint(TimestampedModel):
         ]
     )
     checkpoint_value = models.TextField(help_text="Timestamp, ID, or other checkpoint identifier")
-    checkpoint_data = models.JSONField(default=dict, help_text="Additional checkpoint metadata")
+    checkpoint_data = FastJSONField(default=dict, help_text="Additional checkpoint metadata")
     
     # Processing metadata
     last_run = models.ForeignKey(ETLRun, on_delete=models.SET_NULL, null=True, blank=True)
@@ -286,7 +763,7 @@ class DataSource(TimestampedModel):
     )
     
     # Connection configuration
-    connection_config = models.JSONField(
+    connection_config = FastJSONField(
         help_text="Connection parameters (encrypted for sensitive data)"
     )
     
@@ -302,11 +779,11 @@ class DataSource(TimestampedModel):
         ],
         default='none'
     )
-    credentials = models.JSONField(default=dict, help_text="Encrypted credentials")
+    credentials = FastJSONField(default=dict, help_text="Encrypted credentials")
     
     # Rate limiting and behavior
     rate_limit = models.IntegerField(default=60, help_text="Requests per minute")
-    retry_policy = models.JSONField(default=dict, help_text="Retry configuration")
+    retry_policy = FastJSONField(default=dict, help_text="Retry configuration")
     
     # Status
     is_active = models.BooleanField(default=True)
@@ -361,7 +838,7 @@ class AuditLog(TimestampedModel):
     
     # Event details
     message = models.TextField()
-    details = models.JSONField(default=dict)
+    details = FastJSONField(default=dict)
     
     # Data lineage
     source_table = models.CharField(max_length=100, null=True, blank=True)
@@ -372,6 +849,11 @@ class AuditLog(TimestampedModel):
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(null=True, blank=True)
     
+    # Append-only timestamps are BRIN-indexed instead (see migration 0013)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    objects = AuditLogManager()
+    
     class Meta:
         db_table = 'etl_audit_log'
         ordering = ['-created_at']
@@ -379,6 +861,10 @@ class AuditLog(TimestampedModel):
             models.Index(fields=['event_type', 'created_at']),
             models.Index(fields=['job', 'created_at']),
             models.Index(fields=['user', 'created_at']),
+            # Lineage lookups by table over a time window
+            models.Index(fields=['source_table', '-created_at'], name='etl_audit_log_src'),
+            # Lineage lookups by batch; details also has a GIN index (see migration 0007)
+            models.Index(KeyTextTransform('batch_id', 'details'), name='audit_details_batch_id'),
         ]
 
     def __str__(self):
@@ -430,7 +916,7 @@ class ETLAlert(TimestampedModel):
     # Alert details
     title = models.CharField(max_length=200)
     message = models.TextField()
-    context = models.JSONField(default=dict)
+    context = FastJSONField(default=dict)
     
     # Related objects
     job = models.ForeignKey(ETLJob, on_delete=models.CASCADE, null=True, blank=True)
@@ -444,7 +930,7 @@ class ETLAlert(TimestampedModel):
     resolution_notes = models.TextField(null=True, blank=True)
     
     # Notification tracking
-    notifications_sent = models.JSONField(default=list, help_text="List of sent notifications")
+    notifications_sent = FastJSONField(default=list, help_text="List of sent notifications")
     
     class Meta:
         db_table = 'etl_alerts'
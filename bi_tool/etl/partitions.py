@@ -0,0 +1,141 @@
+"""
+Monthly range partition maintenance for partitioned ETL tables (PostgreSQL only)
+"""
+
+import logging
+import re
+from datetime import date
+from typing import List
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+AUDIT_LOG_TABLE = 'etl_audit_log'
+
+# Partitions are created this many months past the current one, so inserts
+# keep landing in an existing partition even if maintenance is delayed
+MONTHS_AHEAD = 3
+
+_PARTITION_SUFFIX_RE = re.compile(r'_(\d{4})_(\d{2})$')
+
+
+def add_months(month: date, months: int) -> date:
+    """Return the first day of the month ``months`` after ``month``."""
+    years, month_index = divmod(month.month - 1 + months, 12)
+    return date(month.year + years, month_index + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the partition holding ``month``, e.g. ``etl_audit_log_2025_01``."""
+    return f"{table}_{month:%Y_%m}"
+
+
+def default_partition_name(table: str) -> str:
+    """Name of the DEFAULT partition catching rows no monthly partition covers."""
+    return f"{table}_default"
+
+
+def create_month_partitions(connection, table: str, start: date, end: date,
+                            column: str = 'created_at') -> List[str]:
+    """
+    Create monthly partitions covering ``start`` through ``end``.
+    
+    Rows that landed in the table's DEFAULT partition while a month had no
+    partition of its own are moved into the new partition; PostgreSQL
+    refuses to create a partition whose range the DEFAULT partition holds
+    rows for.
+    
+    Args:
+        connection: Django database connection (PostgreSQL)
+        table: Partitioned parent table
+        start: Any day in the first month to cover
+        end: Any day in the last month to cover
+        column: Partition key column
+    
+    Returns:
+        Names of the partitions that now exist for the range
+    """
+    month = start.replace(day=1)
+    default = default_partition_name(table)
+    names = []
+    
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [default])
+        has_default = cursor.fetchone()[0]
+        
+        while month <= end:
+            name = partition_name(table, month)
+            bounds = f"FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            
+            strays = False
+            if has_default:
+                cursor.execute(
+                    f"SELECT to_regclass(%s) IS NULL AND EXISTS ("
+                    f"SELECT 1 FROM {default} WHERE {column} >= %s AND {column} < %s)",
+                    [name, month, add_months(month, 1)]
+                )
+                strays = cursor.fetchone()[0]
+            
+            if strays:
+                with transaction.atomic(using=connection.alias):
+                    cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {default}")
+                    cursor.execute(f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES {bounds}")
+                    cursor.execute(
+                        f"WITH moved AS (DELETE FROM {default} WHERE {column} >= %s AND {column} < %s "
+                        f"RETURNING *) INSERT INTO {name} SELECT * FROM moved",
+                        [month, add_months(month, 1)]
+                    )
+                    cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT")
+                logger.warning(f"Moved rows for {month:%Y-%m} from {default} into new partition {name}")
+            else:
+                cursor.execute(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} FOR VALUES {bounds}")
+            
+            names.append(name)
+            month = add_months(month, 1)
+    
+    return names
+
+
+def detach_partitions_before(connection, table: str, cutoff: date) -> List[str]:
+    """
+    Detach partitions whose whole month falls before ``cutoff``.
+    
+    Detached partitions become standalone tables, left for archival or
+    dropping; detaching does not rewrite or delete any rows.
+    
+    Args:
+        connection: Django database connection (PostgreSQL)
+        table: Partitioned parent table
+        cutoff: Rows older than this date are past retention
+    
+    Returns:
+        Names of the detached partitions
+    """
+    detached = []
+    
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [table]
+        )
+        children = [row[0] for row in cursor.fetchall()]
+        
+        for name in sorted(children):
+            match = _PARTITION_SUFFIX_RE.search(name)
+            if not match:
+                continue
+            
+            month = date(int(match.group(1)), int(match.group(2)), 1)
+            if add_months(month, 1) <= cutoff:
+                cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {name}")
+                detached.append(name)
+                logger.info(f"Detached partition {name} from {table}")
+    
+    return detached
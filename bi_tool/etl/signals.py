@@ -2,5 +2,33 @@
 ETL App Signals
 """
 
-# Placeholder for ETL signals
-pass
\ No newline at end of file
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import ETLJob, ETLJobClosure
+
+
+def _schedule_closure_refresh():
+    transaction.on_commit(ETLJobClosure.refresh)
+
+
+@receiver(post_save, sender=ETLJob)
+def refresh_closure_on_job_created(sender, instance, created, **kwargs):
+    """New jobs need their self-pair in the dependency closure."""
+    # Routine saves (e.g. last_run_at updates) cannot change the closure
+    if created:
+        _schedule_closure_refresh()
+
+
+@receiver(post_delete, sender=ETLJob)
+def refresh_closure_on_job_deleted(sender, instance, **kwargs):
+    """Drop a deleted job's pairs from the dependency closure."""
+    _schedule_closure_refresh()
+
+
+@receiver(m2m_changed, sender=ETLJob.depends_on.through)
+def refresh_closure_on_dependencies_changed(sender, action, **kwargs):
+    """Rebuild the dependency closure when depends_on links change."""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        _schedule_closure_refresh()
@@ -0,0 +1,14 @@
+"""
+Test configuration for ETL utilities testing.
+"""
+
+import os
+
+import django
+
+
+# Configure Django for pytest
+def pytest_configure():
+    """Configure Django settings for pytest."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    django.setup()
@@ -0,0 +1,81 @@
+"""
+Tests for the buffered AuditLog writer.
+
+Rows the database rejects must be dropped on their own, without holding up
+the events queued behind them.
+"""
+
+import pytest
+from django.db import OperationalError
+from django.test.utils import setup_databases, teardown_databases
+
+from etl.audit import AuditLogBuffer
+from etl.models import AuditLog, ETLJob
+
+
+@pytest.fixture(scope='module')
+def database():
+    # The drainer thread writes over its own connection, so rows must be
+    # committed rather than wrapped in a per-test transaction
+    config = setup_databases(verbosity=0, interactive=False)
+    yield
+    teardown_databases(config, verbosity=0)
+
+
+@pytest.fixture
+def buffer(database):
+    buffer = AuditLogBuffer(max_rows=50, flush_interval=0.05, retry_backoff=0.01)
+    yield buffer
+    buffer.close()
+    AuditLog.objects.all().delete()
+    ETLJob.objects.all().delete()
+
+
+def _messages():
+    return sorted(AuditLog.objects.values_list('message', flat=True))
+
+
+class TestAuditLogBuffer:
+    """AuditLogBuffer writes every event the database accepts."""
+    
+    def test_writes_queued_events(self, buffer):
+        for index in range(3):
+            buffer.emit('data_ingestion', f"event {index}")
+        buffer.flush()
+        
+        assert _messages() == ['event 0', 'event 1', 'event 2']
+    
+    def test_dangling_foreign_key_drops_only_that_event(self, buffer):
+        job = ETLJob.objects.create(name='audited', description='', job_type='extract')
+        deleted_job_id = job.id
+        job.delete()
+        
+        buffer.emit('data_ingestion', 'before')
+        buffer.emit('data_ingestion', 'dangling', job_id=deleted_job_id)
+        buffer.emit('data_ingestion', 'after')
+        buffer.flush()
+        
+        assert _messages() == ['after', 'before']
+        
+        # The drainer is not stuck on the rejected batch
+        buffer.emit('data_ingestion', 'later')
+        buffer.flush()
+        
+        assert _messages() == ['after', 'before', 'later']
+    
+    def test_transient_errors_are_retried(self, buffer, monkeypatch):
+        write = buffer._write
+        failures = []
+        
+        def flaky_write(batch):
+            if len(failures) < 2:
+                failures.append(len(batch))
+                raise OperationalError('connection lost')
+            write(batch)
+        
+        monkeypatch.setattr(buffer, '_write', flaky_write)
+        buffer.emit('data_ingestion', 'retried')
+        buffer.flush()
+        
+        assert failures == [1, 1]
+        assert _messages() == ['retried']
@@ -0,0 +1,164 @@
+"""
+Tests for DataTransformer's column-wise batch path.
+
+transform_batch_vectorized applies cast, calculate, normalize, encrypt and
+mask rules over whole columns and must produce exactly what
+transform_batch produces record by record.
+"""
+
+import math
+
+import pandas as pd
+import pytest
+
+from etl.utils.transformers import DataTransformer
+
+
+# Mixed-type column values: numbers, numeric strings, text and containers.
+# Ints too big for a float (10 ** 400) make a whole column fall back to the
+# per-record path, so they are tested separately
+MIXED_VALUES = [
+    None, 0, -0.0, 1, 7, 2.5, -3.7, 1e300, float('nan'), float('inf'), float('-inf'), 2 ** 63, 2 ** 70,
+    True, False, '4', ' 5 ', '2.5', 'nan', '1_000', '٣', '', ' ', 'abc', '  Hello   World!! ', ' mIxEd  case ',
+    'x\ty', 'ÉCOLE straße', 'a@b.co', 'john.doe@example.org', '@example.org', 'no-at-sign', '😀 emoji',
+    [1], {'a': 1}, (1, 2),
+]
+
+RULES = {
+    'cast_int': {'transform_type': 'cast', 'parameters': {'type': 'int'}},
+    'cast_float': {'transform_type': 'cast', 'parameters': {'type': 'float'}},
+    'cast_str': {'transform_type': 'cast', 'parameters': {'type': 'str'}},
+    'calculate_multiply': {'transform_type': 'calculate', 'parameters': {'operation': 'multiply', 'multiplier': 3}},
+    'calculate_add_float': {'transform_type': 'calculate', 'parameters': {'operation': 'add', 'addend': 0.5}},
+    'calculate_subtract_default': {'transform_type': 'calculate', 'parameters': {'operation': 'subtract'}},
+    'calculate_divide': {'transform_type': 'calculate', 'parameters': {'operation': 'divide', 'divisor': 7}},
+    'calculate_divide_by_zero': {'transform_type': 'calculate', 'parameters': {'operation': 'divide', 'divisor': 0}},
+    'normalize_default': {'transform_type': 'normalize', 'parameters': {}},
+    'normalize_title_special': {
+        'transform_type': 'normalize', 'parameters': {'case': 'title', 'remove_special_chars': True},
+    },
+    'normalize_lower_untrimmed': {'transform_type': 'normalize', 'parameters': {'case': 'lower', 'trim': False}},
+    'normalize_upper': {'transform_type': 'normalize', 'parameters': {'case': 'upper', 'remove_extra_spaces': False}},
+    'normalize_sentence': {'transform_type': 'normalize', 'parameters': {'case': 'sentence'}},
+    'encrypt_sha256': {'transform_type': 'encrypt', 'parameters': {}},
+    'encrypt_md5': {'transform_type': 'encrypt', 'parameters': {'algorithm': 'md5'}},
+    'encrypt_blake2b': {'transform_type': 'encrypt', 'parameters': {'algorithm': 'blake2b'}},
+    'mask_partial': {'transform_type': 'mask', 'parameters': {}},
+    'mask_partial_wide': {'transform_type': 'mask', 'parameters': {'show_first': 1, 'show_last': 0, 'mask_char': '#'}},
+    'mask_full': {'transform_type': 'mask', 'parameters': {'type': 'full'}},
+    'mask_email': {'transform_type': 'mask', 'parameters': {'type': 'email'}},
+    'mask_unknown_type': {'transform_type': 'mask', 'parameters': {'type': 'other'}},
+}
+
+# Rules with no column form, applied per record by transform_batch_vectorized too
+PER_RECORD_RULES = {'cast_str'}
+
+
+def _normalized(value):
+    """Comparable form of a transformed value: tells 1, 1.0 and True apart and nan equal to nan."""
+    if isinstance(value, dict):
+        return {key: _normalized(item) for key, item in value.items() if key != '_processed_at'}
+    if isinstance(value, float):
+        return ('float', 'nan' if math.isnan(value) else value.hex())
+    return (type(value).__name__, repr(value))
+
+
+def _assert_same_results(vectorized, per_record):
+    assert vectorized['total_records'] == per_record['total_records']
+    assert vectorized['successful_transforms'] == per_record['successful_transforms']
+    assert vectorized['failed_transforms'] == per_record['failed_transforms']
+    assert vectorized['errors'] == per_record['errors']
+    for index, (got, expected) in enumerate(zip(vectorized['transformed_records'], per_record['transformed_records'])):
+        assert _normalized(got) == _normalized(expected), index
+
+
+def _records():
+    # Every value in field 'a', paired with a shifted value in 'b', so
+    # calculations reading both fields see mixed-type pairs
+    return [
+        {'id': index, 'a': value, 'b': MIXED_VALUES[(index * 7) % len(MIXED_VALUES)]}
+        for index, value in enumerate(MIXED_VALUES)
+    ]
+
+
+class TestTransformBatchVectorizedEquivalence:
+    """transform_batch_vectorized must match transform_batch."""
+    
+    @pytest.mark.parametrize('in_place', [False, True])
+    @pytest.mark.parametrize('rule_name', sorted(RULES))
+    def test_matches_transform_batch(self, rule_name, in_place):
+        rule = {'source_field': 'a', 'target_field': '' if in_place else 'out', **RULES[rule_name]}
+        transformer = DataTransformer({'transformation_rules': {'test': [rule]}})
+        records = _records()
+        
+        # The column path must handle the rule, not fall back for the whole column
+        (transformation_rule, _), = transformer._pipelines['test']
+        column = pd.Series([record['a'] for record in records], dtype=object)
+        vectorized_column = transformer._vectorized_transform(column, transformation_rule)
+        assert (vectorized_column is None) == (rule_name in PER_RECORD_RULES)
+        
+        _assert_same_results(
+            transformer.transform_batch_vectorized('test', records),
+            transformer.transform_batch('test', records)
+        )
+    
+    def test_matches_transform_batch_with_chained_rules(self):
+        # Later rules read fields earlier rules wrote, and conditional rules run per record
+        transformer = DataTransformer({'transformation_rules': {'test': [
+            {'source_field': 'a', 'target_field': 'tripled', 'transform_type': 'calculate',
+             'parameters': {'operation': 'multiply', 'multiplier': 3}},
+            {'source_field': 'tripled', 'target_field': 'shifted', 'transform_type': 'calculate',
+             'parameters': {'operation': 'add', 'addend': 0.5}},
+            {'source_field': 'b', 'transform_type': 'normalize', 'parameters': {'case': 'lower'}},
+            {'source_field': 'b', 'target_field': 'b_masked', 'transform_type': 'mask', 'parameters': {'type': 'email'}},
+            {'source_field': 'a', 'target_field': 'a_hash', 'transform_type': 'encrypt', 'parameters': {}},
+            {'source_field': 'a', 'target_field': 'a_int', 'transform_type': 'cast', 'parameters': {'type': 'int'},
+             'condition': 'id > 3'},
+        ]}})
+        records = _records()
+        
+        _assert_same_results(
+            transformer.transform_batch_vectorized('test', records),
+            transformer.transform_batch('test', records)
+        )
+    
+    def test_matches_transform_batch_for_default_pos_rules(self):
+        transformer = DataTransformer()
+        records = [
+            {'sale_time': '2024-01-31 10:00:00', 'price': price, 'quantity': quantity}
+            for price, quantity in zip(MIXED_VALUES, reversed(MIXED_VALUES))
+        ]
+        
+        _assert_same_results(
+            transformer.transform_batch_vectorized('pos', records),
+            transformer.transform_batch('pos', records)
+        )
+    
+    @pytest.mark.parametrize('rule_name', ['cast_int', 'cast_float', 'calculate_multiply'])
+    def test_matches_transform_batch_with_ints_beyond_float_range(self, rule_name):
+        rule = {'source_field': 'a', 'target_field': 'out', **RULES[rule_name]}
+        transformer = DataTransformer({'transformation_rules': {'test': [rule]}})
+        records = _records() + [{'id': -1, 'a': 10 ** 400, 'b': None}]
+        
+        _assert_same_results(
+            transformer.transform_batch_vectorized('test', records),
+            transformer.transform_batch('test', records)
+        )
+    
+    def test_failed_records_are_reported_the_same(self):
+        transformer = DataTransformer({'transformation_rules': {'test': [
+            {'source_field': 'a', 'target_field': 'out', 'transform_type': 'cast', 'parameters': {'type': 'int'}},
+        ]}})
+        # Keys of mixed types cannot be sorted for the record hash
+        records = _records() + [{1: 2, 'a': 1}]
+        
+        vectorized = transformer.transform_batch_vectorized('test', records)
+        
+        assert vectorized['failed_transforms'] >= 1
+        _assert_same_results(vectorized, transformer.transform_batch('test', records))
+    
+    def test_empty_batch(self):
+        result = DataTransformer().transform_batch_vectorized('test', [])
+        
+        assert result['total_records'] == 0
+        assert result['transformed_records'] == []
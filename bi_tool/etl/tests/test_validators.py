@@ -0,0 +1,204 @@
+"""
+Tests for DataValidator's batch paths.
+
+validate_records (and validate_batch on top of it) checks rules column-wise
+and must report exactly what validate() reports record by record.
+"""
+
+import math
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from etl.utils.validators import DataValidator
+
+
+# Values that numeric parsing, str() and the pandas string backends disagree on
+EDGE_VALUES = [
+    None, True, False, 0, 1, -1, 7, 2 ** 53 + 1, -(2 ** 63), 10 ** 400,
+    0.5, -2.5, 1e300, float('nan'), float('inf'), float('-inf'), Decimal('1.5'),
+    '', ' ', '\t\n', '\x1c', '5', ' 5 ', '+3', '-0', '1.5', '.5', '5.', '1e3', '1_000', 'nan', 'inf',
+    '٣', '١٢', '²', 'abc', 'ABC', 'a b', 'é', 'True', '$1,000.50', '1,2', '$', '2024-01-31', '2024-02-30',
+    '31/01/2024', 'a@b.co', 'a@b', 'user.name+tag@example.org', '+1 555 0100', '(555) 010-0100', '+٣٣٣',
+    '0123', '1' * 17, [1], {'x': 1}, (1, 2),
+]
+
+RULES = {
+    'required': {'rule_type': 'required'},
+    'type_int': {'rule_type': 'type', 'parameters': {'type': 'int'}},
+    'type_float': {'rule_type': 'type', 'parameters': {'type': 'float'}},
+    'type_decimal': {'rule_type': 'type', 'parameters': {'type': 'decimal'}},
+    'range_int_bounds': {'rule_type': 'range', 'parameters': {'min': 0, 'max': 10}},
+    'range_float_bounds': {'rule_type': 'range', 'parameters': {'min': -1.5, 'max': 1e3}},
+    'range_min_only': {'rule_type': 'range', 'parameters': {'min': 1}},
+    'range_big_bound': {'rule_type': 'range', 'parameters': {'max': 2 ** 60}},
+    'length': {'rule_type': 'length', 'parameters': {'min': 1, 'max': 3}},
+    'pattern': {'rule_type': 'pattern', 'parameters': {'pattern': r'\d+'}},
+    'pattern_anchored': {'rule_type': 'pattern', 'parameters': {'pattern': r'^[a-z]+$'}},
+    'enum': {'rule_type': 'enum', 'parameters': {'values': ['abc', 1, True, 'a b']}},
+    'date_format': {'rule_type': 'date_format'},
+    'date_format_custom': {'rule_type': 'date_format', 'parameters': {'format': '%d/%m/%Y'}},
+    'currency': {'rule_type': 'currency'},
+    'email': {'rule_type': 'email'},
+    'phone': {'rule_type': 'phone'},
+    'custom': {'rule_type': 'custom', 'parameters': {'function': 'short'}},
+    'custom_missing': {'rule_type': 'custom', 'parameters': {'function': 'missing'}},
+    'unknown': {'rule_type': 'unknown'},
+}
+
+# Rules with no column form, checked per record by validate_records too
+PER_RECORD_RULES = {'custom', 'custom_missing', 'unknown', 'range_big_bound'}
+
+
+def _without_timestamp(result):
+    return {key: value for key, value in result.items() if key != 'validated_at'}
+
+
+def _validator(rules, source='test'):
+    return DataValidator({
+        'validation_rules': {source: rules},
+        'custom_validators': {'short': lambda value, params, record: len(str(value)) < 4},
+    })
+
+
+class TestValidateRecordsEquivalence:
+    """validate_records must match validate() for every rule type and value."""
+    
+    @pytest.mark.parametrize('severity', ['error', 'warning'])
+    @pytest.mark.parametrize('rule_name', sorted(RULES))
+    def test_matches_validate(self, rule_name, severity):
+        rule = {'field': 'value', 'error_message': rule_name, 'severity': severity, **RULES[rule_name]}
+        validator = _validator([rule])
+        records = [{'value': value} for value in EDGE_VALUES] + [{}]
+        
+        # The column path must handle the rule, not fall back for the whole column
+        (validation_rule, _), = validator._rule_checks['test']
+        column = pd.Series([record.get('value') for record in records], dtype=object)
+        assert (validator._vectorized_rule_failures(column, validation_rule) is None) == (rule_name in PER_RECORD_RULES)
+        
+        batch = validator.validate_records('test', records)
+        
+        assert len(batch) == len(records)
+        for record, result in zip(records, batch):
+            expected = validator.validate('test', record)
+            assert _without_timestamp(result) == _without_timestamp(expected), record
+    
+    def test_matches_validate_with_many_rules_per_field(self):
+        validator = _validator([
+            {'field': 'value', 'error_message': name, **rule} for name, rule in sorted(RULES.items())
+        ])
+        records = [{'value': value} for value in EDGE_VALUES]
+        
+        batch = validator.validate_records('test', records)
+        
+        for record, result in zip(records, batch):
+            assert _without_timestamp(result) == _without_timestamp(validator.validate('test', record)), record
+    
+    @pytest.mark.parametrize('source,fields', [
+        ('pos', ['quantity', 'price', 'total_amount']),
+        ('inventory', ['current_stock']),
+        ('staff', ['hours_worked']),
+    ])
+    def test_business_logic_matches_validate(self, source, fields):
+        validator = DataValidator({'validation_rules': {}})
+        numbers = [None, 0, 1, 2, -5, 17, 1001, 2.5, 5.01, '3', 'x', float('nan'), float('inf'), [1]]
+        records = [
+            {field: numbers[(index + offset) % len(numbers)] for offset, field in enumerate(fields)}
+            for index in range(len(numbers) * 3)
+        ]
+        records.append({})
+        
+        batch = validator.validate_records(source, records)
+        
+        for record, result in zip(records, batch):
+            assert _without_timestamp(result) == _without_timestamp(validator.validate(source, record)), record
+    
+    def test_empty_batch(self):
+        assert _validator([{'field': 'value', 'rule_type': 'required', 'error_message': 'x'}]) \
+            .validate_records('test', []) == []
+    
+    def test_nan_is_reported_as_given(self):
+        nan = float('nan')
+        validator = _validator([
+            {'field': 'value', 'rule_type': 'type', 'parameters': {'type': 'int'}, 'error_message': 'int'}
+        ])
+        
+        result, = validator.validate_records('test', [{'value': nan}])
+        
+        assert not result['is_valid']
+        assert math.isnan(result['errors'][0]['value'])
+
+
+class TestValidateBatchReport:
+    """Shape and counts of the validate_batch report."""
+    
+    RULES = [
+        {'field': 'id', 'rule_type': 'required', 'error_message': 'id is required'},
+        {'field': 'amount', 'rule_type': 'range', 'parameters': {'min': 0}, 'error_message': 'negative',
+         'severity': 'warning'},
+        {'field': 'email', 'rule_type': 'email', 'error_message': 'bad email'},
+    ]
+    RECORDS = [
+        {'id': 1, 'amount': 10, 'email': 'a@b.co'},
+        {'id': 2, 'amount': -1, 'email': 'a@b.co'},
+        {'id': None, 'amount': 5, 'email': 'nope'},
+        {'id': 4, 'amount': -3, 'email': 'nope'},
+    ]
+    
+    def test_report_shape(self):
+        report = _validator(self.RULES).validate_batch('test', self.RECORDS)
+        
+        assert set(report) == {
+            'total_records', 'valid_records', 'invalid_records', 'warnings',
+            'validation_details', 'failed', 'summary', 'started_at', 'completed_at',
+        }
+        assert report['total_records'] == 4
+        assert report['valid_records'] == 2
+        assert report['invalid_records'] == 2
+        assert report['warnings'] == 2
+        assert report['started_at'] <= report['completed_at']
+    
+    def test_validation_details_hold_counts_only(self):
+        report = _validator(self.RULES).validate_batch('test', self.RECORDS)
+        
+        assert report['validation_details'] == [
+            {'record_index': 0, 'is_valid': True, 'error_count': 0, 'warning_count': 0},
+            {'record_index': 1, 'is_valid': True, 'error_count': 0, 'warning_count': 1},
+            {'record_index': 2, 'is_valid': False, 'error_count': 2, 'warning_count': 0},
+            {'record_index': 3, 'is_valid': False, 'error_count': 1, 'warning_count': 1},
+        ]
+    
+    def test_failed_lists_records_with_errors_or_warnings(self):
+        validator = _validator(self.RULES)
+        report = validator.validate_batch('test', self.RECORDS)
+        
+        assert [entry['record_index'] for entry in report['failed']] == [1, 2, 3]
+        for entry in report['failed']:
+            expected = validator.validate('test', self.RECORDS[entry['record_index']])
+            assert entry['errors'] == expected['errors']
+            assert entry['warnings'] == expected['warnings']
+    
+    def test_summary(self):
+        report = _validator(self.RULES).validate_batch('test', self.RECORDS)
+        
+        assert report['summary'] == {
+            'error_rate': 50.0,
+            'warning_rate': 50.0,
+            'most_common_errors': [('email:email', 2), ('id:required', 1)],
+            'most_common_warnings': [('amount:range', 2)],
+        }
+    
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_parallel_report_matches_serial(self, workers):
+        # No custom validators: the config has to be picklable for the pool
+        validator = DataValidator({'validation_rules': {'test': self.RULES}})
+        records = self.RECORDS * 50
+        
+        serial = validator.validate_batch('test', records)
+        parallel = validator.validate_batch_parallel('test', records, workers=workers)
+        
+        for key in ('started_at', 'completed_at'):
+            serial.pop(key)
+            parallel.pop(key)
+        assert parallel == serial
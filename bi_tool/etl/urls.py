@@ -2,9 +2,12 @@
 ETL App URL Configuration
 """
 
-from django.urls import path, include
+from django.urls import path
+
+from . import views
+
+app_name = 'etl'
 
-# Placeholder URLs for ETL app
 urlpatterns = [
-    # ETL endpoints will be implemented later
-]
\ No newline at end of file
+    path('metrics/ingest/', views.ingest_metrics, name='ingest-metrics'),
+]
@@ -5,16 +5,26 @@ This package provides comprehensive utilities for ETL processing:
 - DataValidator: Comprehensive data validation with configurable rules
 - DataTransformer: Data transformation and enrichment utilities
 - WarehouseManager: Data warehouse management and aggregation utilities
+- AlertManager: ETL alert creation with burst deduplication
+- BloomDedup: Redis-backed Bloom filter for ingest duplicate pre-filtering
+- MetricsCollector: Daily ETL counters and HyperLogLog unique counts
 """
 
 from .validators import DataValidator, ValidationRule
 from .transformers import DataTransformer, TransformationRule
 from .warehouse_manager import WarehouseManager
+from .alerts import AlertManager, alert_dedupe
+from .bloom import BloomDedup
+from .monitoring import MetricsCollector
 
 __all__ = [
     'DataValidator',
     'ValidationRule',
     'DataTransformer', 
     'TransformationRule',
-    'WarehouseManager'
+    'WarehouseManager',
+    'AlertManager',
+    'alert_dedupe',
+    'BloomDedup',
+    'MetricsCollector'
 ]
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Alert Utilities for ETL Monitoring
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Repeats of the same alert within this many seconds are coalesced
+DEFAULT_ALERT_WINDOW_SECONDS = 300
+
+
+def _alert_key(key: str) -> str:
+    return f"etl:alert:{hashlib.sha1(key.encode()).hexdigest()}"
+
+
+def alert_dedupe(key: str, window_seconds: int = DEFAULT_ALERT_WINDOW_SECONDS) -> bool:
+    """
+    Claim the alert window for ``key``.
+    
+    Uses an atomic add (SET NX EX on Redis), so across all workers only the
+    first caller in each window gets True.
+    
+    Args:
+        key: Alert identity
+        window_seconds: Length of the deduplication window
+    
+    Returns:
+        True if the caller should emit the alert, False if it is a repeat
+    """
+    return cache.add(_alert_key(key), 1, timeout=window_seconds)
+
+
+class AlertManager:
+    """
+    Creates ETLAlert records, coalescing bursts of identical alerts.
+    """
+    
+    def __init__(self, window_seconds: int = DEFAULT_ALERT_WINDOW_SECONDS):
+        self.window_seconds = window_seconds
+    
+    def create_alert(self, alert_type: str, severity: str, title: str, message: str,
+                     context: Optional[Dict[str, Any]] = None, **related) -> Optional[Any]:
+        """
+        Create an alert unless the same alert was raised within the window.
+        
+        Repeats inside a window are only counted; the next alert that opens a
+        new window carries the number of suppressed repeats in its context.
+        
+        Args:
+            alert_type: ETLAlert alert type
+            severity: ETLAlert severity
+            title: Alert title; together with alert_type identifies repeats
+            message: Alert message
+            context: Extra alert context
+            **related: Related objects (job, run, source)
+        
+        Returns:
+            The created ETLAlert, or None if the alert was coalesced
+        """
+        from ..models import ETLAlert
+        
+        key = f"{alert_type}:{title}"
+        suppressed_key = f"{_alert_key(key)}:suppressed"
+        
+        try:
+            if not alert_dedupe(key, self.window_seconds):
+                cache.add(suppressed_key, 0, timeout=None)
+                cache.incr(suppressed_key)
+                return None
+            
+            suppressed = cache.get(suppressed_key, 0)
+            if suppressed:
+                cache.delete(suppressed_key)
+        
+        except Exception as e:
+            # Never lose an alert because the cache is unavailable
+            logger.warning(f"Alert deduplication unavailable, creating alert anyway: {e}")
+            suppressed = 0
+        
+        context = dict(context or {})
+        if suppressed:
+            context['suppressed_count'] = suppressed
+            message = f"{message} ({suppressed} similar alerts suppressed)"
+        
+        logger.warning(f"ETL alert [{severity}] {alert_type}: {title}")
+        return ETLAlert.objects.create(
+            alert_type=alert_type,
+            severity=severity,
+            title=title[:200],
+            message=message,
+            context=context,
+            **related
+        )
@@ -0,0 +1,115 @@
+"""
+Redis-backed Bloom Filters for Ingest Deduplication
+"""
+
+import hashlib
+import logging
+import math
+from datetime import timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Sized for a month of ingest per source at a 0.1% false positive rate
+DEFAULT_EXPECTED_ITEMS = 10_000_000
+DEFAULT_ERROR_RATE = 0.001
+
+# A month's bitmap is read through the following month, then expires
+FILTER_RETENTION = timedelta(days=62)
+
+
+class BloomDedup:
+    """
+    Bloom filter stored as a Redis bitmap.
+    
+    Answers "definitely new" or "possibly seen" for keys. Lookups and
+    inserts for a whole batch go to Redis in one pipelined round trip, and
+    no Redis modules are required.
+    
+    The filter rotates monthly so it never saturates: keys are added to the
+    current month's bitmap, and lookups check this month's and last
+    month's. Keys older than that read as new, which only costs the
+    duplicate lookup the fast path would have skipped.
+    """
+    
+    def __init__(self, name: str, client, expected_items: int = DEFAULT_EXPECTED_ITEMS,
+                 error_rate: float = DEFAULT_ERROR_RATE):
+        self.key = f"etl:bloom:{name}"
+        self.client = client
+        # m = -n ln(p) / (ln 2)^2 bits, k = (m / n) ln 2 hash functions
+        self.size = math.ceil(-expected_items * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / expected_items * math.log(2)))
+    
+    @classmethod
+    def for_source(cls, source: str) -> Optional['BloomDedup']:
+        """Filter for a data source, or None when Redis is not configured."""
+        client = get_redis()
+        if client is None:
+            return None
+        return cls(
+            f"ingest:{source}",
+            client,
+            expected_items=getattr(settings, 'ETL_BLOOM_EXPECTED_ITEMS', DEFAULT_EXPECTED_ITEMS),
+            error_rate=getattr(settings, 'ETL_BLOOM_ERROR_RATE', DEFAULT_ERROR_RATE)
+        )
+    
+    def _period_keys(self) -> Tuple[str, str]:
+        """Bitmap keys of the current and the previous month."""
+        month = timezone.now().date().replace(day=1)
+        previous = month - timedelta(days=1)
+        return f"{self.key}:{month:%Y%m}", f"{self.key}:{previous:%Y%m}"
+    
+    def _offsets(self, key: str) -> List[int]:
+        # Double hashing: k bit positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+    
+    def might_contain_many(self, keys: List[str]) -> List[bool]:
+        """
+        Check keys against the filter.
+        
+        Returns:
+            One flag per key: False means the key was definitely never added.
+            If Redis is unreachable every key is reported as possibly seen.
+        """
+        if not keys:
+            return []
+        
+        current, previous = self._period_keys()
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                offsets = self._offsets(key)
+                for bitmap in (current, previous):
+                    for offset in offsets:
+                        pipe.getbit(bitmap, offset)
+            bits = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Bloom filter lookup failed for {self.key}: {e}")
+            return [True] * len(keys)
+        
+        k = self.hash_count
+        return [
+            all(bits[2 * i * k:(2 * i + 1) * k]) or all(bits[(2 * i + 1) * k:(2 * i + 2) * k])
+            for i in range(len(keys))
+        ]
+    
+    def add_many(self, keys: Iterable[str]):
+        """Add keys to the filter; failures only cost future fast-path hits."""
+        current, _ = self._period_keys()
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                for offset in self._offsets(key):
+                    pipe.setbit(current, offset, 1)
+            pipe.expire(current, FILTER_RETENTION)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Bloom filter update failed for {self.key}: {e}")
@@ -0,0 +1,33 @@
+"""
+Shared Redis Client for ETL Utilities
+"""
+
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    import redis
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def get_redis() -> Optional['redis.Redis']:
+    """
+    Return the process-wide Redis client, or None if REDIS_URL is not configured.
+    
+    The client keeps its own connection pool and is created on first use.
+    """
+    global _client
+    
+    url = getattr(settings, 'REDIS_URL', None)
+    if not url:
+        return None
+    
+    if _client is None:
+        import redis
+        _client = redis.Redis.from_url(url)
+    return _client
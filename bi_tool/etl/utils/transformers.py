@@ -3,16 +3,142 @@ Data Transformation Utilities for ETL Processing
 """
 
 import logging
+import multiprocessing
 import re
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Any, Optional, Callable, Union
+from types import CodeType
+from typing import Dict, List, Any, Optional, Callable, Tuple, Union
 from dataclasses import dataclass
 import hashlib
 import json
+import numpy as np
+import orjson
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Batches at least this large are transformed in a process pool; smaller
+# ones do not earn back the cost of starting workers
+PARALLEL_TRANSFORM_MIN_RECORDS = 10_000
+
+# Per-record errors and warnings a transformer logs in full; after that only
+# every ERROR_LOG_SAMPLE_RATE-th is logged
+ERROR_LOG_LIMIT = 100
+ERROR_LOG_SAMPLE_RATE = 1000
+
+# Records transformed within this many seconds share one _processed_at stamp
+PROCESSED_AT_RESOLUTION = 0.001
+
+# Ints up to this magnitude survive a round trip through float unchanged
+MAX_EXACT_FLOAT_INT = 2 ** 53
+
+# Calculate operations with a vectorized form: operation -> (operand
+# parameter, its default, numpy ufunc)
+ARITHMETIC_OPERATIONS = {
+    'multiply': ('multiplier', 1, np.multiply),
+    'divide': ('divisor', 1, np.divide),
+    'add': ('addend', 0, np.add),
+    'subtract': ('subtrahend', 0, np.subtract),
+}
+
+# Timestamp formats _standardize_timestamp accepts. strptime matches their
+# literals case-insensitively and a space as any whitespace, but their
+# separators still differ, so no string matches two of them and the order
+# they are tried in does not change the result.
+TIMESTAMP_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%d',
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y',
+)
+
+# TIMESTAMP_FORMATS reordered to start with each format in turn
+_TIMESTAMP_FORMATS_FROM = {
+    fmt: (fmt,) + tuple(other for other in TIMESTAMP_FORMATS if other != fmt)
+    for fmt in TIMESTAMP_FORMATS
+}
+
+# Hash functions for encrypt rules by algorithm name. hashlib's SHA-256 already
+# uses the CPU's SHA extensions; BLAKE2b (32-byte digest, same length as
+# SHA-256) is faster on CPUs without them
+ENCRYPTION_HASHES = {
+    'sha256': hashlib.sha256,
+    'md5': hashlib.md5,
+    'blake2b': partial(hashlib.blake2b, digest_size=32),
+}
+
+# Common field names copied to their standard names: old -> new
+FIELD_STANDARDIZATION = {
+    'id': 'record_id',
+    'timestamp': 'event_timestamp',
+    'created': 'created_at',
+    'modified': 'updated_at'
+}
+
+# API sales field names copied to their standard names: API -> standard
+API_SALES_FIELD_MAPPING = {
+    'id': 'transaction_id',
+    'customer_id': 'customer_id',
+    'amount': 'total_amount',
+    'created_at': 'sale_time'
+}
+
+# Metadata fields left out of record hashes
+HASH_EXCLUDED_FIELDS = frozenset({'_source', '_processed_at', '_record_hash', '_transformation_error'})
+
+# Record hashes remembered per transformer when config enables
+# memoize_record_hashes
+RECORD_HASH_CACHE_SIZE = 4096
+
+# Value types whose equality implies identical JSON, so records made only of
+# them can be memoized by value (floats are not: 0.0 == -0.0)
+_MEMOIZABLE_HASH_TYPES = frozenset({str, int, bool, type(None)})
+
+# Record hashes are SHA-256 over orjson with sorted keys, like content hashes
+# in etl.fields; non-str keys are stringified as json.dumps does
+HASH_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+# Fallback for records orjson cannot encode (ints beyond 64 bits)
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+# Fixed patterns are compiled once; rule patterns from config go through
+# _compile_pattern, which caches them for the life of the process
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=256)
+def _ascii_deletions(allowed_chars: str) -> Optional[bytes]:
+    """
+    ASCII characters matched by f'[^{allowed_chars}]', for bytes.translate.
+    
+    None unless the pattern is one character class (no brackets in
+    allowed_chars); only then is deleting characters one by one the same
+    as re.sub.
+    """
+    if '[' in allowed_chars or ']' in allowed_chars:
+        return None
+    pattern = _compile_pattern(f'[^{allowed_chars}]')
+    return bytes(code for code in range(128) if pattern.match(chr(code)))
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expression: str) -> CodeType:
+    """Compile a formula or condition once, not for every record it is evaluated on."""
+    return compile(expression, '<expression>', 'eval')
+
 
 @dataclass
 class TransformationRule:
@@ -24,6 +150,27 @@ class TransformationRule:
     condition: Optional[str] = None  # Optional condition for applying transformation
 
 
+class _RecordNamespace(dict):
+    """
+    eval() locals that read names from a record only when referenced.
+    
+    Holds just the extra names it was given (and any assigned by the
+    expression); record fields are looked up on demand instead of copying the
+    record for every evaluation.
+    """
+    
+    def __init__(self, record: Dict[str, Any], numeric_only: bool = False, **names):
+        super().__init__(names)
+        self.record = record
+        self.numeric_only = numeric_only
+    
+    def __missing__(self, name: str) -> Any:
+        value = self.record[name]
+        if self.numeric_only and not isinstance(value, (int, float, complex)):
+            raise KeyError(name)
+        return value
+
+
 class DataTransformer:
     """
     Comprehensive data transformation for ETL processes.
@@ -31,8 +178,39 @@ class DataTransformer:
     
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
+        # Transform handlers by transform type, split by whether they need the whole record
+        self._value_transforms = {
+            'cast': self._transform_cast,
+            'format': self._transform_format,
+            'normalize': self._transform_normalize,
+            'extract': self._transform_extract,
+            'replace': self._transform_replace,
+            'lookup': self._transform_lookup,
+            'split': self._transform_split,
+            'encrypt': self._transform_encrypt,
+            'mask': self._transform_mask,
+        }
+        self._record_transforms = {
+            'calculate': self._transform_calculate,
+            'concatenate': self._transform_concatenate,
+            'custom': self._transform_custom,
+        }
         self.transformation_rules = self._load_transformation_rules()
         self.custom_transformers = self._load_custom_transformers()
+        # Each source's rules, each paired with its step bound by _rule_step
+        self._pipelines = {
+            source: [(rule, self._rule_step(rule)) for rule in rules]
+            for source, rules in self.transformation_rules.items()
+        }
+        # Sorted hashed fields per record schema (set of keys)
+        self._hash_keys: Dict[frozenset, Tuple[str, ...]] = {}
+        # Hashes of recently seen records, for inputs known to repeat records
+        self._hash_cache = OrderedDict() if self.config.get('memoize_record_hashes') else None
+        self._processed_at_tick = float('-inf')
+        self._log_count = 0
+        self._processed_at_iso = ''
+        # Timestamp formats in the order to try them, last match first
+        self._timestamp_formats = TIMESTAMP_FORMATS
     
     def transform(self, source: str, record: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -46,56 +224,82 @@ class DataTransformer:
             Transformed record
         """
         try:
-            # Start with original record
-            transformed_record = record.copy()
-            
-            # Add metadata fields
-            transformed_record['_source'] = source
-            transformed_record['_processed_at'] = datetime.now(timezone.utc).isoformat()
-            transformed_record['_record_hash'] = self._generate_record_hash(record)
+            transformed_record = self._with_metadata(source, record)
             
             # Apply transformation rules
-            source_rules = self.transformation_rules.get(source, [])
-            
-            for rule in source_rules:
-                try:
-                    # Check condition if specified
-                    if rule.condition and not self._evaluate_condition(rule.condition, transformed_record):
-                        continue
-                    
-                    # Apply transformation
-                    transformed_value = self._apply_transformation(
-                        transformed_record.get(rule.source_field),
-                        rule.transform_type,
-                        rule.parameters,
-                        transformed_record
-                    )
-                    
-                    # Set transformed value
-                    if rule.target_field:
-                        transformed_record[rule.target_field] = transformed_value
-                    else:
-                        transformed_record[rule.source_field] = transformed_value
-                        
-                except Exception as e:
-                    logger.error(f"Error applying transformation rule {rule.transform_type} to field {rule.source_field}: {e}")
-                    # Continue with other transformations
-            
-            # Apply source-specific transformations
-            transformed_record = self._apply_source_specific_transformations(source, transformed_record)
-            
-            # Apply standardization
-            transformed_record = self._apply_standardization(transformed_record)
-            
-            return transformed_record
+            for _, step in self._pipelines.get(source, ()):
+                step(transformed_record)
             
+            return self._finish_transform(source, transformed_record)
+        
         except Exception as e:
-            logger.error(f"Error transforming record: {e}")
-            # Return original record with error metadata
-            error_record = record.copy()
-            error_record['_transformation_error'] = str(e)
-            error_record['_processed_at'] = datetime.now(timezone.utc).isoformat()
-            return error_record
+            return self._error_record(record, e)
+    
+    def _with_metadata(self, source: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a record and add the metadata fields every transformed record carries."""
+        # Original record plus metadata fields, built in one dict merge
+        return {
+            **record,
+            '_source': source,
+            '_processed_at': self._processed_at(),
+            '_record_hash': self._generate_record_hash(record),
+        }
+    
+    def _rule_step(self, rule: TransformationRule) -> Callable[[Dict[str, Any]], None]:
+        """
+        Bind a rule into a step that applies it to a record in place.
+        
+        The handler, parameters and target field are resolved once here
+        rather than for every record. Steps log rather than raise on failure.
+        """
+        source_field = rule.source_field
+        target_field = rule.target_field or rule.source_field
+        condition = rule.condition
+        parameters = rule.parameters
+        
+        value_handler = self._value_transforms.get(rule.transform_type)
+        record_handler = self._record_transforms.get(rule.transform_type)
+        if value_handler is not None:
+            def apply(value, record):
+                return value_handler(value, parameters)
+        elif record_handler is not None:
+            def apply(value, record):
+                return record_handler(value, parameters, record)
+        else:
+            def apply(value, record):
+                return self._apply_transformation(value, rule.transform_type, parameters, record)
+        
+        def step(transformed_record: Dict[str, Any]):
+            try:
+                # Check condition if specified
+                if condition and not self._evaluate_condition(condition, transformed_record):
+                    return
+                
+                transformed_record[target_field] = apply(transformed_record.get(source_field), transformed_record)
+            
+            except Exception as e:
+                if self._should_log():
+                    logger.error(f"Error applying transformation rule {rule.transform_type} to field {rule.source_field}: {e}")
+                # Continue with other transformations
+        
+        return step
+    
+    def _finish_transform(self, source: str, transformed_record: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the source-specific and standard transformations that follow the rules."""
+        # Apply source-specific transformations
+        transformed_record = self._apply_source_specific_transformations(source, transformed_record)
+        
+        # Apply standardization
+        return self._apply_standardization(transformed_record)
+    
+    def _error_record(self, record: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Original record with error metadata, returned when transforming it failed."""
+        if self._should_log():
+            logger.error(f"Error transforming record: {error}")
+        error_record = record.copy()
+        error_record['_transformation_error'] = str(error)
+        error_record['_processed_at'] = self._processed_at()
+        return error_record
     
     def transform_batch(self, source: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -108,46 +312,257 @@ class DataTransformer:
         Returns:
             Batch transformation results
         """
+        started_at = datetime.now().isoformat()
+        return self._batch_results(self._transform_records(source, records), started_at)
+    
+    def transform_batch_vectorized(self, source: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Transform a batch of records, one rule at a time over whole columns.
+        
+        Produces the same results as transform_batch, but applies
+        unconditional cast, calculate, normalize, encrypt and mask rules
+        column-wise with pandas/numpy. Values without an exact vectorized form (strings to
+        cast, booleans, ...) and all other rules are applied per record.
+        
+        Args:
+            source: Data source name
+            records: List of records to transform
+        
+        Returns:
+            Batch transformation results
+        """
+        started_at = datetime.now().isoformat()
+        outcomes = [None] * len(records)
+        positions = []
+        rows = []
+        for index, record in enumerate(records):
+            try:
+                rows.append(self._with_metadata(source, record))
+                positions.append(index)
+            except Exception as e:
+                outcomes[index] = (self._error_record(record, e), True)
+        
+        for rule, step in self._pipelines.get(source, ()):
+            transformed_values = None
+            if not rule.condition:
+                values = pd.Series([row.get(rule.source_field) for row in rows], dtype=object)
+                try:
+                    transformed_values = self._vectorized_transform(values, rule)
+                except Exception as e:
+                    logger.warning(f"Falling back to per-record {rule.transform_type} of {rule.source_field}: {e}")
+            
+            handled = np.zeros(len(rows), dtype=bool)
+            if transformed_values is not None:
+                target_field = rule.target_field or rule.source_field
+                for position, value in transformed_values.items():
+                    rows[position][target_field] = value
+                handled[transformed_values.index.to_numpy(dtype=int)] = True
+            
+            for position in np.flatnonzero(~handled):
+                step(rows[position])
+        
+        for index, row in zip(positions, rows):
+            try:
+                transformed_record = self._finish_transform(source, row)
+                outcomes[index] = (transformed_record, '_transformation_error' in transformed_record)
+            except Exception as e:
+                outcomes[index] = (self._error_record(records[index], e), True)
+        
+        return self._batch_results(outcomes, started_at)
+    
+    def _vectorized_transform(self, values: pd.Series, rule: TransformationRule) -> Optional[pd.Series]:
+        """
+        Apply a rule to a whole column.
+        
+        Args:
+            values: Field values, one per record (object dtype, None if missing)
+            rule: Transformation rule to apply
+        
+        Returns:
+            Transformed values indexed by the positions of the records they
+            belong to, or None if the rule type has no vectorized form.
+            Records left out still need the rule applied per record.
+        """
+        parameters = rule.parameters
+        kinds = values.map(type)
+        missing = kinds.eq(type(None))
+        # Exact int/float only: bool and numeric strings keep the per-record rules
+        numeric = kinds.isin([int, float])
+        
+        def transformed(results: pd.Series, missing_value: Any) -> pd.Series:
+            missing_index = missing[missing].index
+            return pd.concat([
+                pd.Series(results.tolist(), index=results.index, dtype=object),
+                pd.Series([missing_value] * len(missing_index), index=missing_index, dtype=object),
+            ])
+        
+        if rule.transform_type == 'cast' and parameters.get('type') in ('int', 'float'):
+            numbers = values[numeric].astype(float)
+            if parameters['type'] == 'float':
+                return transformed(numbers, None)
+            # int(float(value)) fails on nan/inf; int64 holds everything else below 2**63
+            numbers = numbers[np.isfinite(numbers) & (numbers.abs() < 2.0 ** 63)]
+            return transformed(numbers.astype(np.int64), None)
+        
+        elif rule.transform_type == 'calculate' and parameters.get('operation') in ARITHMETIC_OPERATIONS:
+            operand_name, default, operation = ARITHMETIC_OPERATIONS[parameters['operation']]
+            operand = parameters.get(operand_name, default)
+            if type(operand) not in (int, float):
+                return None
+            if operation is np.divide and operand == 0:
+                return pd.Series([0] * len(values), index=values.index, dtype=object)
+            
+            # float(value or 0): missing and zero values (-0.0 included) count as 0.0
+            numbers = values[numeric].astype(float)
+            numbers[numbers == 0] = 0.0
+            with np.errstate(all='ignore'):
+                results = pd.Series(operation(numbers.to_numpy(), operand), index=numbers.index)
+            return transformed(results, float(operation(0.0, operand)))
+        
+        elif rule.transform_type == 'normalize':
+            text = values[kinds == str]
+            if parameters.get('trim', True):
+                text = text.str.strip()
+            if parameters.get('remove_extra_spaces', True):
+                text = text.str.replace(WHITESPACE_RE, ' ', regex=True)
+            
+            case_option = parameters.get('case')
+            if case_option == 'upper':
+                text = text.str.upper()
+            elif case_option == 'lower':
+                text = text.str.lower()
+            elif case_option == 'title':
+                text = text.str.title()
+            elif case_option == 'sentence':
+                text = text.str.capitalize()
+            
+            if parameters.get('remove_special_chars'):
+                allowed_chars = parameters.get('allowed_chars', 'a-zA-Z0-9 ')
+                text = text.str.replace(_compile_pattern(f'[^{allowed_chars}]'), '', regex=True)
+            return transformed(text, None)
+        
+        elif rule.transform_type == 'encrypt' and parameters.get('algorithm', 'sha256') in ENCRYPTION_HASHES:
+            hash_function = ENCRYPTION_HASHES[parameters.get('algorithm', 'sha256')]
+            present = values[~missing]
+            digests = [hash_function(str(value).encode()).hexdigest() for value in present]
+            return transformed(pd.Series(digests, index=present.index, dtype=object), None)
+        
+        elif rule.transform_type == 'mask':
+            return self._vectorized_mask(values[~missing].map(str), parameters, transformed)
+        
+        return None
+    
+    @staticmethod
+    def _vectorized_mask(text: pd.Series, parameters: Dict[str, Any],
+                         transformed: Callable[[pd.Series, Any], pd.Series]) -> Optional[pd.Series]:
+        """Column form of _transform_mask over the string forms of present values."""
+        mask_char = parameters.get('mask_char', '*')
+        mask_type = parameters.get('type', 'partial')
+        show_first = parameters.get('show_first', 2)
+        show_last = parameters.get('show_last', 2)
+        if not isinstance(mask_char, str) or type(show_first) is not int or type(show_last) is not int:
+            return None
+        if show_first < 0 or show_last < 0:
+            return None
+        
+        def masks(lengths: pd.Series) -> pd.Series:
+            return pd.Series(mask_char, index=lengths.index, dtype=object).str.repeat(lengths.clip(lower=0))
+        
+        lengths = text.str.len()
+        if mask_type == 'full':
+            return transformed(masks(lengths), None)
+        
+        elif mask_type == 'partial':
+            # Like text[-show_last:], show_last=0 keeps the whole string
+            masked = text.str.slice(0, show_first) + masks(lengths - show_first - show_last) + text.str.slice(-show_last)
+            short = lengths <= show_first + show_last
+            masked[short] = masks(lengths[short])
+            return transformed(masked, None)
+        
+        elif mask_type == 'email':
+            parts = text.str.partition('@')
+            has_at = parts[1] == '@'
+            # An empty username fails per record, so it is left to that path
+            text = text[~has_at | (parts[0] != '')]
+            parts = parts.loc[text.index]
+            usernames = parts[0]
+            masked = usernames.str.slice(0, 1) + masks(usernames.str.len() - 1) + '@' + parts[2]
+            return transformed(masked.where(has_at.loc[text.index], text), None)
+        
+        return transformed(text, None)
+    
+    def _batch_results(self, outcomes: List[Tuple[Dict[str, Any], bool]], started_at: str) -> Dict[str, Any]:
+        """Batch transformation results from (transformed record, failed) per record."""
         results = {
-            'total_records': len(records),
+            'total_records': len(outcomes),
             'successful_transforms': 0,
             'failed_transforms': 0,
             'transformed_records': [],
             'errors': [],
-            'started_at': datetime.now().isoformat()
+            'started_at': started_at
         }
         
-        for i, record in enumerate(records):
-            try:
-                transformed_record = self.transform(source, record)
-                
-                if '_transformation_error' in transformed_record:
-                    results['failed_transforms'] += 1
-                    results['errors'].append({
-                        'record_index': i,
-                        'error': transformed_record['_transformation_error']
-                    })
-                else:
-                    results['successful_transforms'] += 1
-                
-                results['transformed_records'].append(transformed_record)
-                
-            except Exception as e:
-                logger.error(f"Error transforming record {i}: {e}")
+        for i, (transformed_record, failed) in enumerate(outcomes):
+            if failed:
                 results['failed_transforms'] += 1
                 results['errors'].append({
                     'record_index': i,
-                    'error': str(e)
+                    'error': transformed_record['_transformation_error']
                 })
-                
-                # Add original record with error metadata
-                error_record = record.copy()
-                error_record['_transformation_error'] = str(e)
-                results['transformed_records'].append(error_record)
+            else:
+                results['successful_transforms'] += 1
+            
+            results['transformed_records'].append(transformed_record)
         
         results['completed_at'] = datetime.now().isoformat()
         return results
     
+    def _transform_records(self, source: str, records: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], bool]]:
+        """
+        Transform records in order, across all cores for large batches.
+        
+        Large batches are split into chunks for a process pool, each worker
+        building its own transformer from this one's config. Celery's
+        prefork children cannot start processes, and config holding
+        unpicklable custom transformers cannot be sent to workers; those
+        cases run serially.
+        
+        Returns:
+            (transformed record, failed) per record, in input order
+        """
+        processes = multiprocessing.cpu_count()
+        if (len(records) < PARALLEL_TRANSFORM_MIN_RECORDS or processes < 2
+                or multiprocessing.current_process().daemon):
+            return [self._transform_one(source, record, index) for index, record in enumerate(records)]
+        
+        chunk_size = max(1, len(records) // (processes * 4))
+        chunks = [
+            (start, source, records[start:start + chunk_size])
+            for start in range(0, len(records), chunk_size)
+        ]
+        try:
+            with multiprocessing.Pool(processes, initializer=_init_transform_worker, initargs=(self.config,)) as pool:
+                transformed_chunks = sorted(pool.imap_unordered(_transform_chunk, chunks))
+        except Exception as e:
+            logger.warning(f"Parallel transformation unavailable, transforming serially: {e}")
+            return [self._transform_one(source, record, index) for index, record in enumerate(records)]
+        
+        return [outcome for _, outcomes in transformed_chunks for outcome in outcomes]
+    
+    def _transform_one(self, source: str, record: Dict[str, Any], index: int) -> Tuple[Dict[str, Any], bool]:
+        """Transform one record, turning any failure into an error record."""
+        try:
+            transformed_record = self.transform(source, record)
+            return transformed_record, '_transformation_error' in transformed_record
+        
+        except Exception as e:
+            if self._should_log():
+                logger.error(f"Error transforming record {index}: {e}")
+            # Add original record with error metadata
+            error_record = record.copy()
+            error_record['_transformation_error'] = str(e)
+            return error_record, True
+    
     def _apply_transformation(self, value: Any, transform_type: str, parameters: Dict[str, Any], record: Dict[str, Any]) -> Any:
         """
         Apply a single transformation to a value.
@@ -161,45 +576,17 @@ class DataTransformer:
         Returns:
             Transformed value
         """
-        if transform_type == 'cast':
-            return self._transform_cast(value, parameters)
-        
-        elif transform_type == 'format':
-            return self._transform_format(value, parameters)
-        
-        elif transform_type == 'normalize':
-            return self._transform_normalize(value, parameters)
+        handler = self._value_transforms.get(transform_type)
+        if handler is not None:
+            return handler(value, parameters)
         
-        elif transform_type == 'extract':
-            return self._transform_extract(value, parameters)
+        handler = self._record_transforms.get(transform_type)
+        if handler is not None:
+            return handler(value, parameters, record)
         
-        elif transform_type == 'replace':
-            return self._transform_replace(value, parameters)
-        
-        elif transform_type == 'calculate':
-            return self._transform_calculate(value, parameters, record)
-        
-        elif transform_type == 'lookup':
-            return self._transform_lookup(value, parameters)
-        
-        elif transform_type == 'concatenate':
-            return self._transform_concatenate(value, parameters, record)
-        
-        elif transform_type == 'split':
-            return self._transform_split(value, parameters)
-        
-        elif transform_type == 'encrypt':
-            return self._transform_encrypt(value, parameters)
-        
-        elif transform_type == 'mask':
-            return self._transform_mask(value, parameters)
-        
-        elif transform_type == 'custom':
-            return self._transform_custom(value, parameters, record)
-        
-        else:
+        if self._should_log():
             logger.warning(f"Unknown transformation type: {transform_type}")
-            return value
+        return value
     
     def _transform_cast(self, value: Any, parameters: Dict[str, Any]) -> Any:
         """Cast value to specific type."""
@@ -210,8 +597,19 @@ class DataTransformer:
         
         try:
             if target_type == 'int':
+                # Exact shortcuts for values int(float(value)) cannot round
+                if type(value) is int and -MAX_EXACT_FLOAT_INT <= value <= MAX_EXACT_FLOAT_INT:
+                    return value
+                if type(value) is float:
+                    return int(value)
+                if type(value) is str:
+                    digits = value[1:] if value.startswith('-') else value
+                    if digits.isdecimal() and len(digits) <= 15:
+                        return int(value)
                 return int(float(value))  # Handle decimal strings
             elif target_type == 'float':
+                if type(value) is float:
+                    return value
                 return float(value)
             elif target_type == 'decimal':
                 return Decimal(str(value))
@@ -227,11 +625,13 @@ class DataTransformer:
                     return value
                 return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
             else:
-                logger.warning(f"Unknown cast type: {target_type}")
+                if self._should_log():
+                    logger.warning(f"Unknown cast type: {target_type}")
                 return value
                 
         except (ValueError, TypeError) as e:
-            logger.error(f"Error casting value {value} to {target_type}: {e}")
+            if self._should_log():
+                logger.error(f"Error casting value {value} to {target_type}: {e}")
             return value
     
     def _transform_format(self, value: Any, parameters: Dict[str, Any]) -> Any:
@@ -269,7 +669,8 @@ class DataTransformer:
                 return str(value)
                 
         except (ValueError, TypeError) as e:
-            logger.error(f"Error formatting value {value}: {e}")
+            if self._should_log():
+                logger.error(f"Error formatting value {value}: {e}")
             return value
     
     def _transform_normalize(self, value: Any, parameters: Dict[str, Any]) -> Any:
@@ -284,7 +685,7 @@ class DataTransformer:
             str_value = str_value.strip()
         
         if parameters.get('remove_extra_spaces', True):
-            str_value = re.sub(r'\s+', ' ', str_value)
+            str_value = WHITESPACE_RE.sub(' ', str_value)
         
         # Normalize case
         case_option = parameters.get('case')
@@ -300,7 +701,11 @@ class DataTransformer:
         # Remove special characters if specified
         if parameters.get('remove_special_chars'):
             allowed_chars = parameters.get('allowed_chars', 'a-zA-Z0-9 ')
-            str_value = re.sub(f'[^{allowed_chars}]', '', str_value)
+            deletions = _ascii_deletions(allowed_chars) if isinstance(allowed_chars, str) else None
+            if deletions is not None and str_value.isascii():
+                str_value = str_value.encode('ascii').translate(None, deletions).decode('ascii')
+            else:
+                str_value = _compile_pattern(f'[^{allowed_chars}]').sub('', str_value)
         
         return str_value
     
@@ -316,13 +721,14 @@ class DataTransformer:
             group = parameters.get('group', 0)
             
             try:
-                match = re.search(pattern, str_value)
+                match = _compile_pattern(pattern).search(str_value)
                 if match:
                     return match.group(group)
                 else:
                     return parameters.get('default', '')
             except re.error as e:
-                logger.error(f"Invalid regex pattern {pattern}: {e}")
+                if self._should_log():
+                    logger.error(f"Invalid regex pattern {pattern}: {e}")
                 return str_value
         
         elif 'start' in parameters or 'end' in parameters:
@@ -352,7 +758,7 @@ class DataTransformer:
             use_regex = replacement.get('regex', False)
             
             if use_regex:
-                str_value = re.sub(pattern, replace_with, str_value)
+                str_value = _compile_pattern(pattern).sub(replace_with, str_value)
             else:
                 str_value = str_value.replace(pattern, replace_with)
         
@@ -363,7 +769,7 @@ class DataTransformer:
             use_regex = parameters.get('regex', False)
             
             if use_regex:
-                str_value = re.sub(pattern, replace_with, str_value)
+                str_value = _compile_pattern(pattern).sub(replace_with, str_value)
             else:
                 str_value = str_value.replace(pattern, replace_with)
         
@@ -397,18 +803,19 @@ class DataTransformer:
         elif operation == 'formula':
             # Evaluate formula with record context
             formula = parameters.get('formula')
-            safe_dict = {k: v for k, v in record.items() if isinstance(v, (int, float, complex))}
-            safe_dict['value'] = float(value or 0)
+            safe_dict = _RecordNamespace(record, numeric_only=True, value=float(value or 0))
             
             try:
                 # Simple expression evaluation (be careful with security)
-                return eval(formula, {"__builtins__": {}}, safe_dict)
+                return eval(_compile_expression(formula), {"__builtins__": {}}, safe_dict)
             except Exception as e:
-                logger.error(f"Error evaluating formula {formula}: {e}")
+                if self._should_log():
+                    logger.error(f"Error evaluating formula {formula}: {e}")
                 return value
         
         else:
-            logger.warning(f"Unknown calculation operation: {operation}")
+            if self._should_log():
+                logger.warning(f"Unknown calculation operation: {operation}")
             return value
     
     def _transform_lookup(self, value: Any, parameters: Dict[str, Any]) -> Any:
@@ -438,7 +845,11 @@ class DataTransformer:
         separator = parameters.get('separator', ',')
         index = parameters.get('index', 0)
         
-        parts = str(value).split(separator)
+        # Split only as far as the requested part
+        if index >= 0:
+            parts = str(value).split(separator, index + 1)
+        else:
+            parts = str(value).rsplit(separator, -index)
         
         try:
             return parts[index].strip() if index < len(parts) else ''
@@ -454,13 +865,12 @@ class DataTransformer:
         # In production, use proper encryption libraries
         algorithm = parameters.get('algorithm', 'sha256')
         
-        if algorithm == 'sha256':
-            return hashlib.sha256(str(value).encode()).hexdigest()
-        elif algorithm == 'md5':
-            return hashlib.md5(str(value).encode()).hexdigest()
-        else:
-            logger.warning(f"Unknown encryption algorithm: {algorithm}")
+        hash_function = ENCRYPTION_HASHES.get(algorithm)
+        if hash_function is None:
+            if self._should_log():
+                logger.warning(f"Unknown encryption algorithm: {algorithm}")
             return value
+        return hash_function(str(value).encode()).hexdigest()
     
     def _transform_mask(self, value: Any, parameters: Dict[str, Any]) -> Any:
         """Mask sensitive data."""
@@ -506,10 +916,12 @@ class DataTransformer:
             try:
                 return transformer_func(value, parameters, record)
             except Exception as e:
-                logger.error(f"Error in custom transformer {function_name}: {e}")
+                if self._should_log():
+                    logger.error(f"Error in custom transformer {function_name}: {e}")
                 return value
         else:
-            logger.warning(f"Custom transformer not found: {function_name}")
+            if self._should_log():
+                logger.warning(f"Custom transformer not found: {function_name}")
             return value
     
     def _apply_source_specific_transformations(self, source: str, record: Dict[str, Any]) -> Dict[str, Any]:
@@ -552,16 +964,12 @@ class DataTransformer:
     def _transform_api_sales_data(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """Transform API sales data."""
         # Map API field names to standard field names
-        field_mapping = {
-            'id': 'transaction_id',
-            'customer_id': 'customer_id',
-            'amount': 'total_amount',
-            'created_at': 'sale_time'
-        }
-        
-        for api_field, standard_field in field_mapping.items():
-            if api_field in record and standard_field not in record:
-                record[standard_field] = record[api_field]
+        if not API_SALES_FIELD_MAPPING.keys().isdisjoint(record.keys()):
+            record.update({
+                standard_field: record[api_field]
+                for api_field, standard_field in API_SALES_FIELD_MAPPING.items()
+                if api_field in record and standard_field not in record
+            })
         
         return record
     
@@ -570,12 +978,13 @@ class DataTransformer:
         # Handle common CSV issues
         for key, value in record.items():
             if isinstance(value, str):
-                # Remove BOM characters
-                record[key] = value.replace('\ufeff', '')
-                
-                # Handle empty strings
-                if value.strip() == '':
+                # Handle empty strings (isspace() uses strip()'s notion of whitespace)
+                if not value or value.isspace():
                     record[key] = None
+                
+                # Remove BOM characters
+                elif '\ufeff' in value:
+                    record[key] = value.replace('\ufeff', '')
         
         return record
     
@@ -595,21 +1004,17 @@ class DataTransformer:
     
     def _apply_standardization(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """Apply standard transformations to all records."""
-        # Standardize common field names
-        field_standardization = {
-            'id': 'record_id',
-            'timestamp': 'event_timestamp',
-            'created': 'created_at',
-            'modified': 'updated_at'
-        }
-        
-        for old_field, new_field in field_standardization.items():
-            if old_field in record and new_field not in record:
-                record[new_field] = record[old_field]
+        # Standardize common field names; most records carry none of them
+        if not FIELD_STANDARDIZATION.keys().isdisjoint(record.keys()):
+            record.update({
+                new_field: record[old_field]
+                for old_field, new_field in FIELD_STANDARDIZATION.items()
+                if old_field in record and new_field not in record
+            })
         
         # Ensure required metadata fields
         if '_processed_at' not in record:
-            record['_processed_at'] = datetime.now(timezone.utc).isoformat()
+            record['_processed_at'] = self._processed_at()
         
         return record
     
@@ -625,46 +1030,98 @@ class DataTransformer:
             # Try to parse various timestamp formats
             timestamp_str = str(timestamp_value)
             
-            # Common formats to try
-            formats = [
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d %H:%M:%S.%f',
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%dT%H:%M:%S.%f',
-                '%Y-%m-%dT%H:%M:%SZ',
-                '%Y-%m-%d',
-                '%m/%d/%Y %H:%M:%S',
-                '%m/%d/%Y'
-            ]
-            
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(timestamp_str, fmt)
+            # Every format starts with a digit, so other strings cannot match.
+            # Streams repeat one format, so the last match is tried first.
+            if timestamp_str[:1].isdigit():
+                for fmt in self._timestamp_formats:
+                    try:
+                        dt = datetime.strptime(timestamp_str, fmt)
+                    except ValueError:
+                        continue
+                    self._timestamp_formats = _TIMESTAMP_FORMATS_FROM[fmt]
                     return dt.isoformat()
-                except ValueError:
-                    continue
             
             # If all formats fail, return original
-            logger.warning(f"Could not parse timestamp: {timestamp_value}")
+            if self._should_log():
+                logger.warning(f"Could not parse timestamp: {timestamp_value}")
             return timestamp_str
             
         except Exception as e:
-            logger.error(f"Error standardizing timestamp {timestamp_value}: {e}")
+            if self._should_log():
+                logger.error(f"Error standardizing timestamp {timestamp_value}: {e}")
             return str(timestamp_value)
     
-    def _generate_record_hash(self, record: Dict[str, Any]) -> str:
-        """Generate hash for record deduplication."""
-        # Create a stable representation of the record
-        # Exclude metadata fields from hash calculation
-        excluded_fields = {'_source', '_processed_at', '_record_hash', '_transformation_error'}
+    def _should_log(self) -> bool:
+        """
+        Whether to log the next per-record error or warning.
         
-        hash_dict = {k: v for k, v in record.items() if k not in excluded_fields}
+        Bad input can fail every record of a batch, so past ERROR_LOG_LIMIT
+        messages only a sample is logged; callers check first so skipped
+        messages are never formatted.
+        """
+        self._log_count += 1
+        if self._log_count == ERROR_LOG_LIMIT + 1:
+            logger.warning(
+                f"Logged {ERROR_LOG_LIMIT} transformation errors, "
+                f"logging 1 in {ERROR_LOG_SAMPLE_RATE} from now on"
+            )
+        return self._log_count <= ERROR_LOG_LIMIT or self._log_count % ERROR_LOG_SAMPLE_RATE == 0
+    
+    def _processed_at(self) -> str:
+        """Current UTC time in ISO format, formatted at most once per PROCESSED_AT_RESOLUTION."""
+        tick = time.monotonic()
+        if tick - self._processed_at_tick >= PROCESSED_AT_RESOLUTION:
+            self._processed_at_tick = tick
+            self._processed_at_iso = datetime.now(timezone.utc).isoformat()
+        return self._processed_at_iso
+    
+    def _generate_record_hash(self, record: Dict[str, Any]) -> str:
+        """
+        Generate hash for record deduplication.
         
+        Hashes are not persisted across runs: hashing a record takes a few
+        microseconds, less than a disk or Redis lookup, and only a hash of the
+        full content stays correct when a reprocessed record has changed.
+        """
+        # Records of one source share a few schemas, so the hashed fields are
+        # filtered and sorted once per schema
+        schema = frozenset(record)
+        hash_keys = self._hash_keys.get(schema)
+        if hash_keys is None:
+            hash_keys = self._hash_keys[schema] = tuple(sorted(schema - HASH_EXCLUDED_FIELDS))
+        
+        if self._hash_cache is None:
+            return self._hash_fields(record, hash_keys)
+        
+        # Memoize only by exact content, never by an approximate fingerprint:
+        # a wrong hash would merge distinct records
+        values = tuple([record[k] for k in hash_keys])
+        value_types = tuple(map(type, values))
+        if not _MEMOIZABLE_HASH_TYPES.issuperset(value_types):
+            return self._hash_fields(record, hash_keys)
+        
+        cache_key = (hash_keys, value_types, values)
+        record_hash = self._hash_cache.get(cache_key)
+        if record_hash is not None:
+            self._hash_cache.move_to_end(cache_key)
+            return record_hash
+        
+        record_hash = self._hash_cache[cache_key] = self._hash_fields(record, hash_keys)
+        if len(self._hash_cache) > RECORD_HASH_CACHE_SIZE:
+            self._hash_cache.popitem(last=False)
+        return record_hash
+    
+    @staticmethod
+    def _hash_fields(record: Dict[str, Any], hash_keys: Tuple[str, ...]) -> str:
         # Create consistent JSON representation
-        record_json = json.dumps(hash_dict, sort_keys=True, default=str)
+        hash_dict = {k: record[k] for k in hash_keys}
+        try:
+            payload = orjson.dumps(hash_dict, default=str, option=HASH_JSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            payload = _HASH_ENCODER.encode(hash_dict).encode()
         
         # Generate SHA-256 hash
-        return hashlib.sha256(record_json.encode()).hexdigest()
+        return hashlib.sha256(payload).hexdigest()
     
     def _evaluate_condition(self, condition: str, record: Dict[str, Any]) -> bool:
         """Evaluate condition for conditional transformations."""
@@ -674,11 +1131,12 @@ class DataTransformer:
             
             # More sophisticated condition evaluation could use a parser
             # For now, use basic eval with restricted context
-            safe_dict = {k: v for k, v in record.items()}
-            return eval(condition, {"__builtins__": {}}, safe_dict)
-            
+            safe_dict = _RecordNamespace(record)
+            return eval(_compile_expression(condition), {"__builtins__": {}}, safe_dict)
+        
         except Exception as e:
-            logger.error(f"Error evaluating condition {condition}: {e}")
+            if self._should_log():
+                logger.error(f"Error evaluating condition {condition}: {e}")
             return False
     
     def _load_transformation_rules(self) -> Dict[str, List[TransformationRule]]:
@@ -716,4 +1174,21 @@ class DataTransformer:
     
     def _load_custom_transformers(self) -> Dict[str, Callable]:
         """Load custom transformer functions."""
-        return self.config.get('custom_transformers', {})
\ No newline at end of file
+        return self.config.get('custom_transformers', {})
+
+
+# Transformer of a transform_batch pool worker, built once per process
+_worker_transformer = None
+
+
+def _init_transform_worker(config: Dict[str, Any]):
+    global _worker_transformer
+    _worker_transformer = DataTransformer(config)
+
+
+def _transform_chunk(chunk: Tuple[int, str, List[Dict[str, Any]]]) -> Tuple[int, List[Tuple[Dict[str, Any], bool]]]:
+    start, source, records = chunk
+    return start, [
+        _worker_transformer._transform_one(source, record, start + offset)
+        for offset, record in enumerate(records)
+    ]
@@ -4,15 +4,64 @@ Data Validation Utilities for ETL Processing
 
 import re
 import logging
+import multiprocessing
+from collections import Counter
+from functools import lru_cache
 from decimal import Decimal, InvalidOperation
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 import jsonschema
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# validate_batch_parallel starts one worker per this many records
+PARALLEL_VALIDATION_SHARD_SIZE = 5_000
+
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+
+# Compiled once at import; rule patterns from configuration go through
+# _compile_pattern, which caches them for the life of the process
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+PHONE_RE = re.compile(r'^[\+]?[1-9][\d]{0,15}$')  # International format
+PHONE_STRIP_RE = re.compile(r'[^\d\+]')
+# The ASCII characters PHONE_STRIP_RE removes, for bytes.translate
+PHONE_ASCII_DELETIONS = bytes(code for code in range(128) if PHONE_STRIP_RE.match(chr(code)))
+
+
+# Numeric strings every Python and pandas parser reads the same way; other
+# strings are left to the per-record checks
+ASCII_INT_RE = re.compile(r'[+-]?[0-9]+')
+ASCII_FLOAT_RE = re.compile(r'[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?')
+
+# Ints up to this magnitude convert to float without overflow, and up to
+# MAX_EXACT_FLOAT_INT without rounding
+MAX_FLOAT_INT = 2 ** 1023
+MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+def _clean_phone(phone: str) -> str:
+    """Remove everything but digits and '+', by table for ASCII phone numbers."""
+    if phone.isascii():
+        return phone.encode('ascii').translate(None, PHONE_ASCII_DELETIONS).decode('ascii')
+    return PHONE_STRIP_RE.sub('', phone)
+
+
+def _parses(parse: Callable, *args) -> bool:
+    """Whether parse(*args) succeeds, treating only ValueError as a failed parse."""
+    try:
+        parse(*args)
+        return True
+    except ValueError:
+        return False
+
 
 @dataclass
 class ValidationRule:
@@ -33,29 +82,47 @@ class DataValidator:
         self.config = config or {}
         self.validation_rules = self._load_validation_rules()
         self.schema_cache = {}
+        # Validators by rule type for rules that check only the field's value
+        self._value_validators = {
+            'required': self._validate_required,
+            'type': self._validate_type,
+            'range': self._validate_range,
+            'length': self._validate_length,
+            'pattern': self._validate_pattern,
+            'enum': self._validate_enum,
+            'date_format': self._validate_date_format,
+            'currency': self._validate_currency,
+            'email': self._validate_email,
+            'phone': self._validate_phone,
+        }
+        # Each source's rules, each paired with its check bound by _rule_check
+        self._rule_checks = {
+            source: [(rule, self._rule_check(rule)) for rule in rules]
+            for source, rules in self.validation_rules.items()
+        }
     
-    def validate(self, source: str, record: Dict[str, Any]) -> Dict[str, Any]:
+    def validate(self, source: str, record: Dict[str, Any], validated_at: Optional[str] = None) -> Dict[str, Any]:
         """
         Validate a single record against configured rules.
         
         Args:
             source: Data source name
             record: Record to validate
-            
+            validated_at: Timestamp to report, so a batch can share one;
+                defaults to now
+        
         Returns:
             Dict with validation results
         """
         errors = []
         warnings = []
+        validated_at = validated_at or datetime.now().isoformat()
         
         try:
-            # Get validation rules for this source
-            source_rules = self.validation_rules.get(source, [])
-            
-            # Apply each validation rule
-            for rule in source_rules:
+            # Apply each validation rule for this source
+            for rule, check in self._rule_checks.get(source, ()):
                 try:
-                    result = self._apply_rule(record, rule)
+                    result = check(record)
                     if not result['valid']:
                         if rule.severity == 'error':
                             errors.append({
@@ -93,7 +160,7 @@ class DataValidator:
                 'is_valid': len(errors) == 0,
                 'errors': errors,
                 'warnings': warnings,
-                'validated_at': datetime.now().isoformat()
+                'validated_at': validated_at
             }
             
         except Exception as e:
@@ -107,7 +174,7 @@ class DataValidator:
                     'value': None
                 }],
                 'warnings': [],
-                'validated_at': datetime.now().isoformat()
+                'validated_at': validated_at
             }
     
     def validate_batch(self, source: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -118,57 +185,89 @@ class DataValidator:
             source: Data source name
             records: List of records to validate
             
+        Returns:
+            Batch validation results: counts, per-record error and warning
+            counts in validation_details, and the errors and warnings
+            themselves in failed, for records that have any
+        """
+        started_at = datetime.now().isoformat()
+        # Rules run column-wise over the whole batch; see validate_records
+        return self._batch_results(self.validate_records(source, records), started_at)
+    
+    def validate_batch_parallel(self, source: str, records: List[Dict[str, Any]],
+                                workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Validate a batch of records across processes, one shard per worker.
+        
+        Each worker builds its own validator from this one's config and runs
+        validate_records on its shard; results are merged in input order, so
+        the report matches validate_batch's. Small batches, Celery's prefork
+        children (which cannot start processes) and config holding
+        unpicklable custom validators are validated serially.
+        
+        Args:
+            source: Data source name
+            records: List of records to validate
+            workers: Number of processes; defaults to one per
+                PARALLEL_VALIDATION_SHARD_SIZE records, up to the CPU count
+        
         Returns:
             Batch validation results
         """
+        if workers is None:
+            workers = min(multiprocessing.cpu_count(), max(1, len(records) // PARALLEL_VALIDATION_SHARD_SIZE))
+        if workers < 2 or multiprocessing.current_process().daemon:
+            return self.validate_batch(source, records)
+        
+        started_at = datetime.now().isoformat()
+        shard_size = -(-len(records) // workers)
+        shards = [
+            (offset, source, records[offset:offset + shard_size])
+            for offset in range(0, len(records), shard_size)
+        ]
+        try:
+            with multiprocessing.Pool(workers, initializer=_init_validation_worker, initargs=(self.config,)) as pool:
+                validated_shards = sorted(pool.imap_unordered(_validate_shard, shards))
+        except Exception as e:
+            logger.warning(f"Parallel validation unavailable, validating serially: {e}")
+            return self.validate_batch(source, records)
+        
+        results = [result for _, shard_results in validated_shards for result in shard_results]
+        return self._batch_results(results, started_at)
+    
+    def _batch_results(self, results: List[Dict[str, Any]], started_at: str) -> Dict[str, Any]:
+        """Build the batch validation report from per-record results in input order."""
         batch_results = {
-            'total_records': len(records),
+            'total_records': len(results),
             'valid_records': 0,
             'invalid_records': 0,
             'warnings': 0,
             'validation_details': [],
+            'failed': [],
             'summary': {},
-            'started_at': datetime.now().isoformat()
+            'started_at': started_at
         }
         
-        for i, record in enumerate(records):
-            try:
-                result = self.validate(source, record)
-                
-                record_info = {
+        for i, result in enumerate(results):
+            batch_results['validation_details'].append({
+                'record_index': i,
+                'is_valid': result['is_valid'],
+                'error_count': len(result['errors']),
+                'warning_count': len(result['warnings'])
+            })
+            if result['errors'] or result['warnings']:
+                batch_results['failed'].append({
                     'record_index': i,
-                    'is_valid': result['is_valid'],
-                    'error_count': len(result['errors']),
-                    'warning_count': len(result['warnings']),
                     'errors': result['errors'],
                     'warnings': result['warnings']
-                }
-                
-                batch_results['validation_details'].append(record_info)
-                
-                if result['is_valid']:
-                    batch_results['valid_records'] += 1
-                else:
-                    batch_results['invalid_records'] += 1
-                
-                batch_results['warnings'] += len(result['warnings'])
-                
-            except Exception as e:
-                logger.error(f"Error validating record {i}: {e}")
-                batch_results['invalid_records'] += 1
-                batch_results['validation_details'].append({
-                    'record_index': i,
-                    'is_valid': False,
-                    'error_count': 1,
-                    'warning_count': 0,
-                    'errors': [{
-                        'field': '__system__',
-                        'rule': 'system_error',
-                        'message': str(e),
-                        'value': None
-                    }],
-                    'warnings': []
                 })
+            
+            if result['is_valid']:
+                batch_results['valid_records'] += 1
+            else:
+                batch_results['invalid_records'] += 1
+            
+            batch_results['warnings'] += len(result['warnings'])
         
         # Generate summary statistics
         batch_results['summary'] = self._generate_validation_summary(batch_results)
@@ -176,57 +275,267 @@ class DataValidator:
         
         return batch_results
     
-    def _apply_rule(self, record: Dict[str, Any], rule: ValidationRule) -> Dict[str, Any]:
+    def validate_records(self, source: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Apply a single validation rule to a record.
+        Validate many records at once, one rule at a time over whole columns.
+        
+        Produces the same per-record results as calling validate() on each
+        record, but checks rules column-wise with pandas so common rule types
+        run as vectorized operations. Rule types without a vectorized form
+        (custom), and values a column check cannot decide exactly, fall back
+        to per-record checks.
         
         Args:
-            record: Record to validate
+            source: Data source name
+            records: Records to validate
+        
+        Returns:
+            List of validation results, one per record, in input order
+        """
+        try:
+            errors = [[] for _ in records]
+            warnings = [[] for _ in records]
+            columns = {}
+            
+            for rule, check in self._rule_checks.get(source, ()):
+                if rule.field not in columns:
+                    columns[rule.field] = pd.Series([record.get(rule.field) for record in records], dtype=object)
+                
+                try:
+                    checked = self._vectorized_rule_failures(columns[rule.field], rule)
+                except Exception as e:
+                    logger.warning(f"Falling back to per-record {rule.rule_type} check on {rule.field}: {e}")
+                    checked = None
+                
+                if checked is None:
+                    self._apply_rule_per_record(records, rule, check, errors, warnings)
+                    continue
+                
+                failures, undecided = checked
+                if undecided.any():
+                    self._apply_rule_per_record(records, rule, check, errors, warnings,
+                                                positions=np.flatnonzero(undecided.to_numpy()))
+                
+                target = errors if rule.severity == 'error' else warnings
+                for index, message in failures.items():
+                    target[index].append({
+                        'field': rule.field,
+                        'rule': rule.rule_type,
+                        'message': message,
+                        'value': records[index].get(rule.field)
+                    })
+            
+            business_errors = self._business_logic_failures(source, records)
+            for index, record in enumerate(records):
+                errors[index].extend(self._validate_schema(source, record))
+                errors[index].extend(business_errors[index])
+            
+            validated_at = datetime.now().isoformat()
+            return [
+                {
+                    'is_valid': len(record_errors) == 0,
+                    'errors': record_errors,
+                    'warnings': record_warnings,
+                    'validated_at': validated_at
+                }
+                for record_errors, record_warnings in zip(errors, warnings)
+            ]
+        
+        except Exception as e:
+            logger.error(f"Error in batch validation, validating records one by one: {e}")
+            validated_at = datetime.now().isoformat()
+            return [self.validate(source, record, validated_at) for record in records]
+    
+    def _vectorized_rule_failures(self, values: pd.Series, rule: ValidationRule) -> Optional[Tuple[pd.Series, pd.Series]]:
+        """
+        Check a rule against a whole column.
+        
+        Only values whose outcome is certain to match the per-record check
+        are decided here, e.g. numbers and plain ASCII numeric strings for
+        numeric rules; strings such as '1_000', 'nan' or '٣', which int() and
+        float() parse differently than pandas would, are left undecided.
+        
+        Args:
+            values: Field values, one per record (object dtype, None if missing)
             rule: Validation rule to apply
             
         Returns:
-            Dict with validation result
+            Error messages indexed by the positions of failing records, and a
+            mask of the records still to check per record; or None if the rule
+            type has no vectorized form
         """
-        field_value = record.get(rule.field)
+        kinds = values.map(type)
+        present = kinds.ne(type(None))
+        # str() per value, as the per-record checks do (astype(str) differs for nan).
+        # Kept as object dtype: pandas' Arrow string backend would run .str
+        # methods with RE2 and Arrow semantics instead of Python's
+        text = values[present].map(str).astype(object)
+        all_decided = pd.Series(False, index=values.index)
+        
+        def failed(mask: pd.Series, message: str) -> pd.Series:
+            return pd.Series(message, index=mask[mask].index, dtype=object)
+        
+        def matches(strings: pd.Series, regex: re.Pattern) -> pd.Series:
+            return strings.map(lambda value: regex.match(value) is not None).astype(bool)
+        
+        def numeric_strings(pattern: re.Pattern) -> pd.Series:
+            is_str = kinds == str
+            matches = pd.Series(False, index=values.index)
+            matches[is_str] = values[is_str].map(lambda value: pattern.fullmatch(value) is not None).astype(bool)
+            return matches
+        
+        def fits_float() -> pd.Series:
+            # float() overflows on ints beyond float range
+            is_int = kinds == int
+            fits = pd.Series(False, index=values.index)
+            fits[is_int] = values[is_int].map(lambda value: abs(value) <= MAX_FLOAT_INT).astype(bool)
+            return fits
         
         if rule.rule_type == 'required':
-            return self._validate_required(field_value, rule)
+            return pd.concat([
+                failed(~present, rule.error_message),
+                failed(text.str.strip() == '', rule.error_message),
+            ]).sort_index(), all_decided
         
         elif rule.rule_type == 'type':
-            return self._validate_type(field_value, rule)
+            expected_type = rule.parameters.get('type')
+            is_float = kinds == float
+            if expected_type == 'int':
+                # int() raises OverflowError on inf, reported as a rule error per record
+                finite = pd.Series(False, index=values.index)
+                finite[is_float] = np.isfinite(values[is_float].astype(float))
+                valid = kinds.isin([int, bool]) | finite | numeric_strings(ASCII_INT_RE)
+                invalid = is_float & values.map(lambda value: value != value)
+            elif expected_type == 'float':
+                valid = kinds.eq(bool) | is_float | fits_float() | numeric_strings(ASCII_FLOAT_RE)
+                invalid = pd.Series(False, index=values.index)
+            elif expected_type == 'decimal':
+                # Decimal(str(value)): every int and float (nan, inf too) parses, 'True' does not
+                valid = kinds.eq(int) | is_float | numeric_strings(ASCII_FLOAT_RE)
+                invalid = kinds == bool
+            else:
+                return None
+            return failed(invalid, rule.error_message), present & ~valid & ~invalid
         
         elif rule.rule_type == 'range':
-            return self._validate_range(field_value, rule)
+            min_val = rule.parameters.get('min')
+            max_val = rule.parameters.get('max')
+            # numpy compares against float bounds; Python compares ints exactly
+            for bound in (min_val, max_val):
+                if bound is not None and (type(bound) not in (int, float) or abs(bound) > MAX_EXACT_FLOAT_INT):
+                    return None
+            
+            numeric = kinds.isin([bool, float]) | fits_float() | numeric_strings(ASCII_FLOAT_RE)
+            numbers = values[numeric].map(float).astype(float)
+            out_of_range = pd.Series(False, index=numbers.index)
+            if min_val is not None:
+                out_of_range |= numbers < min_val
+            if max_val is not None:
+                out_of_range |= numbers > max_val
+            return failed(out_of_range, rule.error_message), present & ~numeric
         
         elif rule.rule_type == 'length':
-            return self._validate_length(field_value, rule)
+            lengths = text.str.len()
+            min_len = rule.parameters.get('min')
+            max_len = rule.parameters.get('max')
+            invalid = pd.Series(False, index=lengths.index)
+            if min_len is not None:
+                invalid |= lengths < min_len
+            if max_len is not None:
+                invalid |= lengths > max_len
+            return failed(invalid, rule.error_message), all_decided
         
         elif rule.rule_type == 'pattern':
-            return self._validate_pattern(field_value, rule)
+            pattern = rule.parameters.get('pattern')
+            if not pattern:
+                return None
+            return failed(~matches(text, _compile_pattern(pattern)), rule.error_message), all_decided
         
         elif rule.rule_type == 'enum':
-            return self._validate_enum(field_value, rule)
+            allowed_values = rule.parameters.get('values', [])
+            if not isinstance(allowed_values, (list, tuple)):
+                return None
+            # Membership by hash agrees with list membership (==) for these types
+            simple = kinds.isin([str, int, bool])
+            return failed(simple & ~values.isin(allowed_values), rule.error_message), present & ~simple
         
         elif rule.rule_type == 'date_format':
-            return self._validate_date_format(field_value, rule)
+            date_format = rule.parameters.get('format', '%Y-%m-%d')
+            return failed(~text.map(lambda value: _parses(datetime.strptime, value, date_format)).astype(bool),
+                          rule.error_message), all_decided
         
         elif rule.rule_type == 'currency':
-            return self._validate_currency(field_value, rule)
+            cleaned = text.str.replace('$', '', regex=False).str.replace(',', '', regex=False).str.strip()
+            return failed(~cleaned.map(lambda value: _parses(float, value)).astype(bool), rule.error_message), all_decided
         
         elif rule.rule_type == 'email':
-            return self._validate_email(field_value, rule)
+            return failed(~matches(text, EMAIL_RE), rule.error_message), all_decided
         
         elif rule.rule_type == 'phone':
-            return self._validate_phone(field_value, rule)
+            cleaned = text.map(_clean_phone)
+            return failed(~matches(cleaned, PHONE_RE), rule.error_message), all_decided
+        
+        return None
+    
+    def _apply_rule_per_record(self, records: List[Dict[str, Any]], rule: ValidationRule,
+                               check: Callable[[Dict[str, Any]], Dict[str, Any]],
+                               errors: List[List[Dict[str, Any]]], warnings: List[List[Dict[str, Any]]],
+                               positions: Optional[Iterable[int]] = None):
+        """Apply a rule record by record (or to the records at positions), appending failures as validate() would."""
+        for index in range(len(records)) if positions is None else positions:
+            record = records[index]
+            try:
+                result = check(record)
+                if result['valid']:
+                    continue
+                target = errors if rule.severity == 'error' else warnings
+                message = result['message']
+            except Exception as e:
+                logger.error(f"Error applying validation rule {rule.rule_type} to field {rule.field}: {e}")
+                target = errors
+                message = f"Validation rule error: {str(e)}"
+            
+            target[index].append({
+                'field': rule.field,
+                'rule': rule.rule_type,
+                'message': message,
+                'value': record.get(rule.field)
+            })
+    
+    def _rule_check(self, rule: ValidationRule) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Bind a validation rule into a check of a whole record.
+        
+        The validator for the rule type is looked up once here rather than
+        for every record.
+        
+        Args:
+            rule: Validation rule to apply
+        
+        Returns:
+            Callable taking a record and returning the validation result dict
+        """
+        field = rule.field
+        validator = self._value_validators.get(rule.rule_type)
+        
+        if validator is not None:
+            def check(record: Dict[str, Any]) -> Dict[str, Any]:
+                return validator(record.get(field), rule)
         
         elif rule.rule_type == 'custom':
-            return self._validate_custom(field_value, rule, record)
+            def check(record: Dict[str, Any]) -> Dict[str, Any]:
+                return self._validate_custom(record.get(field), rule, record)
         
         else:
-            return {
+            unknown = {
                 'valid': False,
                 'message': f"Unknown validation rule type: {rule.rule_type}"
             }
+            
+            def check(record: Dict[str, Any]) -> Dict[str, Any]:
+                return dict(unknown)
+        
+        return check
     
     def _validate_required(self, value: Any, rule: ValidationRule) -> Dict[str, Any]:
         """Validate required field."""
@@ -314,7 +623,7 @@ class DataValidator:
             return {'valid': False, 'message': "Pattern not specified"}
         
         try:
-            if re.match(pattern, str(value)):
+            if _compile_pattern(pattern).match(str(value)):
                 return {'valid': True, 'message': ''}
             else:
                 return {'valid': False, 'message': rule.error_message}
@@ -364,9 +673,7 @@ class DataValidator:
         if value is None:
             return {'valid': True, 'message': ''}
         
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if re.match(email_pattern, str(value)):
+        if EMAIL_RE.match(str(value)):
             return {'valid': True, 'message': ''}
         else:
             return {'valid': False, 'message': rule.error_message}
@@ -376,13 +683,10 @@ class DataValidator:
         if value is None:
             return {'valid': True, 'message': ''}
         
-        # Basic phone validation - can be customized based on requirements
-        phone_pattern = r'^[\+]?[1-9][\d]{0,15}$'  # International format
-        
-        # Clean phone number
-        cleaned_phone = re.sub(r'[^\d\+]', '', str(value))
+        # Clean phone number, then check the international format
+        cleaned_phone = _clean_phone(str(value))
         
-        if re.match(phone_pattern, cleaned_phone):
+        if PHONE_RE.match(cleaned_phone):
             return {'valid': True, 'message': ''}
         else:
             return {'valid': False, 'message': rule.error_message}
@@ -413,12 +717,15 @@ class DataValidator:
     
     def _validate_schema(self, source: str, record: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Validate against JSON schema if available."""
-        schema = self._get_schema(source)
-        if not schema:
-            return []
-        
         try:
-            jsonschema.validate(record, schema)
+            validator = self._get_validator(source)
+            if validator is None:
+                return []
+            
+            # The error jsonschema.validate() would raise
+            error = jsonschema.exceptions.best_match(validator.iter_errors(record))
+            if error is not None:
+                raise error
             return []
             
         except jsonschema.ValidationError as e:
@@ -459,6 +766,65 @@ class DataValidator:
         
         return errors
     
+    def _business_logic_failures(self, source: str, records: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Apply source-specific business logic to many records at once.
+        
+        The numeric checks run over float64 arrays in single fused numpy
+        expressions; values that float() rejects become NaN, and NaN fails
+        no comparison, which matches the per-record checks skipping them.
+        
+        Args:
+            source: Data source name
+            records: Records to check
+        
+        Returns:
+            Business logic errors per record, in input order
+        """
+        errors = [[] for _ in records]
+        
+        def column(field: str) -> np.ndarray:
+            return np.fromiter(
+                (_to_float(record.get(field, 0)) for record in records),
+                dtype=np.float64, count=len(records)
+            )
+        
+        def report(mask: np.ndarray, field: str, values: np.ndarray, message) -> None:
+            for index in np.flatnonzero(mask):
+                value = float(values[index])
+                errors[index].append({
+                    'field': field,
+                    'rule': 'business_logic',
+                    'message': message(value, index),
+                    'value': value
+                })
+        
+        try:
+            with np.errstate(invalid='ignore', over='ignore'):
+                if source in ['pos', 'api_sales']:
+                    quantity = column('quantity')
+                    total = column('total_amount')
+                    expected_total = quantity * column('price')
+                    report(np.abs(total - expected_total) > 0.01, 'total_amount', total,
+                           lambda value, index: f"Total amount {value} doesn't match quantity × price "
+                                                f"({float(expected_total[index])})")
+                    report(quantity > 1000, 'quantity', quantity,
+                           lambda value, index: f"Unusually high quantity: {value}")
+                elif source == 'inventory':
+                    stock_level = column('current_stock')
+                    report(stock_level < 0, 'current_stock', stock_level,
+                           lambda value, index: "Stock level cannot be negative")
+                elif source == 'staff':
+                    hours_worked = column('hours_worked')
+                    report(hours_worked > 16, 'hours_worked', hours_worked,
+                           lambda value, index: f"Unusually high work hours: {value}")
+        
+        except Exception as e:
+            logger.warning(f"Falling back to per-record business logic checks for {source}: {e}")
+            return [self._validate_business_logic(source, record) for record in records]
+        
+        return errors
+    
     def _validate_sales_business_logic(self, record: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Validate sales-specific business logic."""
         errors = []
@@ -573,37 +939,64 @@ class DataValidator:
         
         return default_rules
     
-    def _get_schema(self, source: str) -> Optional[Dict[str, Any]]:
-        """Get JSON schema for source."""
+    def _get_validator(self, source: str) -> Optional[jsonschema.protocols.Validator]:
+        """
+        Get the JSON schema validator for source, built once per source.
+        
+        Uses the validator class for the schema's $schema (the latest draft
+        if unset), as jsonschema.validate() does.
+        
+        Raises:
+            jsonschema.SchemaError: If the source's schema is invalid
+        """
         if source in self.schema_cache:
             return self.schema_cache[source]
         
         # Load schema from config or file
         schemas = self.config.get('schemas', {})
         schema = schemas.get(source)
+        if not schema:
+            return None
         
-        if schema:
-            self.schema_cache[source] = schema
-        
-        return schema
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        self.schema_cache[source] = validator_class(schema)
+        return self.schema_cache[source]
     
     def _generate_validation_summary(self, batch_results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate summary statistics for batch validation."""
-        error_counts = {}
-        warning_counts = {}
+        error_counts = Counter()
+        warning_counts = Counter()
         
-        for record_result in batch_results['validation_details']:
-            for error in record_result['errors']:
-                key = f"{error['field']}:{error['rule']}"
-                error_counts[key] = error_counts.get(key, 0) + 1
-            
-            for warning in record_result['warnings']:
-                key = f"{warning['field']}:{warning['rule']}"
-                warning_counts[key] = warning_counts.get(key, 0) + 1
+        for record_result in batch_results['failed']:
+            error_counts.update(f"{error['field']}:{error['rule']}" for error in record_result['errors'])
+            warning_counts.update(f"{warning['field']}:{warning['rule']}" for warning in record_result['warnings'])
         
         return {
             'error_rate': batch_results['invalid_records'] / batch_results['total_records'] * 100,
             'warning_rate': batch_results['warnings'] / batch_results['total_records'] * 100,
-            'most_common_errors': sorted(error_counts.items(), key=lambda x: x[1], reverse=True)[:5],
-            'most_common_warnings': sorted(warning_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        }
\ No newline at end of file
+            'most_common_errors': error_counts.most_common(5),
+            'most_common_warnings': warning_counts.most_common(5)
+        }
+
+
+def _to_float(value: Any) -> float:
+    """float() that maps values it rejects to NaN."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+# Validator of a validate_batch_parallel pool worker, built once per process
+_worker_validator = None
+
+
+def _init_validation_worker(config: Dict[str, Any]):
+    global _worker_validator
+    _worker_validator = DataValidator(config)
+
+
+def _validate_shard(shard: Tuple[int, str, List[Dict[str, Any]]]) -> Tuple[int, List[Dict[str, Any]]]:
+    offset, source, records = shard
+    return offset, _worker_validator.validate_records(source, records)
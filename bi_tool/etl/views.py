@@ -0,0 +1,53 @@
+"""
+ETL API Views
+"""
+
+import logging
+from datetime import date
+
+from django.utils import timezone
+from rest_framework import permissions, status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from .models import DataSource
+from .utils.monitoring import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+metrics = MetricsCollector()
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def ingest_metrics(request):
+    """
+    Estimated distinct ingest_ids per source for a day.
+    
+    Query parameters:
+        date: Day as YYYY-MM-DD (default: today)
+        source: Source name, repeatable (default: all configured data sources)
+    """
+    try:
+        day = date.fromisoformat(request.GET['date']) if 'date' in request.GET else timezone.now().date()
+    except ValueError:
+        return Response({'error': 'date must be YYYY-MM-DD'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    sources = request.GET.getlist('source') or list(DataSource.objects.values_list('name', flat=True))
+    
+    try:
+        unique_ingest_ids = {
+            source: metrics.count_unique(f"ingest:{source}", day) for source in sources
+        }
+    except Exception as e:
+        logger.error(f"Error reading ingest metrics: {e}")
+        unique_ingest_ids = None
+    
+    # count_unique returns None when Redis is not configured
+    if unique_ingest_ids is None or None in unique_ingest_ids.values():
+        return Response({'error': 'Metrics store unavailable'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+    
+    return Response({
+        'date': day.isoformat(),
+        'unique_ingest_ids': unique_ingest_ids,
+    })